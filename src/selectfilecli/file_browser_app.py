@@ -80,6 +80,20 @@
 # - Implemented proper LRU cache eviction using OrderedDict for venv and dir size caches
 # - Fixed race condition in navigation by tracking navigation state and passing target path to worker
 # - Fixed emoji alignment in indicators column by calculating proper visual width for emojis
+# - Made CustomDirectoryTree.format_file_size a staticmethod
+# - Cached lstat results per path in an LRU cache, cleared for a directory's entries when it is reloaded
+# - Listed directories with os.scandir, seeding the lstat cache and expandability from the DirEntry objects
+# - Picked the format_file_size unit from the size's bit length instead of a division loop
+# - Formatted dates from time.localtime fields instead of a datetime and two strftime calls
+# - Told directories from the lstat mode in render_label and get_file_color_and_suffix, stat'ing only symlinks
+# - Remembered paths whose lstat failed in render_label, until their directory is reloaded
+# - Cached the formatted file sizes used by render_label and the column widths in an LRU cache
+# - Cached the write access checks of render_label and the column widths next to the lstat cache
+# - Formatted the date of a row only when the date column is shown, and told files from the cached lstat in the column widths
+# - Returned the scandir stats with the loaded listing and sorted it by the scanned directory flag
+# - Shared one LRU get-or-compute helper between the lstat, write access and file size caches, and cleared the path caches on reload
+# - Named the regular file check of the column widths instead of nesting a conditional expression in the if
+# - Cached failed lstat calls as None entries of the bounded lstat cache instead of an unbounded set
 #
 
 """Textual-based file browser application."""
@@ -88,16 +102,18 @@ import os
 import platform
 import stat
 import sys
+import time
 import locale
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Any, Tuple, Dict, Iterable
+from typing import Optional, Any, Callable, Tuple, Dict, Iterable
 from enum import Enum
 from collections import OrderedDict
 from .file_info import FileInfo
 
 from textual import on, work
 from textual.app import App, ComposeResult
+from textual.await_complete import AwaitComplete
 from textual.reactive import reactive
 from textual.widgets import Header, Footer, Label, RadioButton, RadioSet, Button, LoadingIndicator
 from textual.widgets._directory_tree import DirectoryTree, DirEntry
@@ -105,7 +121,7 @@ from textual.widgets._tree import TreeNode, Tree
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
 from textual.screen import ModalScreen
-from textual.worker import get_current_worker, WorkerCancelled, WorkerFailed, Worker
+from textual.worker import get_current_worker, WorkerCancelled, WorkerFailed
 from textual.message import Message
 from rich.text import Text
 
@@ -117,6 +133,8 @@ ASCENDING_ORDER_INDEX = 0
 WINDOWS_DRIVE_LETTERS = "CDEFGHIJKLMNOPQRSTUVWXYZAB"  # C first, then others
 MAX_VENV_CACHE_SIZE = 1000  # Maximum entries in venv cache
 MAX_DIR_CACHE_SIZE = 500  # Maximum entries in directory size cache
+MAX_STAT_CACHE_SIZE = 2000  # Maximum entries in lstat cache
+MAX_SIZE_STR_CACHE_SIZE = 256  # Maximum entries in formatted file size cache
 MAX_DIRECTORY_DEPTH = 100  # Maximum recursion depth for directory traversal
 # UI Element Heights
 NAVIGATION_BAR_HEIGHT = 3
@@ -322,6 +340,14 @@ class SortDialog(ModalScreen[tuple[SortMode, SortOrder]]):
             self.dismiss(None)
 
 
+class ScannedDirectory(list[Path]):
+    """Directory listing that carries the lstat result and directory flag scandir read for each entry."""
+
+    def __init__(self, paths: Iterable[Path], stats: Dict[str, Tuple[os.stat_result, bool]]) -> None:
+        super().__init__(paths)
+        self.stats = stats
+
+
 class CustomDirectoryTree(DirectoryTree):
     """Extended DirectoryTree with sorting capabilities and file info display."""
 
@@ -335,42 +361,39 @@ class CustomDirectoryTree(DirectoryTree):
         self._original_path = path
         self._venv_cache: OrderedDict[str, bool] = OrderedDict()  # LRU cache for venv detection
         self._dir_size_cache: OrderedDict[str, int] = OrderedDict()  # LRU cache for directory sizes
+        self._stat_cache: OrderedDict[str, Optional[os.stat_result]] = OrderedDict()  # LRU cache for lstat results, None if it failed
+        self._writable_cache: OrderedDict[str, bool] = OrderedDict()  # LRU cache for os.access(W_OK) results
+        self._size_str_cache: OrderedDict[int, str] = OrderedDict()  # LRU cache for formatted file sizes
         self._column_widths: Dict[str, int] = {}  # Cache for calculated column widths
 
-    def format_file_size(self, size: int) -> str:
+    @staticmethod
+    def format_file_size(size: int) -> str:
         """Format file size in human-readable format with locale support."""
         if size < 0:
             return "Invalid"
-        if size == 0:
-            return "0 B"
-
-        size_float = float(size)
-        for unit in FILE_SIZE_UNITS[:-1]:  # All units except PB
-            if size_float < FILE_SIZE_UNIT:
-                if unit == "B":
-                    # For bytes, use integer with thousand separators
-                    try:
-                        return f"{locale.format_string('%d', int(size_float), grouping=True)} B"
-                    except Exception:
-                        return f"{int(size_float):,} B"
-                else:
-                    # For other units, use 2 decimal places
-                    try:
-                        return f"{locale.format_string('%.2f', size_float, grouping=True)} {unit}"
-                    except Exception:
-                        return f"{size_float:,.2f} {unit}"
-            size_float /= FILE_SIZE_UNIT
-        # If we get here, it's in PB
+        if size < FILE_SIZE_UNIT:
+            # For bytes, use integer with thousand separators
+            try:
+                return f"{locale.format_string('%d', size, grouping=True)} B"
+            except Exception:
+                return f"{size:,} B"
+
+        # Each unit is 2**10 times the previous one, so the bit length picks the unit directly
+        unit_index = min((size.bit_length() - 1) // 10, len(FILE_SIZE_UNITS) - 1)
+        size_float = size / (1 << (unit_index * 10))
+        unit = FILE_SIZE_UNITS[unit_index]
+        # For other units, use 2 decimal places
         try:
-            return f"{locale.format_string('%.2f', size_float, grouping=True)} {FILE_SIZE_UNITS[-1]}"
+            return f"{locale.format_string('%.2f', size_float, grouping=True)} {unit}"
         except Exception:
-            return f"{size_float:,.2f} {FILE_SIZE_UNITS[-1]}"
+            return f"{size_float:,.2f} {unit}"
 
     def format_date(self, timestamp: float) -> str:
         """Format timestamp as readable date with emoji in 24h format."""
-        dt = datetime.fromtimestamp(timestamp)
+        # Read the fields of a struct_time, without building a datetime or calling strftime
+        tm = time.localtime(timestamp)
         # Fixed format: 📆YYYY-MM-DD 🕚HH:MM:SS
-        return f"📆{dt.strftime('%Y-%m-%d')} 🕚{dt.strftime('%H:%M:%S')}"
+        return f"📆{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d} 🕚{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}"
 
     def get_file_color_and_suffix(self, path: Path, file_stat: os.stat_result) -> Tuple[str, str]:
         """Get color style and suffix for file based on type (similar to ls -F --color).
@@ -387,8 +410,8 @@ class CustomDirectoryTree(DirectoryTree):
             except (OSError, IOError):
                 return "bright_red", "@"
 
-        # Directory
-        if path.is_dir():
+        # Directory (not a symlink here, so the lstat result tells)
+        if stat.S_ISDIR(file_stat.st_mode):
             return "bright_blue", "/"
 
         # Check if executable
@@ -433,7 +456,7 @@ class CustomDirectoryTree(DirectoryTree):
             return f'"{escaped}"'
         return filename
 
-    def _manage_cache(self, cache: OrderedDict[str, Any], key: str, max_size: int) -> None:
+    def _manage_cache(self, cache: OrderedDict[Any, Any], key: Any, max_size: int) -> None:
         """Manage LRU cache eviction using OrderedDict.
 
         Args:
@@ -448,6 +471,89 @@ class CustomDirectoryTree(DirectoryTree):
             # Cache is full and key is new - evict least recently used (first item)
             cache.popitem(last=False)  # Remove first (oldest) item
 
+    def _cached(self, cache: OrderedDict[Any, Any], key: Any, max_size: int, compute: Callable[[Any], Any]) -> Any:
+        """Get a value from an LRU cache, computing and storing it on a miss.
+
+        Args:
+            cache: The OrderedDict cache to look in
+            key: The key to look up and to compute the value from
+            max_size: Maximum cache size
+            compute: Function computing the value of a missing key
+
+        Returns:
+            The cached or newly computed value
+
+        Raises:
+            Exception: Whatever compute raises (failures are not cached)
+        """
+        if key in cache:
+            # Update LRU order for cache hit
+            self._manage_cache(cache, key, max_size)
+            return cache[key]
+
+        value = compute(key)
+        self._manage_cache(cache, key, max_size)
+        cache[key] = value
+        return value
+
+    @staticmethod
+    def _lstat_or_none(path_str: str) -> Optional[os.stat_result]:
+        """Get the lstat result of a path, or None if it cannot be stat'ed."""
+        try:
+            return os.lstat(path_str)
+        except OSError:
+            return None
+
+    def _get_lstat(self, path: Path) -> Optional[os.stat_result]:
+        """Get the lstat result of a path, cached until its directory is reloaded.
+
+        Failures are cached too, so redraws don't repeat a failing syscall.
+
+        Args:
+            path: Path to get stats for
+
+        Returns:
+            The lstat result of the path, or None if it cannot be stat'ed
+        """
+        file_stat: Optional[os.stat_result] = self._cached(self._stat_cache, str(path), MAX_STAT_CACHE_SIZE, self._lstat_or_none)
+        return file_stat
+
+    def _is_writable(self, path: Path) -> bool:
+        """Check whether the current user may write a path, cached until its directory is reloaded.
+
+        Args:
+            path: Path to check
+
+        Returns:
+            True if os.access grants write access
+        """
+        writable: bool = self._cached(self._writable_cache, str(path), MAX_STAT_CACHE_SIZE, lambda path_str: os.access(path_str, os.W_OK))
+        return writable
+
+    def _get_size_str(self, size: int) -> str:
+        """Get the formatted file size, cached since locale formatting is slow.
+
+        Args:
+            size: File size in bytes
+
+        Returns:
+            The size as formatted by format_file_size
+        """
+        size_str: str = self._cached(self._size_str_cache, size, MAX_SIZE_STR_CACHE_SIZE, self.format_file_size)
+        return size_str
+
+    def reload(self) -> AwaitComplete:
+        """Reload the tree contents, forgetting the stats and write access cached for every path.
+
+        Also runs when the root path changes, since watch_path reloads the tree.
+
+        Returns:
+            An optionally awaitable that ensures the tree has finished reloading.
+        """
+        self._stat_cache.clear()
+        self._writable_cache.clear()
+        return super().reload()
+
     def has_venv(self, dir_path: Path) -> bool:
         """Check if directory contains a Python virtual environment."""
         # Check cache first
@@ -745,7 +851,9 @@ class CustomDirectoryTree(DirectoryTree):
             try:
                 # Get filename length
                 filename = self.format_filename_with_quotes(path.name)
-                file_stat = path.lstat()
+                file_stat = self._get_lstat(path)
+                if file_stat is None:
+                    continue
                 color_style, suffix = self.get_file_color_and_suffix(path, file_stat)
                 full_filename = filename + suffix
 
@@ -760,9 +868,10 @@ class CustomDirectoryTree(DirectoryTree):
                         visual_width += 1
                 max_filename_width = max(max_filename_width, visual_width)
 
-                # Update size width
-                if path.is_file():
-                    size_str = self.format_file_size(file_stat.st_size)
+                # Update size width (only symlinks need a stat of their target to tell files)
+                is_regular = path.is_file() if stat.S_ISLNK(file_stat.st_mode) else stat.S_ISREG(file_stat.st_mode)
+                if is_regular:
+                    size_str = self._get_size_str(file_stat.st_size)
                     max_size_width = max(max_size_width, len(size_str))
             except (OSError, AttributeError):
                 continue
@@ -785,7 +894,7 @@ class CustomDirectoryTree(DirectoryTree):
                 indicators = ""
                 if path.is_dir() and self.has_venv(path):
                     indicators += "✨"
-                if not os.access(path, os.W_OK):
+                if not self._is_writable(path):
                     indicators += "🔒"
 
                 # Calculate visual width of indicators
@@ -846,8 +955,11 @@ class CustomDirectoryTree(DirectoryTree):
 
         return lines[:max_lines]
 
-    def _format_with_columns(self, filename: str, size: str, date: str, indicators: str, filename_style: str, size_style: str, date_style: str, indicators_style: str, node: Any = None) -> Text:
-        """Format entry with proper column alignment."""
+    def _format_with_columns(self, filename: str, size: str, mtime: float, indicators: str, filename_style: str, size_style: str, date_style: str, indicators_style: str, node: Any = None) -> Text:
+        """Format entry with proper column alignment.
+
+        The modification time is only formatted when the date column fits the terminal.
+        """
         # Get current terminal width from app
         try:
             app = self.app
@@ -908,7 +1020,7 @@ class CustomDirectoryTree(DirectoryTree):
         # Add date column only if space permits
         if show_date:
             formatted.append(" " * COLUMN_SPACING)
-            formatted.append(date.ljust(date_width), style=date_style)
+            formatted.append(self.format_date(mtime).ljust(date_width), style=date_style)
 
         # Add indicators if present
         if indicators:
@@ -954,13 +1066,17 @@ class CustomDirectoryTree(DirectoryTree):
                 loading_text = Text("<...loading...>", style="bright_yellow blink")
                 return loading_text
 
-            # Get file stats
+            # Get file stats, from one lstat: only symlinks need a second stat to tell directories
+            file_stat = self._get_lstat(file_path)  # Use lstat to not follow symlinks
+            if file_stat is None:
+                # Return simple label if we can't access
+                return Text(file_path.name, style="dim red")
             try:
-                file_stat = file_path.lstat()  # Use lstat to not follow symlinks
-                is_dir = file_path.is_dir()
+                is_dir = file_path.is_dir() if stat.S_ISLNK(file_stat.st_mode) else stat.S_ISDIR(file_stat.st_mode)
             except (OSError, PermissionError):
-                # Return simple label if we can't access
-                return Text(file_path.name if file_path else "Unknown", style="dim red")
+                # Remember the failure like a failed lstat, so redraws don't repeat it
+                self._stat_cache[str(file_path)] = None
+                return Text(file_path.name, style="dim red")
 
             # Get color and suffix based on file type
             color_style, suffix = self.get_file_color_and_suffix(file_path, file_stat)
@@ -972,19 +1088,17 @@ class CustomDirectoryTree(DirectoryTree):
             if is_dir:
                 size_str = "<DIR>"
             else:
-                size_str = self.format_file_size(file_stat.st_size)
-
-            date_str = self.format_date(file_stat.st_mtime)
+                size_str = self._get_size_str(file_stat.st_size)
 
             # Add special indicators
             indicators = ""
             if is_dir and self.has_venv(file_path):
                 indicators += "✨"
-            if not os.access(file_path, os.W_OK):
+            if not self._is_writable(file_path):
                 indicators += "🔒"
 
             # Format with columns - pass the node for context
-            formatted_text = self._format_with_columns(filename=filename + suffix, size=size_str, date=date_str, indicators=indicators, filename_style=color_style, size_style="dim cyan", date_style="dim yellow", indicators_style="bright_yellow" if "✨" in indicators else "bright_red", node=node)
+            formatted_text = self._format_with_columns(filename=filename + suffix, size=size_str, mtime=file_stat.st_mtime, indicators=indicators, filename_style=color_style, size_style="dim cyan", date_style="dim yellow", indicators_style="bright_yellow" if "✨" in indicators else "bright_red", node=node)
 
             return formatted_text
 
@@ -1009,7 +1123,11 @@ class CustomDirectoryTree(DirectoryTree):
                 path = self._get_path_from_node_data(child.data)
                 if not path or str(path) == "<...loading...>":
                     continue
-                stat = path.lstat()  # Use lstat for consistency
+                stat = self._get_lstat(path)  # Use lstat for consistency
+                if stat is None:
+                    # If stat fails, use name as fallback
+                    children_info.append((child, str(child.label).lower(), False))
+                    continue
 
                 # Extract sort key based on mode using strategy pattern
                 sort_key_extractors = {
@@ -1154,6 +1272,7 @@ class CustomDirectoryTree(DirectoryTree):
         node.remove_children()
 
         # Convert to list to check if empty
+        scanned_stats = content.stats if isinstance(content, ScannedDirectory) else {}
         content_list = list(content)
 
         if not content_list:
@@ -1162,10 +1281,22 @@ class CustomDirectoryTree(DirectoryTree):
         else:
             # Normal population for non-empty directories
             for path in content_list:
+                # The directory was just listed again, so forget failed lookups and write access of its
+                # entries and replace their cached stats with the ones read by its scandir, or drop them if none
+                path_str = str(path)
+                self._writable_cache.pop(path_str, None)
+                scanned = scanned_stats.get(path_str)
+                if scanned is None:
+                    self._stat_cache.pop(path_str, None)
+                    is_dir = self._safe_is_dir(path)
+                else:
+                    file_stat, is_dir = scanned
+                    self._manage_cache(self._stat_cache, path_str, MAX_STAT_CACHE_SIZE)
+                    self._stat_cache[path_str] = file_stat
                 node.add(
                     path.name,
                     data=DirEntry(path),
-                    allow_expand=self._safe_is_dir(path),
+                    allow_expand=is_dir,
                 )
 
         # Calculate column widths after populating
@@ -1183,6 +1314,45 @@ class CustomDirectoryTree(DirectoryTree):
         if not node.is_expanded:
             node.expand()
 
+    @work(thread=True, exit_on_error=False)
+    def _load_directory(self, node: TreeNode[DirEntry]) -> list[Path]:
+        """Load the directory contents for a given node with a single scandir pass.
+
+        The lstat result and directory flag of each entry travel with the returned
+        listing, so neither the sort nor _populate_node stats the entries again.
+
+        Args:
+            node: The node to load the directory contents for.
+
+        Returns:
+            The entries within the directory, directories first.
+        """
+        assert node.data is not None
+        location = node.data.path.expanduser().resolve()
+        worker = get_current_worker()
+        paths: list[Path] = []
+        stats: Dict[str, Tuple[os.stat_result, bool]] = {}
+        try:
+            with os.scandir(location) as entries:
+                for entry in entries:
+                    if worker.is_cancelled:
+                        break
+                    path = Path(entry.path)
+                    try:
+                        stats[str(path)] = (entry.stat(follow_symlinks=False), entry.is_dir())
+                    except OSError:
+                        pass
+                    paths.append(path)
+        except PermissionError:
+            pass
+
+        def directories_first(path: Path) -> Tuple[bool, str]:
+            scanned = stats.get(str(path))
+            is_dir = scanned[1] if scanned is not None else self._safe_is_dir(path)
+            return (not is_dir, path.name.lower())
+
+        return ScannedDirectory(sorted(self.filter_paths(paths), key=directories_first), stats)
+
     @work(exclusive=True)
     async def _loader(self) -> None:
         """Background loading queue processor.
@@ -12,18 +12,46 @@
 # - Configured retry counts based on environment
 # - Added fixtures for common test operations
 # - Added type annotations to all functions and fixtures
+# - Added the session-scoped unicode_edge_corpus fixture shared by the snapshot tests
+# - Added unicode_edge_dir to skip snapshot tests whose tree the filesystem mostly rejected
+# - Cached the Unicode edge case trees in the pytest cache, keyed by a manifest hash
+# - Created the corpus subdirectories with os.mkdir on string paths
+# - Added the session-scoped temp_directory and temp_directory_with_varied_files fixtures
+# - Wrote the varied files tree from a module-level bytes tuple with raw os calls
+# - Let PYTEST_ALLOW_PARALLEL=1 opt out of the forced sequential execution
+# - Set the varied files timestamps with integer nanoseconds
+# - Wrote the browser tree from a module-level bytes tuple
+# - Set the varied files timestamps on the open descriptor where supported
+# - Wrote the temp_dir fixture files as bytes literals
+# - Added string forms of the app test trees as session fixtures
+# - Precomputed the varied files timestamp offsets at import
+# - Marked every test that uses snap_compare with the snapshot marker
+# - Sized the large varied files with ftruncate instead of repeated content
+# - Restored the session event loop after each snapshot test
+# - Based the varied files timestamps on a fixed epoch instead of the clock
+# - Took the event loop restored after snapshot tests from a session-scoped async fixture
+# - Removed the unicode corpus staging tree when its build fails or is interrupted
 #
 
 """Pytest configuration for selectfilecli tests.
 Prevents multiple processes from spawning during tests.
 """
 
+import asyncio
+import hashlib
 import os
+import re
+import shutil
 import sys
+import tempfile
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from pathlib import Path
-from typing import Dict, Any
+from typing import Callable, Dict, Any, Iterable, Iterator, Tuple
 
 import pytest
+import pytest_asyncio
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -33,7 +61,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 
 def pytest_configure(config):
-    """Configure pytest to run sequentially and with resource limits."""
+    """Configure pytest to run sequentially and with resource limits.
+
+    Set PYTEST_ALLOW_PARALLEL=1 to keep the pytest-xdist options given on the
+    command line, e.g. ``-n 4 --maxprocesses=4 --dist=loadgroup``.
+    """
+    if os.environ.get("PYTEST_ALLOW_PARALLEL") == "1":
+        return
+
     # Force sequential execution
     os.environ["PYTEST_MAX_WORKERS"] = "1"
     os.environ["PYTEST_DISABLE_XDIST"] = "1"
@@ -49,6 +84,34 @@ def pytest_configure(config):
         config.option.dist = "no"
 
 
+def pytest_collection_modifyitems(config: pytest.Config, items: list) -> None:
+    """Mark every SVG snapshot test, so ``-m "not snapshot"`` leaves them out of quick runs."""
+    for item in items:
+        if "snap_compare" in getattr(item, "fixturenames", ()):
+            item.add_marker(pytest.mark.snapshot)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def session_event_loop() -> asyncio.AbstractEventLoop:
+    """Return the session event loop that pytest-asyncio runs the async tests on."""
+    return asyncio.get_running_loop()
+
+
+@pytest.fixture(autouse=True)
+def keep_session_event_loop(request: pytest.FixtureRequest) -> Iterator[None]:
+    """Make the session event loop current again after a snapshot test.
+
+    snap_compare runs the app with asyncio.run(), which leaves the thread without a
+    current event loop when it exits, and the async tests that follow share that loop.
+    """
+    if "snap_compare" not in request.fixturenames:
+        yield
+        return
+    loop = request.getfixturevalue("session_event_loop")
+    yield
+    asyncio.set_event_loop(loop)
+
+
 # Command line preprocessing removed - handled by pytest.ini instead
 
 
@@ -103,9 +166,511 @@ def test_env() -> Dict[str, Any]:
 def temp_dir(tmp_path: Path) -> Path:
     """Create a temporary directory with test files."""
     # Create test structure
-    (tmp_path / "file1.txt").write_text("Test file 1")
-    (tmp_path / "file2.py").write_text("print('test')")
+    (tmp_path / "file1.txt").write_bytes(b"Test file 1")
+    (tmp_path / "file2.py").write_bytes(b"print('test')")
     subdir = tmp_path / "subdir"
     subdir.mkdir()
-    (subdir / "file3.md").write_text("# Test")
+    (subdir / "file3.md").write_bytes(b"# Test")
     return tmp_path
+
+
+def _fast_write(path: str, data: bytes) -> None:
+    """Write data to path with raw os-level calls, skipping the buffered text layer."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+# Browser trees shared by the app tests. Tests must treat them as read-only.
+
+
+# Browser tree layout, with payloads encoded once at import
+BROWSER_ROOT_DIRS = (os.path.join("documents", "work"), "pictures", "music")
+BROWSER_ROOT_FILES = (
+    ("readme.txt", b"Test readme"),
+    (os.path.join("documents", "report.pdf"), b"Test report"),
+    (os.path.join("documents", "work", "project.doc"), b"Test project"),
+    (os.path.join("pictures", "photo.jpg"), b"Test photo"),
+    (".hidden_file", b"Hidden file"),
+)
+
+
+@pytest.fixture(scope="session")
+def temp_directory(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a temporary directory structure for testing."""
+    test_dir = tmp_path_factory.mktemp("browser_root", numbered=False)
+    test_dir_str = str(test_dir)
+
+    # Create subdirectories
+    for dir_name in BROWSER_ROOT_DIRS:
+        os.makedirs(os.path.join(test_dir_str, dir_name))
+
+    # Create test files
+    for filename, payload in BROWSER_ROOT_FILES:
+        _fast_write(os.path.join(test_dir_str, filename), payload)
+
+    return test_dir
+
+
+# Files with different extensions, sizes and contents, encoded once at import
+# (name, content, size) of each file: files larger than their content are extended
+# with ftruncate, so their size is set without building the bytes in memory
+VARIED_FILES = (
+    ("document.pdf", b"Small PDF", 9),
+    ("image.jpg", b"", 16_000),
+    ("script.py", b"#!/usr/bin/env python3\nprint('hello')", 37),
+    ("data.csv", b"id,name,value\n1,test,100", 24),
+    ("archive.zip", b"", 1_400),
+    ("readme.txt", b"Simple text file", 16),
+    ("video.mp4", b"", 9_000),
+    ("config.json", b'{"key": "value"}', 16),
+)
+VARIED_FILES_DIRS = ("src", "docs", "tests")
+# Fixed base for the varied files timestamps (2023-11-14 22:13:20 UTC), in nanoseconds.
+# No test reads the absolute times, so the tree does not depend on the clock.
+VARIED_FILES_BASE_TIME_NS = 1_700_000_000 * 1_000_000_000
+# (access, modification) times in nanoseconds for each of VARIED_FILES: modification
+# times are spaced by 10 seconds, access times by 5 seconds for a different order
+VARIED_FILES_TIMES_NS = tuple((VARIED_FILES_BASE_TIME_NS + i * 5_000_000_000, VARIED_FILES_BASE_TIME_NS + i * 10_000_000_000) for i in range(len(VARIED_FILES)))
+
+
+@pytest.fixture(scope="session")
+def temp_directory_with_varied_files(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a temporary directory with files having different attributes."""
+    test_dir = tmp_path_factory.mktemp("varied_files_root", numbered=False)
+    test_dir_str = str(test_dir)
+
+    # Create files with controlled timestamps, in integer nanoseconds. Where the platform
+    # allows it the timestamps are set on the open descriptor, saving a second path lookup.
+    utime = os.utime
+    utime_by_fd = utime in os.supports_fd
+    for (filename, payload, size), (access_ns, mod_ns) in zip(VARIED_FILES, VARIED_FILES_TIMES_NS):
+        file_path = os.path.join(test_dir_str, filename)
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            if payload:
+                os.write(fd, payload)
+            if size > len(payload):
+                os.ftruncate(fd, size)
+            if utime_by_fd:
+                utime(fd, ns=(access_ns, mod_ns))
+        finally:
+            os.close(fd)
+        if not utime_by_fd:
+            utime(file_path, ns=(access_ns, mod_ns))
+
+    # Create subdirectories
+    for dir_name in VARIED_FILES_DIRS:
+        os.mkdir(os.path.join(test_dir_str, dir_name))
+
+    return test_dir
+
+
+@pytest.fixture(scope="session")
+def temp_directory_str(temp_directory: Path) -> str:
+    """Return temp_directory as a string, converted once per session."""
+    return str(temp_directory)
+
+
+@pytest.fixture(scope="session")
+def temp_directory_with_varied_files_str(temp_directory_with_varied_files: Path) -> str:
+    """Return temp_directory_with_varied_files as a string, converted once per session."""
+    return str(temp_directory_with_varied_files)
+
+
+# Unicode edge case corpus shared by the control character and edge case snapshot tests
+
+
+def _nfc(name: str) -> str:
+    """Return name in NFC, skipping the normalizer for pure-ASCII names."""
+    # ASCII text is always in NFC already
+    return name if name.isascii() else unicodedata.normalize("NFC", name)
+
+
+# Files with control characters as (category, filename) pairs
+CONTROL_CHAR_FILES = (
+    # ASCII control characters
+    ("null_char", "file\x00with\x00null.txt"),
+    ("bell_char", "\x07bell\x07sound.txt"),
+    ("backspace", "file\x08back\x08space.txt"),
+    ("tab", "file\twith\ttabs.txt"),
+    ("newline", "file\nwith\nnewlines.txt"),
+    ("vertical_tab", "file\x0bvertical\x0btab.txt"),
+    ("form_feed", "file\x0cform\x0cfeed.txt"),
+    ("carriage_return", "file\rwith\rCR.txt"),
+    ("escape", "file\x1bescape\x1bseq.txt"),
+    ("delete", "file\x7fdelete\x7fchar.txt"),
+    # Unicode control characters
+    ("zero_width_space", "file\u200bzero\u200bwidth.txt"),
+    ("zero_width_joiner", "file\u200dzero\u200djoiner.txt"),
+    ("zero_width_non_joiner", "file\u200czero\u200cnon-joiner.txt"),
+    ("left_to_right_mark", "file\u200eLTR\u200emark.txt"),
+    ("right_to_left_mark", "file\u200fRTL\u200fmark.txt"),
+    ("left_to_right_embedding", "file\u202aLRE\u202aembed.txt"),
+    ("right_to_left_embedding", "file\u202bRLE\u202bembed.txt"),
+    ("pop_directional", "file\u202cPOP\u202cdir.txt"),
+    ("left_to_right_override", "file\u202dLRO\u202doverride.txt"),
+    ("right_to_left_override", "file\u202eRLO\u202eoverride.txt"),
+    ("word_joiner", "file\u2060word\u2060joiner.txt"),
+    ("function_application", "file\u2061func\u2061app.txt"),
+    ("invisible_times", "file\u2062invisible\u2062times.txt"),
+    ("invisible_separator", "file\u2063invisible\u2063sep.txt"),
+    ("invisible_plus", "file\u2064invisible\u2064plus.txt"),
+    ("byte_order_mark", "\ufeffBOM\ufefffile.txt"),
+    # Combining characters
+    ("combining_acute", "file\u0301combining\u0301acute.txt"),
+    ("combining_grave", "file\u0300combining\u0300grave.txt"),
+    ("combining_circumflex", "file\u0302combining\u0302circ.txt"),
+    ("combining_tilde", "file\u0303combining\u0303tilde.txt"),
+    ("combining_macron", "file\u0304combining\u0304macron.txt"),
+    ("combining_breve", "file\u0306combining\u0306breve.txt"),
+    ("combining_dot_above", "file\u0307combining\u0307dot.txt"),
+    ("combining_diaeresis", "file\u0308combining\u0308diaer.txt"),
+    ("combining_ring", "file\u030acombining\u030aring.txt"),
+    ("combining_double_acute", "file\u030bcombining\u030bdbl.txt"),
+    ("combining_caron", "file\u030ccombining\u030ccaron.txt"),
+    # Mixed problematic content
+    ("mixed_controls", "mix\x00\n\r\t\x1b\x7f\u200b\u200c\u200d.txt"),
+    ("all_spaces", "\x20\xa0\u2000\u2001\u2002\u2003\u2004\u2005.txt"),
+    ("direction_mess", "text\u202eגםבעברית\u202cEnglish\u202bوعربي\u202c.txt"),
+    ("zalgo_text", "Ż̸̧̢̛͔̹̟̦̭̪̈́̊̾̈́͊̚ͅḀ̷̢̭̰̯̮̹̒̈́̓̊͐̕͝L̶̨̧̰̭̹̮̩̔̈́̊̒̈́̚͝G̸̢̧̛̭̰̮̹̒̈́̓̊͐̕Ơ̷̢͔̹̟̦̭̪̇̈́̊̾̈́͊̚.txt"),
+    # Emoji with modifiers
+    ("emoji_skin_tone", "👨🏻‍💻👩🏽‍🔬👨🏿‍🎨.txt"),
+    ("emoji_zwj_sequence", "👨‍👩‍👧‍👦family👩‍👩‍👧‍👧.txt"),
+    ("flag_sequences", "🇺🇸🇬🇧🇯🇵🇰🇷🇨🇳flags.txt"),
+    # Extreme cases
+    ("only_controls", "\x00\x01\x02\x03\x04\x05\x06\x07.txt"),
+    ("only_invisible", "\u200b\u200c\u200d\u2060\u2061\u2062.txt"),
+    ("empty_looking", "\u3000\u2800\ufeff.txt"),  # Ideographic space, braille blank, BOM
+)
+
+# Files at filesystem limits
+BOUNDARY_FILES = (
+    # Maximum filename lengths (255 chars on most systems)
+    "a" * 250 + ".txt",
+    "文" * 80 + ".txt",  # Unicode chars take more bytes
+    "🎉" * 60 + ".txt",  # Emoji take even more bytes
+    # Single character names
+    "a",
+    "文",
+    "🎉",
+    ".",
+    "_",
+    "-",
+    "~",
+    # All dots
+    ".",
+    "..",
+    "...",
+    "....",
+    # All spaces (will need quotes)
+    "   ",
+    "\t\t\t",
+    "\xa0\xa0\xa0",  # Non-breaking spaces
+    # Numbers only
+    "0",
+    "123456789",
+    "999999999999999999999999999999",
+    # Special patterns
+    "CON",  # Reserved on Windows
+    "PRN",  # Reserved on Windows
+    "AUX",  # Reserved on Windows
+    "NUL",  # Reserved on Windows
+    "COM1",  # Reserved on Windows
+    "LPT1",  # Reserved on Windows
+)
+# Boundary names are stored in NFC, the canonical form for filenames. The control
+# character files stay as written since their combining marks are deliberately decomposed.
+BOUNDARY_FILES = tuple(_nfc(name) for name in BOUNDARY_FILES)
+
+# Only the directory entries matter to the snapshots, so every file gets the same content
+DUMMY_PAYLOAD = b"x"
+
+# Placeholders for control characters that cannot be stored in filenames
+CONTROL_CHAR_TRANSLATION = str.maketrans(
+    {
+        "\x00": "[NULL]",
+        "\x07": "[BELL]",
+        "\x08": "[BS]",
+        "\n": "[LF]",
+        "\r": "[CR]",
+        "\x1b": "[ESC]",
+        "\x7f": "[DEL]",
+        "\x0b": "[VT]",
+        "\x0c": "[FF]",
+    }
+)
+
+# Device names Windows refuses to create as regular files
+SKIP_ON_PLATFORM = frozenset({"CON", "PRN", "AUX", "NUL", "COM1", "LPT1"}) if sys.platform == "win32" else frozenset()
+
+# On-disk names, computed once at import so the fixtures only join and write
+CONTROL_CHAR_DISK_NAMES = tuple(f"{category}_{filename.translate(CONTROL_CHAR_TRANSLATION)}" for category, filename in CONTROL_CHAR_FILES)
+BOUNDARY_DISK_NAMES = tuple(filename for filename in BOUNDARY_FILES if filename not in (".", "..") and filename not in SKIP_ON_PLATFORM)
+SIBLING_FILES = tuple(f"sibling_{i:03d}.txt" for i in range(200))
+
+# Subdirectories named in various languages
+EDGE_CASE_DIRS = (
+    "普通文件夹",  # Chinese: Normal Folder
+    "한국어_폴더",  # Korean: Korean Folder
+    "Русская_папка",  # Russian: Russian Folder
+    "עברית_תיקייה",  # Hebrew: Hebrew Folder (will display LTR)
+    "مجلد_عربي",  # Arabic: Arabic Folder (will display LTR)
+    "हिंदी_फ़ोल्डर",  # Hindi: Hindi Folder
+    "संस्कृत_फोल्डर",  # Sanskrit: Sanskrit Folder
+    "Ελληνικός_φάκελος",  # Greek: Greek Folder
+    "日本語フォルダ",  # Japanese: Japanese Folder
+    "emoji_folder_🎉🎨🎭🎪🎬",  # Emoji folder
+)
+
+# Files with edge case names
+EDGE_CASE_FILES = (
+    # Very long filenames
+    "this_is_a_very_long_filename_that_should_exceed_normal_screen_width_and_trigger_horizontal_scrolling_behavior_in_the_file_browser_interface_1234567890.txt",
+    "another_extremely_long_filename_with_lots_of_underscores_and_numbers_123456789012345678901234567890123456789012345678901234567890.document",
+    # Files with various Unicode characters
+    "文件名_中文字符.txt",  # Chinese characters
+    "파일명_한글.txt",  # Korean characters
+    "файл_кириллица.txt",  # Cyrillic characters
+    "קובץ_עברית.txt",  # Hebrew (will display LTR)
+    "ملف_عربي.txt",  # Arabic (will display LTR)
+    "फ़ाइल_हिंदी.txt",  # Hindi
+    "ファイル_日本語.txt",  # Japanese
+    "αρχείο_ελληνικά.txt",  # Greek
+    # Files with special characters
+    "file with spaces.txt",
+    "file\twith\ttabs.txt",
+    "file|with|pipes.txt",
+    "file*with*asterisks.txt",
+    "file?with?questions.txt",
+    "file<with>brackets.txt",
+    'file"with"quotes.txt',
+    "file'with'apostrophes.txt",
+    "file[with]square[brackets].txt",
+    "file{with}curly{braces}.txt",
+    "file(with)parentheses.txt",
+    "file&with&ampersands.txt",
+    "file@with@at@signs.txt",
+    "file#with#hashes.txt",
+    "file$with$dollars.txt",
+    "file%with%percents.txt",
+    "file^with^carets.txt",
+    "file=with=equals.txt",
+    "file+with+plus+signs.txt",
+    "file~with~tildes.txt",
+    "file`with`backticks.txt",
+    # Files with control characters (will be escaped)
+    "file\nwith\nnewlines.txt",
+    "file\rwith\rcarriage\rreturns.txt",
+    "file\x00with\x00null\x00chars.txt",
+    "file\x1bwith\x1bescape\x1bchars.txt",
+    "\x07bell\x07character\x07file.txt",
+    # Leading/trailing special characters
+    "   leading_spaces.txt",
+    "trailing_spaces.txt   ",
+    "\t\tleading_tabs.txt",
+    "trailing_tabs.txt\t\t",
+    "...leading_dots.txt",
+    "trailing_dots.txt...",
+    # Mixed emoji and text
+    "🎉celebration🎊file🎈.txt",
+    "💻code👨‍💻file🖥️.py",
+    "🌍world🌎map🌏.jpg",
+    "🔥hot🌶️spicy🌡️.dat",
+    # Zero-width and invisible characters
+    "file\u200bwith\u200bzero\u200bwidth\u200bspaces.txt",
+    "file\u2060with\u2060word\u2060joiners.txt",
+    "file\ufeffwith\ufeffBOM.txt",
+)
+
+# Language and symbol names are stored in NFC, the canonical form for filenames
+EDGE_CASE_DIRS = tuple(_nfc(name) for name in EDGE_CASE_DIRS)
+EDGE_CASE_FILES = tuple(_nfc(name) for name in EDGE_CASE_FILES)
+
+# Files that might break layout
+PROBLEM_FILES = (
+    "\x1b[31mANSI_color_codes\x1b[0m.txt",
+    "file\u202ewith\u202eRTL\u202eoverride.txt",
+    "file\u200ewith\u200eLTR\u200emark.txt",
+    "combining_é_è_ê_ë_marks.txt",
+    "emoji👨‍👩‍👧‍👦family👨‍👨‍👦‍👦emoji.txt",
+    "​​​​​only_zero_width_spaces​​​​​.txt",
+    "mixed\u0301\u0302\u0303\u0304combining.txt",
+)
+
+# Placeholders for control characters that cannot be stored in filenames
+EDGE_CASE_REPLACEMENTS = {"\x00": "_null_", "\r": "_cr_", "\n": "_lf_", "\x1b": "_esc_", "\x07": "_bel_"}
+EDGE_CASE_PATTERN = re.compile("[\x00\r\n\x1b\x07]")
+
+# On-disk names, computed once at import so the fixtures only join and write
+EDGE_CASE_DISK_NAMES = tuple(EDGE_CASE_PATTERN.sub(lambda match: EDGE_CASE_REPLACEMENTS[match.group()], filename) for filename in EDGE_CASE_FILES)
+MANY_FILES = tuple(f"file_{i:03d}_测试文件_{i}.txt" for i in range(100))
+
+
+# Number of threads used to create fixture files in bulk
+FIXTURE_WRITE_WORKERS = 8
+
+
+def _write_files(files: Iterable[Tuple[str, bytes]]) -> None:
+    """Write (path, data) pairs concurrently, skipping names the filesystem rejects."""
+
+    def write_one(item: Tuple[str, bytes]) -> None:
+        try:
+            _fast_write(*item)
+        except OSError:
+            # Skip files the filesystem rejects
+            pass
+
+    with ThreadPoolExecutor(max_workers=FIXTURE_WRITE_WORKERS) as executor:
+        list(executor.map(write_one, files))
+
+
+def _build_control_corpus(root: str) -> None:
+    """Create files with control character filenames."""
+    # Create files with sanitized names for filesystem
+    _write_files((os.path.join(root, filename), DUMMY_PAYLOAD) for filename in CONTROL_CHAR_DISK_NAMES)
+
+
+def _build_boundary_corpus(root: str) -> None:
+    """Create files and directories for boundary condition testing."""
+    # Create files at filesystem limits, skipping the special directory entries
+    _write_files((os.path.join(root, filename), DUMMY_PAYLOAD) for filename in BOUNDARY_DISK_NAMES)
+
+    # Create directory structure to test tree limits
+    # Very deep nesting
+    with suppress(OSError):
+        os.makedirs(os.path.join(root, *(f"level_{i}" for i in range(20))), exist_ok=True)
+
+    # Very wide (many siblings)
+    wide_dir_str = os.path.join(root, "many_siblings")
+    os.mkdir(wide_dir_str)
+    _write_files((os.path.join(wide_dir_str, filename), DUMMY_PAYLOAD) for filename in SIBLING_FILES)
+
+
+def _build_edge_corpus(root: str) -> None:
+    """Create edge case filenames and language-named subdirectories."""
+    # Create subdirectories with various languages
+    for dir_name in EDGE_CASE_DIRS:
+        os.mkdir(os.path.join(root, dir_name))
+
+    # Create all edge case files
+    # Some filenames might be invalid on certain filesystems, so
+    # replace invalid characters for the actual file creation
+    _write_files((os.path.join(root, filename), DUMMY_PAYLOAD) for filename in EDGE_CASE_DISK_NAMES)
+
+    # Create a Python virtual environment for testing venv detection
+    venv_dir_str = os.path.join(root, "test_venv_✨")
+    os.mkdir(venv_dir_str)
+    _fast_write(os.path.join(venv_dir_str, "pyvenv.cfg"), b"test venv config")
+
+
+def _build_stress_corpus(root: str) -> None:
+    """Create a tree designed to stress test the layout."""
+    # Create nested directories to test tree depth
+    os.makedirs(os.path.join(root, *(f"深い階層_{i}_уровень_{i}_level_{i}" for i in range(10))))
+
+    # Create many files to test vertical scrolling
+    _write_files((os.path.join(root, filename), DUMMY_PAYLOAD) for filename in MANY_FILES)
+
+    # Create files that might break layout
+    _write_files((os.path.join(root, filename), DUMMY_PAYLOAD) for filename in PROBLEM_FILES)
+
+
+# Corpus name -> builder, one subdirectory of the session corpus each
+UNICODE_EDGE_CORPUS_BUILDERS: Dict[str, Callable[[str], None]] = {
+    "control": _build_control_corpus,
+    "boundary": _build_boundary_corpus,
+    "edge": _build_edge_corpus,
+    "stress": _build_stress_corpus,
+}
+
+# Top-level entries each tree must keep. A filesystem that rejected more than half of the
+# intended names leaves a tree whose snapshots no longer show what they claim to test.
+UNICODE_EDGE_CORPUS_MIN_ENTRIES: Dict[str, int] = {
+    "control": len(CONTROL_CHAR_DISK_NAMES) // 2,
+    "boundary": (len(BOUNDARY_DISK_NAMES) + 2) // 2,
+    "edge": (len(EDGE_CASE_DIRS) + len(EDGE_CASE_DISK_NAMES) + 1) // 2,
+    "stress": (1 + len(MANY_FILES) + len(PROBLEM_FILES)) // 2,
+}
+
+
+# Hash of everything the builders write. Bump the version when a builder changes its layout.
+UNICODE_EDGE_CORPUS_VERSION = 1
+UNICODE_EDGE_CORPUS_MANIFEST = hashlib.sha256(
+    repr(
+        (
+            UNICODE_EDGE_CORPUS_VERSION,
+            CONTROL_CHAR_DISK_NAMES,
+            BOUNDARY_DISK_NAMES,
+            SIBLING_FILES,
+            EDGE_CASE_DIRS,
+            EDGE_CASE_DISK_NAMES,
+            MANY_FILES,
+            PROBLEM_FILES,
+            DUMMY_PAYLOAD,
+        )
+    ).encode()
+).hexdigest()[:16]
+
+
+def _build_unicode_edge_corpus(root: Path) -> None:
+    """Build every corpus tree as a subdirectory of root."""
+    root_str = str(root)
+    for name, build in UNICODE_EDGE_CORPUS_BUILDERS.items():
+        corpus_dir_str = os.path.join(root_str, name)
+        os.mkdir(corpus_dir_str)
+        build(corpus_dir_str)
+
+
+@pytest.fixture(scope="session")
+def unicode_edge_corpus(request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory) -> Dict[str, Path]:
+    """Build every Unicode edge case tree, keyed by corpus name.
+
+    The trees are kept in the pytest cache directory under the manifest hash, so later
+    runs reuse them until the filename lists change. Without the cache plugin they are
+    built in a session temporary directory instead.
+    """
+    cache = getattr(request.config, "cache", None)
+    if cache is None:
+        root = tmp_path_factory.mktemp("unicode_edge_corpus")
+        _build_unicode_edge_corpus(root)
+    else:
+        cache_dir = cache.mkdir("unicode_edge_corpus")
+        root = cache_dir / UNICODE_EDGE_CORPUS_MANIFEST
+        if not root.is_dir():
+            # Build next to the final location and rename into place, so an interrupted
+            # or concurrent build never leaves a partial tree under the manifest name
+            staging = Path(tempfile.mkdtemp(prefix=".building-", dir=cache_dir))
+            try:
+                _build_unicode_edge_corpus(staging)
+                staging.rename(root)
+            except OSError:
+                # Another process finished first, keep its tree
+                if not root.is_dir():
+                    raise
+            finally:
+                # Remove the staging tree unless it was renamed into place, also when the
+                # build fails or the run is interrupted
+                shutil.rmtree(staging, ignore_errors=True)
+        # Drop trees built from older manifests
+        for entry in cache_dir.iterdir():
+            if entry.name != UNICODE_EDGE_CORPUS_MANIFEST and not entry.name.startswith(".building-"):
+                shutil.rmtree(entry, ignore_errors=True)
+    return {name: root / name for name in UNICODE_EDGE_CORPUS_BUILDERS}
+
+
+@pytest.fixture(scope="session")
+def unicode_edge_dir(unicode_edge_corpus: Dict[str, Path]) -> Callable[[str], Path]:
+    """Return a lookup for corpus trees that skips trees the filesystem mostly rejected."""
+
+    def lookup(name: str) -> Path:
+        corpus_dir = unicode_edge_corpus[name]
+        created = len(os.listdir(corpus_dir))
+        expected_min = UNICODE_EDGE_CORPUS_MIN_ENTRIES[name]
+        if created < expected_min:
+            pytest.skip(f"filesystem rejected too many test names ({created}/{expected_min})")
+        return corpus_dir
+
+    return lookup
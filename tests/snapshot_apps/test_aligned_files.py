@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Snapshot app for testing file alignment in columns."""
 
+import os
 from pathlib import Path
 import tempfile
 import time
@@ -24,17 +25,14 @@ def create_test_structure() -> Path:
         ("config.ini", "[section]\nkey=value\n" * 20),  # Config file
     ]
 
-    # Create files with different timestamps
-    base_time = time.time()
+    # Create files with different timestamps, in integer nanoseconds
+    base_ns = time.time_ns()
     for i, (filename, content) in enumerate(files):
         file_path = test_dir / filename
         file_path.write_text(content)
         # Set different modification times
-        mod_time = base_time - (i * 3600)  # Each file 1 hour older
-        file_path.touch()
-        import os
-
-        os.utime(file_path, (mod_time, mod_time))
+        mod_ns = base_ns - i * 3_600_000_000_000  # Each file 1 hour older
+        os.utime(file_path, ns=(mod_ns, mod_ns))
 
     # Create some directories too
     (test_dir / "short_dir").mkdir()
@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
 """Snapshot app for testing error states."""
 
+from contextlib import suppress
 from pathlib import Path
 import tempfile
 import os
 from selectfilecli.file_browser_app import FileBrowserApp
 
+# Permission tricks below only work on POSIX systems
+_IS_POSIX = os.name != "nt"
+
 
 def create_test_structure() -> Path:
     """Create test structure with files that may cause errors."""
@@ -16,7 +20,7 @@ def create_test_structure() -> Path:
     (test_dir / "normal_file.txt").write_text("This is accessible")
 
     # Create a file with restricted permissions (Unix only)
-    if os.name != "nt":
+    if _IS_POSIX:
         restricted = test_dir / "restricted_file.txt"
         restricted.write_text("secret")
         restricted.chmod(0o000)  # No permissions
@@ -28,14 +32,13 @@ def create_test_structure() -> Path:
         no_read_dir.chmod(0o000)
 
     # Create broken symlink
-    broken_link = test_dir / "broken_symlink.txt"
-    broken_link.symlink_to(test_dir / "nonexistent_target.txt")
+    os.symlink(test_dir / "nonexistent_target.txt", test_dir / "broken_symlink.txt")
 
     # Create circular symlink
     circular1 = test_dir / "circular1"
     circular2 = test_dir / "circular2"
-    circular1.symlink_to(circular2)
-    circular2.symlink_to(circular1)
+    os.symlink(circular2, circular1)
+    os.symlink(circular1, circular2)
 
     return test_dir
 
@@ -47,9 +50,7 @@ if __name__ == "__main__":
         app.run()
     finally:
         # Cleanup: restore permissions for deletion
-        if os.name != "nt":
-            try:
+        if _IS_POSIX:
+            with suppress(OSError):
                 (test_dir / "restricted_file.txt").chmod(0o644)
                 (test_dir / "no_read_directory").chmod(0o755)
-            except Exception:
-                pass
@@ -9,37 +9,55 @@
 """Test app for snapshot testing."""
 
 from pathlib import Path
+import hashlib
+import shutil
 import tempfile
 
 from selectfilecli.file_browser_app import FileBrowserApp
 
+# Subdirectories and files of the test tree, relative to the test directory
+DIRECTORIES = ("documents", "documents/work", "pictures", "music")
+FILES = (
+    ("readme.txt", "Test readme"),
+    ("documents/report.pdf", "Test report"),
+    ("documents/work/project.doc", "Test project"),
+    ("pictures/photo.jpg", "Test photo"),
+)
+
+# Hash of the tree spec, stored next to the test directory so an unchanged tree is reused
+FIXTURE_VERSION = hashlib.sha256(repr((DIRECTORIES, FILES)).encode()).hexdigest()
+
 
 def create_test_directory():
     """Create a consistent test directory structure."""
-    # Use a fixed subdirectory name for consistency
-    test_dir = Path("/tmp/selectfilecli_test")
+    # Use a fixed subdirectory name in the system temp dir for consistency
+    test_dir = Path(tempfile.gettempdir()) / "selectfilecli_test"
+    # The marker lives outside test_dir so it never shows up in the browser
+    marker = test_dir.with_name(test_dir.name + ".fixture_version")
+
+    # Skip the rebuild if a previous run left the same tree behind
+    try:
+        if test_dir.is_dir() and marker.read_text() == FIXTURE_VERSION:
+            return test_dir
+    except OSError:
+        pass
 
     # Clean up if exists
     if test_dir.exists():
-        import shutil
-
         shutil.rmtree(test_dir)
 
     # Create directory structure
     test_dir.mkdir(parents=True)
 
     # Create subdirectories
-    (test_dir / "documents").mkdir()
-    (test_dir / "documents" / "work").mkdir()
-    (test_dir / "pictures").mkdir()
-    (test_dir / "music").mkdir()
+    for dirname in DIRECTORIES:
+        (test_dir / dirname).mkdir()
 
     # Create test files
-    (test_dir / "readme.txt").write_text("Test readme")
-    (test_dir / "documents" / "report.pdf").write_text("Test report")
-    (test_dir / "documents" / "work" / "project.doc").write_text("Test project")
-    (test_dir / "pictures" / "photo.jpg").write_text("Test photo")
+    for filename, content in FILES:
+        (test_dir / filename).write_text(content)
 
+    marker.write_text(FIXTURE_VERSION)
     return test_dir
 
 
@@ -9,53 +9,79 @@
 """Test app for snapshot testing with sorting."""
 
 from pathlib import Path
+import hashlib
+import shutil
+import tempfile
 import time
 import os
 
 from selectfilecli.file_browser_app import FileBrowserApp
 
+# Files with specific attributes for sorting tests
+FILES = (
+    # filename, content, size (approx)
+    ("zebra.txt", "Last alphabetically", 20),
+    ("apple.py", "#!/usr/bin/env python3\nprint('First alphabetically')", 50),
+    ("big_file.dat", b"X" * 10000, 10000),
+    ("tiny.json", '{"a":1}', 7),
+    ("medium.xml", b"<root>" + b"data" * 100 + b"</root>", 500),
+    ("backup.zip", b"ZIP" * 300, 900),
+    ("notes.md", "# Notes\nSome content", 20),
+    ("data.csv", "id,value\n1,100\n2,200", 25),
+)
+DIRECTORIES = ("archive", "workspace", "output")
+
+# Timestamps are bucketed to the hour so the tree can be reused within the same hour
+MTIME_BUCKET = 3600
+
 
 def create_test_directory():
     """Create a consistent test directory structure for sorting tests."""
-    # Use a fixed subdirectory name for consistency
-    test_dir = Path("/tmp/selectfilecli_sort_test")
+    # Use a fixed subdirectory name in the system temp dir for consistency
+    test_dir = Path(tempfile.gettempdir()) / "selectfilecli_sort_test"
+    # The marker lives outside test_dir so it never shows up in the browser
+    marker = test_dir.with_name(test_dir.name + ".fixture_version")
+
+    base_time = int(time.time()) // MTIME_BUCKET * MTIME_BUCKET - 3600  # about 1 hour ago
+    fixture_version = hashlib.sha256(repr((FILES, DIRECTORIES, base_time)).encode()).hexdigest()
+
+    # Skip the rebuild if a previous run left the same tree behind
+    try:
+        if test_dir.is_dir() and marker.read_text() == fixture_version:
+            return test_dir
+    except OSError:
+        pass
 
     # Clean up if exists
     if test_dir.exists():
-        import shutil
-
         shutil.rmtree(test_dir)
 
     # Create directory structure
     test_dir.mkdir(parents=True)
 
-    # Create files with specific attributes for sorting tests
-    files = [
-        # filename, content, size (approx)
-        ("zebra.txt", "Last alphabetically", 20),
-        ("apple.py", "#!/usr/bin/env python3\nprint('First alphabetically')", 50),
-        ("big_file.dat", "X" * 10000, 10000),
-        ("tiny.json", '{"a":1}', 7),
-        ("medium.xml", "<root>" + "data" * 100 + "</root>", 500),
-        ("backup.zip", "ZIP" * 300, 900),
-        ("notes.md", "# Notes\nSome content", 20),
-        ("data.csv", "id,value\n1,100\n2,200", 25),
-    ]
-
-    # Create files with controlled timestamps
-    base_time = time.time() - 3600  # 1 hour ago
-    for i, (filename, content, _) in enumerate(files):
+    # Create files with controlled timestamps, setting the mtime on the still-open fd
+    utime_takes_fd = os.utime in os.supports_fd
+    for i, (filename, content, _) in enumerate(FILES):
         file_path = test_dir / filename
-        file_path.write_text(content)
+        # Large ASCII payloads are stored as bytes to skip the text encoder
+        data = content if isinstance(content, bytes) else content.encode()
         # Set different modification times
         mod_time = base_time + (i * 300)  # 5 minutes apart
-        os.utime(file_path, (mod_time, mod_time))
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+            if utime_takes_fd:
+                os.utime(fd, (mod_time, mod_time))
+        finally:
+            os.close(fd)
+        if not utime_takes_fd:
+            os.utime(file_path, (mod_time, mod_time))
 
     # Create subdirectories (these will appear first due to directory-first sorting)
-    (test_dir / "archive").mkdir()
-    (test_dir / "workspace").mkdir()
-    (test_dir / "output").mkdir()
+    for dirname in DIRECTORIES:
+        (test_dir / dirname).mkdir()
 
+    marker.write_text(fixture_version)
     return test_dir
 
 
@@ -9,116 +9,145 @@
 # HERE IS THE CHANGELOG FOR THIS VERSION OF THE FILE:
 # - Initial creation of requirements summary test runner
 # - Runs all requirement tests and produces a formatted report
+# - Buffered the summary table and wrote it to stdout in a single call
+# - Moved the requirements table to the module-level REQUIREMENTS constant
+# - Ran requirement and visual tests in a single in-process pytest session
+#   (the old subprocess runners remain available via --legacy-subprocess)
+# - Removed the --legacy-subprocess runners and kept pytest's own output out of the summary
 #
 
 """Run all requirement tests and produce a summary report."""
 
-import subprocess
+import contextlib
+import io
 import sys
 from pathlib import Path
 import re
-from typing import List, Tuple
-
-
-def run_requirements_tests() -> Tuple[List[str], List[str]]:
-    """Run requirement verification tests and collect results."""
-    cmd = [sys.executable, "-m", "pytest", "tests/test_requirements_verification.py", "-v", "--tb=no", "--no-header", "-q"]
-
-    result = subprocess.run(cmd, capture_output=True, text=True)
-
-    passed = []
-    failed = []
-
-    for line in result.stdout.split("\n"):
-        if "PASSED" in line and "test_requirement_" in line:
-            # Extract requirement number
-            match = re.search(r"test_requirement_(\d+)_", line)
-            if match:
-                req_num = match.group(1)
-                passed.append(f"Requirement {req_num}")
-        elif "FAILED" in line and "test_requirement_" in line:
-            match = re.search(r"test_requirement_(\d+)_", line)
-            if match:
-                req_num = match.group(1)
-                failed.append(f"Requirement {req_num}")
-
-    return passed, failed
-
-
-def run_visual_tests() -> bool:
-    """Check if visual snapshots exist and pass."""
-    cmd = [sys.executable, "-m", "pytest", "tests/test_visual_requirements.py", "-v", "--tb=no", "--no-header", "-q"]
-
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    return result.returncode == 0 or "passed" in result.stdout.lower()
+from typing import Any, List, Tuple
+
+import pytest
+
+REQUIREMENTS_TESTS = "tests/test_requirements_verification.py"
+VISUAL_TESTS = "tests/test_visual_requirements.py"
+
+# ANSI color codes for the status column
+GREEN = "\033[92m"
+RED = "\033[91m"
+YELLOW = "\033[93m"
+RESET = "\033[0m"
+
+# Requirement number, description and details shown in the summary table
+REQUIREMENTS: Tuple[Tuple[str, str, str], ...] = (
+    ("1", "Header not overlapping button bar", "Visual layout correctly separated"),
+    ("2", "Subtitle is displayed", "Shows navigation instructions based on selection mode"),
+    ("3", "Path display visible and yellow", "Current path shown in yellow at top"),
+    ("4", "Empty folders show <empty>", "Empty directories display placeholder"),
+    ("5", "Loading placeholders async", "Shows 'Loading...' during async operations"),
+    ("6", "Directory navigation loading", "Loading state during directory changes"),
+    ("7", "Sort dialog OK/Cancel + memory", "Dialog has buttons and remembers settings"),
+    ("8", "Directory entries aligned", "Files shown in aligned columns"),
+    ("9", "Cancel fast returns None", "Quick cancel with all None FileInfo"),
+    ("10", "Error message field works", "FileInfo.error_message populated on errors"),
+    ("11", "Real-time resizing works", "UI adapts to terminal size changes"),
+)
+
+
+class ResultCollector:
+    """Pytest plugin that sorts test outcomes into requirement and visual buckets."""
+
+    def __init__(self) -> None:
+        self.passed: List[str] = []
+        self.failed: List[str] = []
+        self.visual_passed: List[str] = []
+        self.visual_failed: List[str] = []
+
+    def pytest_runtest_logreport(self, report: Any) -> None:
+        """Record the outcome of each test once its call phase (or a failing setup) is reported."""
+        if report.when != "call" and not report.failed:
+            return
+
+        if report.nodeid.startswith(VISUAL_TESTS):
+            (self.visual_failed if report.failed else self.visual_passed).append(report.nodeid)
+            return
+
+        match = re.search(r"test_requirement_(\d+)_", report.nodeid)
+        if match:
+            req_key = f"Requirement {match.group(1)}"
+            if report.failed:
+                self.failed.append(req_key)
+            elif report.passed:
+                self.passed.append(req_key)
+
+
+def run_all_tests() -> Tuple[List[str], List[str], bool]:
+    """Run requirement and visual tests in one pytest session and collect results.
+
+    Pytest's own terminal output is discarded so only the summary table is shown.
+    """
+    collector = ResultCollector()
+    with contextlib.redirect_stdout(io.StringIO()):
+        pytest.main([REQUIREMENTS_TESTS, VISUAL_TESTS, "--tb=no", "--no-header", "-q"], plugins=[collector])
+    return collector.passed, collector.failed, not collector.visual_failed
 
 
 def print_summary_table() -> int:
     """Print a formatted summary table of all requirements."""
-    requirements = [
-        ("1", "Header not overlapping button bar", "Visual layout correctly separated"),
-        ("2", "Subtitle is displayed", "Shows navigation instructions based on selection mode"),
-        ("3", "Path display visible and yellow", "Current path shown in yellow at top"),
-        ("4", "Empty folders show <empty>", "Empty directories display placeholder"),
-        ("5", "Loading placeholders async", "Shows 'Loading...' during async operations"),
-        ("6", "Directory navigation loading", "Loading state during directory changes"),
-        ("7", "Sort dialog OK/Cancel + memory", "Dialog has buttons and remembers settings"),
-        ("8", "Directory entries aligned", "Files shown in aligned columns"),
-        ("9", "Cancel fast returns None", "Quick cancel with all None FileInfo"),
-        ("10", "Error message field works", "FileInfo.error_message populated on errors"),
-        ("11", "Real-time resizing works", "UI adapts to terminal size changes"),
-    ]
-
     # Run tests
-    passed, failed = run_requirements_tests()
-    visual_ok = run_visual_tests()
+    passed, failed, visual_ok = run_all_tests()
+
+    # Build the whole report in memory and write it out in one go
+    buf = io.StringIO()
 
     # Print header
-    print("\n" + "=" * 80)
-    print("📋 REQUIREMENTS VERIFICATION SUMMARY")
-    print("=" * 80)
+    print("\n" + "=" * 80, file=buf)
+    print("📋 REQUIREMENTS VERIFICATION SUMMARY", file=buf)
+    print("=" * 80, file=buf)
 
     # Table header
-    print(f"{'Req':<4} {'Description':<35} {'Status':<10} {'Details':<25}")
-    print("-" * 80)
+    print(f"{'Req':<4} {'Description':<35} {'Status':<10} {'Details':<25}", file=buf)
+    print("-" * 80, file=buf)
 
     # Print each requirement
-    for req_num, desc, details in requirements:
+    for req_num, desc, details in REQUIREMENTS:
         req_key = f"Requirement {req_num}"
         if req_key in passed:
             status = "✅ PASS"
-            color = "\033[92m"  # Green
+            color = GREEN
         elif req_key in failed:
             status = "❌ FAIL"
-            color = "\033[91m"  # Red
+            color = RED
         else:
             status = "⚠️  SKIP"
-            color = "\033[93m"  # Yellow
+            color = YELLOW
 
-        print(f"{color}{req_num:<4} {desc:<35} {status:<10}\033[0m {details:<25}")
+        print(f"{color}{req_num:<4} {desc:<35} {status:<10}{RESET} {details:<25}", file=buf)
 
-    print("-" * 80)
+    print("-" * 80, file=buf)
 
     # Summary
-    total = len(requirements)
+    total = len(REQUIREMENTS)
     passed_count = len(passed)
     failed_count = len(failed)
     skipped_count = total - passed_count - failed_count
 
-    print(f"\n📊 Summary: {passed_count}/{total} passed, {failed_count} failed, {skipped_count} skipped")
+    print(f"\n📊 Summary: {passed_count}/{total} passed, {failed_count} failed, {skipped_count} skipped", file=buf)
 
     if visual_ok:
-        print("🎨 Visual snapshot tests: ✅ All visual tests passing")
+        print("🎨 Visual snapshot tests: ✅ All visual tests passing", file=buf)
     else:
-        print("🎨 Visual snapshot tests: ⚠️  Some visual tests need attention")
+        print("🎨 Visual snapshot tests: ⚠️  Some visual tests need attention", file=buf)
 
     # Overall result
     if failed_count == 0:
-        print("\n✅ All requirements verified successfully!")
-        return 0
+        print("\n✅ All requirements verified successfully!", file=buf)
+        exit_code = 0
     else:
-        print(f"\n❌ {failed_count} requirements need attention")
-        return 1
+        print(f"\n❌ {failed_count} requirements need attention", file=buf)
+        exit_code = 1
+
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
+    return exit_code
 
 
 if __name__ == "__main__":
@@ -8,6 +8,11 @@
 # - Added tests for FileInfo return types
 # - Added tests for backward compatibility
 # - Added tests for signal handling
+# - Hoisted the FileBrowserApp patch boilerplate into the mock_browser fixture
+# - Parametrized test_all_selection_combinations instead of looping over cases
+# - Added make_file_info fixture so tests only spell out the FileInfo fields they check
+# - Switched test_custom_start_path from tempfile.TemporaryDirectory to tmp_path
+# - Read SIGINT handlers with signal.getsignal instead of swapping them in and out
 #
 
 """
@@ -21,240 +26,220 @@ This module tests all aspects of the select_file function including:
 - Backward compatibility
 """
 
+import functools
 import os
 import pytest
 import warnings
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock
 from pathlib import Path
-import tempfile
+from typing import Any, Callable, Dict, Optional, Tuple
 import signal
 
 from selectfilecli import select_file, FileInfo
 
 
+@pytest.fixture
+def mock_browser(monkeypatch: pytest.MonkeyPatch) -> Tuple[Mock, Mock]:
+    """Replace FileBrowserApp with a mock class returning a mock app instance."""
+    mock_app = Mock()
+    mock_app.run.return_value = None
+    MockApp = Mock(return_value=mock_app)
+    monkeypatch.setattr("selectfilecli.file_browser_app.FileBrowserApp", MockApp)
+    return MockApp, mock_app
+
+
+@pytest.fixture(scope="session")
+def make_file_info() -> Callable[..., FileInfo]:
+    """Return a FileInfo factory with the fields most tests leave at their defaults pre-bound."""
+    return functools.partial(FileInfo, last_modified_datetime=None, creation_datetime=None, folder_has_venv=False, is_symlink=False, symlink_broken=False, error_message=None)
+
+
 class TestSelectFileAPIWithFileInfo:
     """Test the main select_file API function with correct FileInfo structure."""
 
-    def test_default_parameters(self) -> None:
+    def test_default_parameters(self, mock_browser: Tuple[Mock, Mock]) -> None:
         """Test select_file with default parameters."""
-        with patch("selectfilecli.file_browser_app.FileBrowserApp") as MockApp:
-            mock_app = Mock()
-            mock_app.run.return_value = None
-            MockApp.return_value = mock_app
+        MockApp, _ = mock_browser
 
-            result = select_file()
+        result = select_file()
 
-            assert result is None
-            MockApp.assert_called_once_with(start_path=os.getcwd(), select_files=True, select_dirs=False)
+        assert result is None
+        MockApp.assert_called_once_with(start_path=os.getcwd(), select_files=True, select_dirs=False)
 
-    def test_custom_start_path(self) -> None:
+    def test_custom_start_path(self, tmp_path: Path, mock_browser: Tuple[Mock, Mock]) -> None:
         """Test select_file with custom start path."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch("selectfilecli.file_browser_app.FileBrowserApp") as MockApp:
-                mock_app = Mock()
-                mock_app.run.return_value = None
-                MockApp.return_value = mock_app
+        MockApp, _ = mock_browser
+        tmpdir = str(tmp_path)
 
-                result = select_file(tmpdir)
+        result = select_file(tmpdir)
 
-                assert result is None
-                MockApp.assert_called_once_with(start_path=tmpdir, select_files=True, select_dirs=False)
+        assert result is None
+        MockApp.assert_called_once_with(start_path=tmpdir, select_files=True, select_dirs=False)
 
-    def test_file_selection_returns_string(self) -> None:
+    def test_file_selection_returns_string(self, mock_browser: Tuple[Mock, Mock], make_file_info: Callable[..., FileInfo]) -> None:
         """Test that file selection returns string for backward compatibility."""
-        with patch("selectfilecli.file_browser_app.FileBrowserApp") as MockApp:
-            mock_app = Mock()
-            mock_file_info = FileInfo(file_path=Path("/test/file.txt"), folder_path=None, last_modified_datetime=None, creation_datetime=None, size_in_bytes=1234, readonly=False, folder_has_venv=False, is_symlink=False, symlink_broken=False, error_message=None)
-            mock_app.run.return_value = mock_file_info
-            MockApp.return_value = mock_app
-
-            with warnings.catch_warnings(record=True) as w:
-                warnings.simplefilter("always")
-                result = select_file(select_files=True, select_dirs=False, return_info=False)
-
-                assert result == "/test/file.txt"
-                assert len(w) == 1
-                assert issubclass(w[0].category, DeprecationWarning)
-                assert "Returning string paths is deprecated" in str(w[0].message)
-
-    def test_dir_selection_returns_fileinfo(self) -> None:
+        _, mock_app = mock_browser
+        mock_file_info = make_file_info(file_path=Path("/test/file.txt"), folder_path=None, size_in_bytes=1234, readonly=False)
+        mock_app.run.return_value = mock_file_info
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            result = select_file(select_files=True, select_dirs=False, return_info=False)
+
+            assert result == "/test/file.txt"
+            assert len(w) == 1
+            assert issubclass(w[0].category, DeprecationWarning)
+            assert "Returning string paths is deprecated" in str(w[0].message)
+
+    def test_dir_selection_returns_fileinfo(self, mock_browser: Tuple[Mock, Mock], make_file_info: Callable[..., FileInfo]) -> None:
         """Test that directory selection returns FileInfo by default."""
-        with patch("selectfilecli.file_browser_app.FileBrowserApp") as MockApp:
-            mock_app = Mock()
-            mock_file_info = FileInfo(file_path=None, folder_path=Path("/test/dir"), last_modified_datetime=None, creation_datetime=None, size_in_bytes=0, readonly=False, folder_has_venv=False, is_symlink=False, symlink_broken=False, error_message=None)
-            mock_app.run.return_value = mock_file_info
-            MockApp.return_value = mock_app
+        _, mock_app = mock_browser
+        mock_file_info = make_file_info(file_path=None, folder_path=Path("/test/dir"), size_in_bytes=0, readonly=False)
+        mock_app.run.return_value = mock_file_info
 
-            result = select_file(select_files=True, select_dirs=True)
+        result = select_file(select_files=True, select_dirs=True)
 
-            assert isinstance(result, FileInfo)
-            assert result.path_str == "/test/dir"
-            assert result.folder_path == Path("/test/dir")
+        assert isinstance(result, FileInfo)
+        assert result.path_str == "/test/dir"
+        assert result.folder_path == Path("/test/dir")
 
-    def test_explicit_return_info_true(self) -> None:
+    def test_explicit_return_info_true(self, mock_browser: Tuple[Mock, Mock], make_file_info: Callable[..., FileInfo]) -> None:
         """Test explicit return_info=True returns FileInfo."""
-        with patch("selectfilecli.file_browser_app.FileBrowserApp") as MockApp:
-            mock_app = Mock()
-            mock_file_info = FileInfo(file_path=Path("/test/file.txt"), folder_path=None, last_modified_datetime=None, creation_datetime=None, size_in_bytes=1234, readonly=False, folder_has_venv=False, is_symlink=False, symlink_broken=False, error_message=None)
-            mock_app.run.return_value = mock_file_info
-            MockApp.return_value = mock_app
+        _, mock_app = mock_browser
+        mock_file_info = make_file_info(file_path=Path("/test/file.txt"), folder_path=None, size_in_bytes=1234, readonly=False)
+        mock_app.run.return_value = mock_file_info
 
-            result = select_file(select_files=True, select_dirs=False, return_info=True)
+        result = select_file(select_files=True, select_dirs=False, return_info=True)
 
-            assert isinstance(result, FileInfo)
-            assert result.path_str == "/test/file.txt"
+        assert isinstance(result, FileInfo)
+        assert result.path_str == "/test/file.txt"
 
-    def test_cancellation_returns_none(self) -> None:
+    def test_cancellation_returns_none(self, mock_browser: Tuple[Mock, Mock]) -> None:
         """Test that cancellation (all None FileInfo) returns None."""
-        with patch("selectfilecli.file_browser_app.FileBrowserApp") as MockApp:
-            mock_app = Mock()
-            # Create a FileInfo with all None values (cancellation)
-            mock_file_info = FileInfo(file_path=None, folder_path=None, last_modified_datetime=None, creation_datetime=None, size_in_bytes=None, readonly=None, folder_has_venv=None, is_symlink=None, symlink_broken=None, error_message=None)
-            mock_app.run.return_value = mock_file_info
-            MockApp.return_value = mock_app
+        _, mock_app = mock_browser
+        # Create a FileInfo with all None values (cancellation)
+        mock_file_info = FileInfo(file_path=None, folder_path=None, last_modified_datetime=None, creation_datetime=None, size_in_bytes=None, readonly=None, folder_has_venv=None, is_symlink=None, symlink_broken=None, error_message=None)
+        mock_app.run.return_value = mock_file_info
 
-            result = select_file()
+        result = select_file()
 
-            assert result is None
+        assert result is None
 
-    def test_signal_handler_restoration(self) -> None:
+    def test_signal_handler_restoration(self, mock_browser: Tuple[Mock, Mock]) -> None:
         """Test that signal handlers are properly restored."""
-        original_handler = signal.signal(signal.SIGINT, signal.SIG_DFL)
+        original_handler = signal.getsignal(signal.SIGINT)
 
         try:
-            with patch("selectfilecli.file_browser_app.FileBrowserApp") as MockApp:
-                mock_app = Mock()
-                mock_app.run.return_value = None
-                MockApp.return_value = mock_app
-
-                # Run select_file
-                select_file()
+            # Run select_file
+            select_file()
 
-                # Check that handler is restored (may be modified by app)
-                current_handler = signal.signal(signal.SIGINT, signal.SIG_DFL)
-                # Handler should be either original or SIG_DFL
-                assert current_handler in (original_handler, signal.SIG_DFL)
+            # Check that handler is restored (may be modified by app)
+            current_handler = signal.getsignal(signal.SIGINT)
+            # Handler should be either original or SIG_DFL
+            assert current_handler in (original_handler, signal.SIG_DFL)
         finally:
             # Restore original handler
             signal.signal(signal.SIGINT, original_handler)
 
-    def test_signal_handler_on_exception(self) -> None:
+    def test_signal_handler_on_exception(self, mock_browser: Tuple[Mock, Mock]) -> None:
         """Test that signal handlers are restored even on exception."""
-        original_handler = signal.signal(signal.SIGINT, signal.SIG_DFL)
+        _, mock_app = mock_browser
+        mock_app.run.side_effect = RuntimeError("Test error")
+        original_handler = signal.getsignal(signal.SIGINT)
 
         try:
-            with patch("selectfilecli.file_browser_app.FileBrowserApp") as MockApp:
-                mock_app = Mock()
-                mock_app.run.side_effect = RuntimeError("Test error")
-                MockApp.return_value = mock_app
-
-                # Run select_file expecting exception
-                with pytest.raises(RuntimeError):
-                    select_file()
-
-                # Check that handler is still restored
-                current_handler = signal.signal(signal.SIGINT, signal.SIG_DFL)
-                # Handler should be either original or SIG_DFL
-                assert current_handler in (original_handler, signal.SIG_DFL)
+            # Run select_file expecting exception
+            with pytest.raises(RuntimeError):
+                select_file()
+
+            # Check that handler is still restored
+            current_handler = signal.getsignal(signal.SIGINT)
+            # Handler should be either original or SIG_DFL
+            assert current_handler in (original_handler, signal.SIG_DFL)
         finally:
             # Restore original handler
             signal.signal(signal.SIGINT, original_handler)
 
-    def test_symlink_handling(self) -> None:
+    def test_symlink_handling(self, mock_browser: Tuple[Mock, Mock], make_file_info: Callable[..., FileInfo]) -> None:
         """Test handling of symbolic links."""
-        with patch("selectfilecli.file_browser_app.FileBrowserApp") as MockApp:
-            mock_app = Mock()
-            mock_file_info = FileInfo(file_path=Path("/test/link"), folder_path=None, last_modified_datetime=None, creation_datetime=None, size_in_bytes=1234, readonly=False, folder_has_venv=False, is_symlink=True, symlink_broken=False, error_message=None)
-            mock_app.run.return_value = mock_file_info
-            MockApp.return_value = mock_app
+        _, mock_app = mock_browser
+        mock_file_info = make_file_info(file_path=Path("/test/link"), folder_path=None, size_in_bytes=1234, readonly=False, is_symlink=True)
+        mock_app.run.return_value = mock_file_info
 
-            result = select_file(return_info=True)
+        result = select_file(return_info=True)
 
-            assert isinstance(result, FileInfo)
-            assert result.is_symlink is True
-            assert result.symlink_broken is False
+        assert isinstance(result, FileInfo)
+        assert result.is_symlink is True
+        assert result.symlink_broken is False
 
-    def test_error_message_handling(self) -> None:
+    def test_error_message_handling(self, mock_browser: Tuple[Mock, Mock], make_file_info: Callable[..., FileInfo]) -> None:
         """Test handling of files with error messages."""
-        with patch("selectfilecli.file_browser_app.FileBrowserApp") as MockApp:
-            mock_app = Mock()
-            mock_file_info = FileInfo(file_path=Path("/test/file.txt"), folder_path=None, last_modified_datetime=None, creation_datetime=None, size_in_bytes=None, readonly=True, folder_has_venv=None, is_symlink=False, symlink_broken=False, error_message="Permission denied")
-            mock_app.run.return_value = mock_file_info
-            MockApp.return_value = mock_app
+        _, mock_app = mock_browser
+        mock_file_info = make_file_info(file_path=Path("/test/file.txt"), folder_path=None, size_in_bytes=None, readonly=True, folder_has_venv=None, error_message="Permission denied")
+        mock_app.run.return_value = mock_file_info
 
-            result = select_file(return_info=True)
+        result = select_file(return_info=True)
 
-            assert isinstance(result, FileInfo)
-            assert result.error_message == "Permission denied"
+        assert isinstance(result, FileInfo)
+        assert result.error_message == "Permission denied"
 
-    def test_all_selection_combinations(self) -> None:
-        """Test all combinations of select_files and select_dirs."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "select_files,select_dirs,return_info",
+        [
             (True, False, False),  # Files only, no return_info
             (True, False, True),  # Files only, with return_info
             (False, True, None),  # Dirs only, auto return_info
             (True, True, None),  # Both, auto return_info
             (True, True, False),  # Both, no return_info
             (True, True, True),  # Both, with return_info
-        ]
-
-        for select_files, select_dirs, return_info in test_cases:
-            with patch("selectfilecli.file_browser_app.FileBrowserApp") as MockApp:
-                mock_app = Mock()
-                mock_file_info = FileInfo(
-                    file_path=Path("/test/item") if select_files else None,
-                    folder_path=Path("/test/item") if select_dirs and not select_files else None,
-                    last_modified_datetime=None,
-                    creation_datetime=None,
-                    size_in_bytes=1234,
-                    readonly=False,
-                    folder_has_venv=False,
-                    is_symlink=False,
-                    symlink_broken=False,
-                    error_message=None,
-                )
-                mock_app.run.return_value = mock_file_info
-                MockApp.return_value = mock_app
-
-                kwargs = {"select_files": select_files, "select_dirs": select_dirs}
-                if return_info is not None:
-                    kwargs["return_info"] = return_info
-
-                with warnings.catch_warnings():
-                    warnings.simplefilter("ignore")
-                    result = select_file(**kwargs)
-
-                # Determine expected return type
-                if return_info is False and select_files and not select_dirs:
-                    assert isinstance(result, str)
-                elif return_info is None and select_dirs:
-                    assert isinstance(result, FileInfo)
-                elif return_info:
-                    assert isinstance(result, FileInfo)
-
-    def test_venv_folder_detection(self) -> None:
+        ],
+    )
+    def test_all_selection_combinations(self, mock_browser: Tuple[Mock, Mock], make_file_info: Callable[..., FileInfo], select_files: bool, select_dirs: bool, return_info: Optional[bool]) -> None:
+        """Test all combinations of select_files and select_dirs."""
+        _, mock_app = mock_browser
+        mock_file_info = make_file_info(
+            file_path=Path("/test/item") if select_files else None,
+            folder_path=Path("/test/item") if select_dirs and not select_files else None,
+            size_in_bytes=1234,
+            readonly=False,
+        )
+        mock_app.run.return_value = mock_file_info
+
+        kwargs: Dict[str, Any] = {"select_files": select_files, "select_dirs": select_dirs}
+        if return_info is not None:
+            kwargs["return_info"] = return_info
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            result = select_file(**kwargs)
+
+        # Determine expected return type
+        if return_info is False and select_files and not select_dirs:
+            assert isinstance(result, str)
+        elif return_info is None and select_dirs:
+            assert isinstance(result, FileInfo)
+        elif return_info:
+            assert isinstance(result, FileInfo)
+
+    def test_venv_folder_detection(self, mock_browser: Tuple[Mock, Mock], make_file_info: Callable[..., FileInfo]) -> None:
         """Test detection of virtual environment folders."""
-        with patch("selectfilecli.file_browser_app.FileBrowserApp") as MockApp:
-            mock_app = Mock()
-            mock_file_info = FileInfo(file_path=None, folder_path=Path("/test/venv"), last_modified_datetime=None, creation_datetime=None, size_in_bytes=0, readonly=False, folder_has_venv=True, is_symlink=False, symlink_broken=False, error_message=None)
-            mock_app.run.return_value = mock_file_info
-            MockApp.return_value = mock_app
+        _, mock_app = mock_browser
+        mock_file_info = make_file_info(file_path=None, folder_path=Path("/test/venv"), size_in_bytes=0, readonly=False, folder_has_venv=True)
+        mock_app.run.return_value = mock_file_info
 
-            result = select_file(select_dirs=True, return_info=True)
+        result = select_file(select_dirs=True, return_info=True)
 
-            assert isinstance(result, FileInfo)
-            assert result.folder_has_venv is True
+        assert isinstance(result, FileInfo)
+        assert result.folder_has_venv is True
 
-    def test_broken_symlink_detection(self) -> None:
+    def test_broken_symlink_detection(self, mock_browser: Tuple[Mock, Mock], make_file_info: Callable[..., FileInfo]) -> None:
         """Test detection of broken symbolic links."""
-        with patch("selectfilecli.file_browser_app.FileBrowserApp") as MockApp:
-            mock_app = Mock()
-            mock_file_info = FileInfo(file_path=Path("/test/broken_link"), folder_path=None, last_modified_datetime=None, creation_datetime=None, size_in_bytes=None, readonly=True, folder_has_venv=False, is_symlink=True, symlink_broken=True, error_message="Target not found")
-            mock_app.run.return_value = mock_file_info
-            MockApp.return_value = mock_app
+        _, mock_app = mock_browser
+        mock_file_info = make_file_info(file_path=Path("/test/broken_link"), folder_path=None, size_in_bytes=None, readonly=True, is_symlink=True, symlink_broken=True, error_message="Target not found")
+        mock_app.run.return_value = mock_file_info
 
-            result = select_file(return_info=True)
+        result = select_file(return_info=True)
 
-            assert isinstance(result, FileInfo)
-            assert result.is_symlink is True
-            assert result.symlink_broken is True
+        assert isinstance(result, FileInfo)
+        assert result.is_symlink is True
+        assert result.symlink_broken is True
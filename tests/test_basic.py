@@ -8,45 +8,37 @@
 
 # HERE IS THE CHANGELOG FOR THIS VERSION OF THE FILE:
 # - Added type annotations to all functions
+# - Merged the import and API existence checks into one parametrized test
+# - Removed per-module sys.path insertion (handled once in conftest.py)
+# - Moved selectfilecli imports to module scope
 #
 
 """Basic tests for selectfilecli."""
 
-import os
 import sys
-from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
+import selectfilecli
+from selectfilecli import select_file
 
-def test_import() -> None:
-    """Test that the module can be imported."""
-    from selectfilecli import select_file
 
-    assert select_file is not None
-
-
-def test_api_exists() -> None:
-    """Test that the select_file function exists."""
-    from selectfilecli import select_file
-
-    assert hasattr(select_file, "__call__"), "select_file is not callable"
+@pytest.mark.parametrize("name", ["select_file", "FileInfo"])
+def test_public_api(name: str) -> None:
+    """Test that each public name can be imported and is callable."""
+    assert name in selectfilecli.__all__
+    attr = getattr(selectfilecli, name)
+    assert callable(attr), f"{name} is not callable"
 
 
 def test_invalid_path() -> None:
     """Test that invalid path raises ValueError."""
-    from selectfilecli import select_file
-    import pytest
-
     with pytest.raises(ValueError):
         select_file("/path/that/does/not/exist")
 
 
 def main() -> None:
     """Run tests using pytest."""
-    import pytest
-
     # Run pytest on this file
     exit_code = pytest.main([__file__, "-v"])
     sys.exit(exit_code)
@@ -11,13 +11,26 @@
 # - Tests for invisible characters and zero-width spaces
 # - Tests for RTL/LTR override characters
 # - Tests for combining characters and complex emoji
+# - Made directory fixtures session-scoped and hoisted filename lists to module constants
+# - Created fixture files with raw os.open/os.write calls instead of Path.write_text
+# - Sanitized control characters with a single str.translate table
+# - Wrote bulk fixture files concurrently with a ThreadPoolExecutor
+# - Normalized boundary filenames to NFC once at import
+# - Added an ASCII fast path to the NFC normalization
+# - Wrote one shared dummy payload to every fixture file
+# - Built fixture paths with os.path.join on cached strings instead of Path objects
+# - Created the deep nesting chain with a single os.makedirs call
+# - Precomputed the sanitized on-disk filenames as module-level tuples
+# - Narrowed the fixture write error handling to OSError
+# - Skipped Windows reserved device names up front instead of failing on them
+# - Moved the filename corpus and fixture builders to the shared unicode_edge_corpus fixture in conftest.py
+# - Skipped the snapshots when the filesystem rejected most of the fixture names
 #
 
 """Visual snapshot tests for control and invisible characters."""
 
-import tempfile
 from pathlib import Path
-from typing import Any, Generator
+from typing import Any, Callable
 import pytest
 
 from selectfilecli.file_browser_app import FileBrowserApp
@@ -26,94 +39,10 @@ from selectfilecli.file_browser_app import FileBrowserApp
 class TestControlCharacterSnapshots:
     """Test handling of control and invisible characters."""
 
-    @pytest.fixture
-    def control_char_directory(self) -> Generator[Path, None, None]:
-        """Create directory with control character filenames."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir)
-
-            # Files with control characters
-            control_char_files = [
-                # ASCII control characters
-                ("null_char", "file\x00with\x00null.txt"),
-                ("bell_char", "\x07bell\x07sound.txt"),
-                ("backspace", "file\x08back\x08space.txt"),
-                ("tab", "file\twith\ttabs.txt"),
-                ("newline", "file\nwith\nnewlines.txt"),
-                ("vertical_tab", "file\x0bvertical\x0btab.txt"),
-                ("form_feed", "file\x0cform\x0cfeed.txt"),
-                ("carriage_return", "file\rwith\rCR.txt"),
-                ("escape", "file\x1bescape\x1bseq.txt"),
-                ("delete", "file\x7fdelete\x7fchar.txt"),
-                # Unicode control characters
-                ("zero_width_space", "file\u200bzero\u200bwidth.txt"),
-                ("zero_width_joiner", "file\u200dzero\u200djoiner.txt"),
-                ("zero_width_non_joiner", "file\u200czero\u200cnon-joiner.txt"),
-                ("left_to_right_mark", "file\u200eLTR\u200emark.txt"),
-                ("right_to_left_mark", "file\u200fRTL\u200fmark.txt"),
-                ("left_to_right_embedding", "file\u202aLRE\u202aembed.txt"),
-                ("right_to_left_embedding", "file\u202bRLE\u202bembed.txt"),
-                ("pop_directional", "file\u202cPOP\u202cdir.txt"),
-                ("left_to_right_override", "file\u202dLRO\u202doverride.txt"),
-                ("right_to_left_override", "file\u202eRLO\u202eoverride.txt"),
-                ("word_joiner", "file\u2060word\u2060joiner.txt"),
-                ("function_application", "file\u2061func\u2061app.txt"),
-                ("invisible_times", "file\u2062invisible\u2062times.txt"),
-                ("invisible_separator", "file\u2063invisible\u2063sep.txt"),
-                ("invisible_plus", "file\u2064invisible\u2064plus.txt"),
-                ("byte_order_mark", "\ufeffBOM\ufefffile.txt"),
-                # Combining characters
-                ("combining_acute", "file\u0301combining\u0301acute.txt"),
-                ("combining_grave", "file\u0300combining\u0300grave.txt"),
-                ("combining_circumflex", "file\u0302combining\u0302circ.txt"),
-                ("combining_tilde", "file\u0303combining\u0303tilde.txt"),
-                ("combining_macron", "file\u0304combining\u0304macron.txt"),
-                ("combining_breve", "file\u0306combining\u0306breve.txt"),
-                ("combining_dot_above", "file\u0307combining\u0307dot.txt"),
-                ("combining_diaeresis", "file\u0308combining\u0308diaer.txt"),
-                ("combining_ring", "file\u030acombining\u030aring.txt"),
-                ("combining_double_acute", "file\u030bcombining\u030bdbl.txt"),
-                ("combining_caron", "file\u030ccombining\u030ccaron.txt"),
-                # Mixed problematic content
-                ("mixed_controls", "mix\x00\n\r\t\x1b\x7f\u200b\u200c\u200d.txt"),
-                ("all_spaces", "\x20\xa0\u2000\u2001\u2002\u2003\u2004\u2005.txt"),
-                ("direction_mess", "text\u202eגםבעברית\u202cEnglish\u202bوعربي\u202c.txt"),
-                ("zalgo_text", "Ż̸̧̢̛͔̹̟̦̭̪̈́̊̾̈́͊̚ͅḀ̷̢̭̰̯̮̹̒̈́̓̊͐̕͝L̶̨̧̰̭̹̮̩̔̈́̊̒̈́̚͝G̸̢̧̛̭̰̮̹̒̈́̓̊͐̕Ơ̷̢͔̹̟̦̭̪̇̈́̊̾̈́͊̚.txt"),
-                # Emoji with modifiers
-                ("emoji_skin_tone", "👨🏻‍💻👩🏽‍🔬👨🏿‍🎨.txt"),
-                ("emoji_zwj_sequence", "👨‍👩‍👧‍👦family👩‍👩‍👧‍👧.txt"),
-                ("flag_sequences", "🇺🇸🇬🇧🇯🇵🇰🇷🇨🇳flags.txt"),
-                # Extreme cases
-                ("only_controls", "\x00\x01\x02\x03\x04\x05\x06\x07.txt"),
-                ("only_invisible", "\u200b\u200c\u200d\u2060\u2061\u2062.txt"),
-                ("empty_looking", "\u3000\u2800\ufeff.txt"),  # Ideographic space, braille blank, BOM
-            ]
-
-            # Create files with sanitized names for filesystem
-            for category, filename in control_char_files:
-                try:
-                    # Create a sanitized version for actual file creation
-                    safe_name = filename
-                    for char, replacement in [
-                        ("\x00", "[NULL]"),
-                        ("\x07", "[BELL]"),
-                        ("\x08", "[BS]"),
-                        ("\n", "[LF]"),
-                        ("\r", "[CR]"),
-                        ("\x1b", "[ESC]"),
-                        ("\x7f", "[DEL]"),
-                        ("\x0b", "[VT]"),
-                        ("\x0c", "[FF]"),
-                    ]:
-                        safe_name = safe_name.replace(char, replacement)
-
-                    file_path = test_dir / f"{category}_{safe_name}"
-                    file_path.write_text(f"Content: {category}")
-                except Exception:
-                    # Skip files that can't be created
-                    pass
-
-            yield test_dir
+    @pytest.fixture(scope="session")
+    def control_char_directory(self, unicode_edge_dir: Callable[[str], Path]) -> Path:
+        """Return the directory with control character filenames."""
+        return unicode_edge_dir("control")
 
     def test_control_chars_display_snapshot(self, snap_compare: Any, control_char_directory: Path) -> None:
         """Test how control characters are displayed."""
@@ -148,72 +77,10 @@ class TestControlCharacterSnapshots:
 class TestBoundaryConditionsSnapshots:
     """Test boundary conditions for layout stability."""
 
-    @pytest.fixture
-    def boundary_test_directory(self) -> Generator[Path, None, None]:
-        """Create directory for boundary condition testing."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir)
-
-            # Create files at filesystem limits
-            boundary_files = [
-                # Maximum filename lengths (255 chars on most systems)
-                "a" * 250 + ".txt",
-                "文" * 80 + ".txt",  # Unicode chars take more bytes
-                "🎉" * 60 + ".txt",  # Emoji take even more bytes
-                # Single character names
-                "a",
-                "文",
-                "🎉",
-                ".",
-                "_",
-                "-",
-                "~",
-                # All dots
-                ".",
-                "..",
-                "...",
-                "....",
-                # All spaces (will need quotes)
-                "   ",
-                "\t\t\t",
-                "\xa0\xa0\xa0",  # Non-breaking spaces
-                # Numbers only
-                "0",
-                "123456789",
-                "999999999999999999999999999999",
-                # Special patterns
-                "CON",  # Reserved on Windows
-                "PRN",  # Reserved on Windows
-                "AUX",  # Reserved on Windows
-                "NUL",  # Reserved on Windows
-                "COM1",  # Reserved on Windows
-                "LPT1",  # Reserved on Windows
-            ]
-
-            for filename in boundary_files:
-                try:
-                    if filename not in [".", ".."]:  # Skip special directory entries
-                        (test_dir / filename).write_text("boundary test")
-                except Exception:
-                    pass
-
-            # Create directory structure to test tree limits
-            # Very deep nesting
-            deep_path = test_dir
-            for i in range(20):
-                deep_path = deep_path / f"level_{i}"
-                try:
-                    deep_path.mkdir()
-                except Exception:
-                    break
-
-            # Very wide (many siblings)
-            wide_dir = test_dir / "many_siblings"
-            wide_dir.mkdir()
-            for i in range(200):
-                (wide_dir / f"sibling_{i:03d}.txt").write_text(f"Sibling {i}")
-
-            yield test_dir
+    @pytest.fixture(scope="session")
+    def boundary_test_directory(self, unicode_edge_dir: Callable[[str], Path]) -> Path:
+        """Return the directory for boundary condition testing."""
+        return unicode_edge_dir("boundary")
 
     def test_boundary_filenames_snapshot(self, snap_compare: Any, boundary_test_directory: Path) -> None:
         """Test display of boundary condition filenames."""
@@ -14,14 +14,27 @@
 # - Tests for Unicode characters in various languages
 # - Tests for control characters and special characters
 # - Tests for layout stability with exotic filenames
+# - Made directory fixtures session-scoped and hoisted name lists to module constants
+# - Created fixture files with raw os.open/os.write calls instead of Path.write_text
+# - Sanitized control characters with a single str.translate table
+# - Wrote bulk fixture files concurrently with a ThreadPoolExecutor
+# - Normalized language directory and file names to NFC once at import
+# - Added an ASCII fast path to the NFC normalization
+# - Wrote one shared dummy payload to every bulk fixture file
+# - Built fixture paths with os.path.join on cached strings instead of Path objects
+# - Created the nested directory chain with a single os.makedirs call
+# - Precomputed the sanitized on-disk filenames as module-level tuples
+# - Narrowed the fixture write error handling to OSError
+# - Sanitized control characters with a compiled regex, faster than str.translate on these names
+# - Moved the filename corpus and fixture builders to the shared unicode_edge_corpus fixture in conftest.py
+# - Skipped the snapshots when the filesystem rejected most of the fixture names
+# - Parametrized the six terminal size snapshots into one test
 #
 
 """Edge case visual snapshot tests for the file browser."""
 
-import os
-import tempfile
 from pathlib import Path
-from typing import Any, Generator, Type
+from typing import Any, Callable, Tuple, Type
 import pytest
 
 from selectfilecli.file_browser_app import FileBrowserApp
@@ -30,136 +43,20 @@ from selectfilecli.file_browser_app import FileBrowserApp
 class TestEdgeCaseSnapshots:
     """Test visual snapshots for edge cases."""
 
-    @pytest.fixture
-    def edge_case_directory(self) -> Generator[Path, None, None]:
-        """Create a directory with edge case filenames."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir)
-
-            # Create subdirectories with various languages
-            dirs = [
-                "普通文件夹",  # Chinese: Normal Folder
-                "한국어_폴더",  # Korean: Korean Folder
-                "Русская_папка",  # Russian: Russian Folder
-                "עברית_תיקייה",  # Hebrew: Hebrew Folder (will display LTR)
-                "مجلد_عربي",  # Arabic: Arabic Folder (will display LTR)
-                "हिंदी_फ़ोल्डर",  # Hindi: Hindi Folder
-                "संस्कृत_फोल्डर",  # Sanskrit: Sanskrit Folder
-                "Ελληνικός_φάκελος",  # Greek: Greek Folder
-                "日本語フォルダ",  # Japanese: Japanese Folder
-                "emoji_folder_🎉🎨🎭🎪🎬",  # Emoji folder
-            ]
-
-            for dir_name in dirs:
-                (test_dir / dir_name).mkdir()
-
-            # Create files with edge cases
-            edge_case_files = [
-                # Very long filenames
-                "this_is_a_very_long_filename_that_should_exceed_normal_screen_width_and_trigger_horizontal_scrolling_behavior_in_the_file_browser_interface_1234567890.txt",
-                "another_extremely_long_filename_with_lots_of_underscores_and_numbers_123456789012345678901234567890123456789012345678901234567890.document",
-                # Files with various Unicode characters
-                "文件名_中文字符.txt",  # Chinese characters
-                "파일명_한글.txt",  # Korean characters
-                "файл_кириллица.txt",  # Cyrillic characters
-                "קובץ_עברית.txt",  # Hebrew (will display LTR)
-                "ملف_عربي.txt",  # Arabic (will display LTR)
-                "फ़ाइल_हिंदी.txt",  # Hindi
-                "ファイル_日本語.txt",  # Japanese
-                "αρχείο_ελληνικά.txt",  # Greek
-                # Files with special characters
-                "file with spaces.txt",
-                "file\twith\ttabs.txt",
-                "file|with|pipes.txt",
-                "file*with*asterisks.txt",
-                "file?with?questions.txt",
-                "file<with>brackets.txt",
-                'file"with"quotes.txt',
-                "file'with'apostrophes.txt",
-                "file[with]square[brackets].txt",
-                "file{with}curly{braces}.txt",
-                "file(with)parentheses.txt",
-                "file&with&ampersands.txt",
-                "file@with@at@signs.txt",
-                "file#with#hashes.txt",
-                "file$with$dollars.txt",
-                "file%with%percents.txt",
-                "file^with^carets.txt",
-                "file=with=equals.txt",
-                "file+with+plus+signs.txt",
-                "file~with~tildes.txt",
-                "file`with`backticks.txt",
-                # Files with control characters (will be escaped)
-                "file\nwith\nnewlines.txt",
-                "file\rwith\rcarriage\rreturns.txt",
-                "file\x00with\x00null\x00chars.txt",
-                "file\x1bwith\x1bescape\x1bchars.txt",
-                "\x07bell\x07character\x07file.txt",
-                # Leading/trailing special characters
-                "   leading_spaces.txt",
-                "trailing_spaces.txt   ",
-                "\t\tleading_tabs.txt",
-                "trailing_tabs.txt\t\t",
-                "...leading_dots.txt",
-                "trailing_dots.txt...",
-                # Mixed emoji and text
-                "🎉celebration🎊file🎈.txt",
-                "💻code👨‍💻file🖥️.py",
-                "🌍world🌎map🌏.jpg",
-                "🔥hot🌶️spicy🌡️.dat",
-                # Zero-width and invisible characters
-                "file\u200bwith\u200bzero\u200bwidth\u200bspaces.txt",
-                "file\u2060with\u2060word\u2060joiners.txt",
-                "file\ufeffwith\ufeffBOM.txt",
-            ]
-
-            # Create all edge case files
-            for filename in edge_case_files:
-                try:
-                    # Some filenames might be invalid on certain filesystems
-                    # Replace invalid characters for the actual file creation
-                    safe_filename = filename.replace("\x00", "_null_").replace("\r", "_cr_").replace("\n", "_lf_").replace("\x1b", "_esc_").replace("\x07", "_bel_")
-                    (test_dir / safe_filename).write_text(f"Content of {filename}")
-                except Exception:
-                    # Skip files that can't be created on this filesystem
-                    pass
-
-            # Create a Python virtual environment for testing venv detection
-            venv_dir = test_dir / "test_venv_✨"
-            venv_dir.mkdir()
-            (venv_dir / "pyvenv.cfg").write_text("test venv config")
-
-            yield test_dir
-
-    def test_narrow_terminal_snapshot(self, snap_compare: Any, edge_case_directory: Path) -> None:
-        """Test with narrow terminal (40x20)."""
-        app = FileBrowserApp(start_path=str(edge_case_directory))
-        assert snap_compare(app, terminal_size=(40, 20))
-
-    def test_wide_terminal_snapshot(self, snap_compare: Any, edge_case_directory: Path) -> None:
-        """Test with wide terminal (120x30)."""
-        app = FileBrowserApp(start_path=str(edge_case_directory))
-        assert snap_compare(app, terminal_size=(120, 30))
-
-    def test_very_wide_terminal_snapshot(self, snap_compare: Any, edge_case_directory: Path) -> None:
-        """Test with very wide terminal (200x40)."""
+    @pytest.fixture(scope="session")
+    def edge_case_directory(self, unicode_edge_dir: Callable[[str], Path]) -> Path:
+        """Return the directory with edge case filenames."""
+        return unicode_edge_dir("edge")
+
+    @pytest.mark.parametrize(
+        "terminal_size",
+        [(40, 20), (120, 30), (200, 40), (80, 50), (30, 10), (60, 60)],
+        ids=["narrow", "wide", "very_wide", "tall", "tiny", "square"],
+    )
+    def test_terminal_size_snapshot(self, snap_compare: Any, edge_case_directory: Path, terminal_size: Tuple[int, int]) -> None:
+        """Test the edge case listing at narrow, wide, tall, tiny and square terminal sizes."""
         app = FileBrowserApp(start_path=str(edge_case_directory))
-        assert snap_compare(app, terminal_size=(200, 40))
-
-    def test_tall_terminal_snapshot(self, snap_compare: Any, edge_case_directory: Path) -> None:
-        """Test with tall terminal (80x50)."""
-        app = FileBrowserApp(start_path=str(edge_case_directory))
-        assert snap_compare(app, terminal_size=(80, 50))
-
-    def test_tiny_terminal_snapshot(self, snap_compare: Any, edge_case_directory: Path) -> None:
-        """Test with tiny terminal (30x10)."""
-        app = FileBrowserApp(start_path=str(edge_case_directory))
-        assert snap_compare(app, terminal_size=(30, 10))
-
-    def test_square_terminal_snapshot(self, snap_compare: Any, edge_case_directory: Path) -> None:
-        """Test with square terminal (60x60)."""
-        app = FileBrowserApp(start_path=str(edge_case_directory))
-        assert snap_compare(app, terminal_size=(60, 60))
+        assert snap_compare(app, terminal_size=terminal_size)
 
     def test_navigation_in_edge_cases_snapshot(self, snap_compare: Any, edge_case_directory: Path) -> None:
         """Test navigation with edge case files."""
@@ -235,40 +132,10 @@ class TestCustomSubtitleSnapshots:
 class TestLayoutStabilitySnapshots:
     """Test layout stability with problematic content."""
 
-    @pytest.fixture
-    def stress_test_directory(self) -> Generator[Path, None, None]:
-        """Create directory designed to stress test the layout."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir)
-
-            # Create nested directories to test tree depth
-            current = test_dir
-            for i in range(10):
-                current = current / f"深い階層_{i}_уровень_{i}_level_{i}"
-                current.mkdir()
-
-            # Create many files to test vertical scrolling
-            for i in range(100):
-                (test_dir / f"file_{i:03d}_测试文件_{i}.txt").write_text(f"File {i}")
-
-            # Create files that might break layout
-            problem_files = [
-                "\x1b[31mANSI_color_codes\x1b[0m.txt",
-                "file\u202ewith\u202eRTL\u202eoverride.txt",
-                "file\u200ewith\u200eLTR\u200emark.txt",
-                "combining_é_è_ê_ë_marks.txt",
-                "emoji👨‍👩‍👧‍👦family👨‍👨‍👦‍👦emoji.txt",
-                "​​​​​only_zero_width_spaces​​​​​.txt",
-                "mixed\u0301\u0302\u0303\u0304combining.txt",
-            ]
-
-            for filename in problem_files:
-                try:
-                    (test_dir / filename).write_text("test")
-                except Exception:
-                    pass
-
-            yield test_dir
+    @pytest.fixture(scope="session")
+    def stress_test_directory(self, unicode_edge_dir: Callable[[str], Path]) -> Path:
+        """Return the directory designed to stress test the layout."""
+        return unicode_edge_dir("stress")
 
     def test_deep_nesting_snapshot(self, snap_compare: Any, stress_test_directory: Path) -> None:
         """Test deeply nested directory structure."""
@@ -8,6 +8,7 @@
 
 # HERE IS THE CHANGELOG FOR THIS VERSION OF THE FILE:
 # - Created visual snapshot tests for empty directory display
+# - Moved the FileBrowserApp import to module level
 #
 
 """Visual snapshot tests for empty directory display."""
@@ -16,6 +17,8 @@ import tempfile
 from pathlib import Path
 import pytest
 
+from selectfilecli.file_browser_app import FileBrowserApp
+
 
 class TestEmptyDirectorySnapshots:
     """Snapshot tests for empty directory display."""
@@ -35,8 +38,6 @@ class TestEmptyDirectorySnapshots:
             (non_empty / "file.txt").write_text("test content")
 
             # Create the test app
-            from selectfilecli.file_browser_app import FileBrowserApp
-
             app = FileBrowserApp(str(test_dir))
 
             # Simulate navigation to expand empty folder
@@ -34,306 +34,457 @@
 # - Added test for empty directory display showing <empty> placeholder
 # - Updated tests for FileInfo to include error_message field (issue #10)
 # - Added test_file_info_error_handling to verify error message population
+# - Moved temp_directory and temp_directory_with_varied_files to conftest.py at session scope
+# - Removed the parent, home, backspace and button navigation tests duplicated by TestNavigationFeatures
+# - Ran the read-only compose, title, CSS and footer tests against one module-scoped pilot_session
+# - Swapped FileBrowserApp in the select_file tests with a plain attribute assignment
+# - Grouped the snapshot tests on one pytest-xdist worker
+# - Parametrized the five app snapshot tests into test_app_snapshot
+# - Replaced fixed sleeps after key presses in TestFileBrowserApp with idle waits
+# - Hoisted the snapshot app paths to module-level constants
+# - Made the tests that never await synchronous
+# - Ran test_directory_tree_navigation against pilot_session with one press call
+# - Looked up the pilot_session widgets once in the fixture
+# - Removed the unused Callable and in-test DirectoryTree imports
+# - Shared one module-level MockFileBrowserApp between the select_file tests
+# - Replaced the in-test tempfile.TemporaryDirectory blocks with the tmp_path fixture
+# - Removed in-test imports of names the module already imports
+# - Parametrized the quit and escape tests into test_quit_via_key
+# - Merged the compose, title, CSS and footer checks into test_app_layout
+# - Added the module-scoped app_factory for tests that never run the app
+# - Added wait_until and used it instead of fixed sleeps before navigation and expansion checks
+# - Grouped the pilot_session tests on one pytest-xdist worker
+# - Parametrized the three SortDialog action_submit tests into one
+# - Replaced the Mock path and node objects in the _populate_node tests with small stubs
+# - Stopped monkeypatching the Path constructor in test_populate_node_error_handling
+# - Used the session string forms of the test trees where tests only need a str
+# - Looked up the SortDialog radio sets and buttons once through sort_dialog_radios
+# - Hoisted the select_file, datetime, Style and Mock imports out of the test bodies
+# - Ran every async test on the module-scoped event loop
+# - Restored the module event loop after each snapshot test
+# - Skipped app snapshots locally when their inputs match the last passing run
+# - Replaced the Mock node in test_populate_node_attribute_error with a SimpleNamespace stub
+# - Mounted the SortDialog in the dialog-only tests on a bare SortDialogHost app
+# - Replaced the remaining fixed sleeps with wait_until on the awaited state or a bare pause
+# - Mounted each dialog-only test's SortDialog on one class-scoped sort_dialog_host
+# - Started the tree tests in the session browser tree instead of the working directory
+# - Replaced the Mock nodes in the render_label tests with SimpleNamespace stubs
+# - Dropped the per-mode pause from test_all_sort_modes
+# - Parametrized test_file_size_formatting over the static format_file_size, without an app
+# - Replaced the assert True endings of the SortDialog and unknown sort mode tests with real checks
+# - Ran test_path_display_updates against pilot_session
+# - Moved the async tests to the session event loop set in pytest.ini
+# - Called on_file_selected in test_file_selection without starting the app
+# - Checked that render_label stats a node once across two renders
+# - Added test_populate_node_uses_scanned_stats for the scandir based directory listing
+# - Checked that render_label stats a directory with a single lstat
+# - Checked that render_label does not retry a path whose lstat failed
+# - Checked that render_label reuses the formatted size of a file
+# - Checked that render_label checks write access to a file once across two renders
+# - Added test_render_label_skips_hidden_date for narrow terminals
+# - Loaded the directory through _load_directory in test_populate_node_uses_scanned_stats and checked that no entry is stat'ed
+# - Added test_reload_clears_path_caches
+# - Counted the lstat calls for the rendered path instead of comparing the whole call list
+# - Counted the os.access calls for the rendered path instead of comparing the whole call list
+# - Checked the cached lstat failure in test_reload_clears_path_caches
+# - Reset the MockFileBrowserApp class attributes around each select_file test in a fixture
+# - Made test_custom_directory_tree_watch_path a sync check on the class instead of booting the app
 #
 
 """Tests for the Textual file browser application."""
 # mypy: disable-error-code="attr-defined"
 
+import hashlib
+import inspect
 import os
-import tempfile
+import warnings
+from collections import namedtuple
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from importlib.metadata import version
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch
-import time
-from typing import Generator, Any, Callable
+from typing import Any, AsyncGenerator, Callable, Dict, Iterator, List, Optional, Tuple
 
 import pytest
+import pytest_asyncio
+from textual import events
+from textual.app import App
 from textual.pilot import Pilot
 from textual.widgets import RadioSet, RadioButton, Button, Label
 from textual.widgets._directory_tree import DirectoryTree
+from rich.style import Style
 from rich.text import Text
 
+from selectfilecli import select_file
 from selectfilecli.file_browser_app import FileBrowserApp, SortMode, SortOrder, CustomDirectoryTree, SortDialog
 from selectfilecli.file_info import FileInfo
+import selectfilecli.file_browser_app as file_browser_app_module
 
+# Snapshot apps with consistent directory structures
+SNAPSHOT_APPS_DIR = Path(__file__).parent / "snapshot_apps"
+SNAPSHOT_APP = SNAPSHOT_APPS_DIR / "test_file_browser.py"
+SORTING_SNAPSHOT_APP = SNAPSHOT_APPS_DIR / "test_sorting_browser.py"
+SNAPSHOTS_DIR = Path(__file__).parent / "__snapshots__" / Path(__file__).stem
+PACKAGE_DIR = Path(file_browser_app_module.__file__).parent
+# Stands in for DirectoryTree.FileSelected, of which on_file_selected only reads the path
+FileSelectedEvent = namedtuple("FileSelectedEvent", "path")
 
-@pytest.fixture
-def temp_directory() -> Generator[Path, None, None]:
-    """Create a temporary directory structure for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create test directory structure
-        test_dir = Path(tmpdir)
-
-        # Create subdirectories
-        (test_dir / "documents").mkdir()
-        (test_dir / "documents" / "work").mkdir()
-        (test_dir / "pictures").mkdir()
-        (test_dir / "music").mkdir(exist_ok=True)
 
-        # Create test files
-        (test_dir / "readme.txt").write_text("Test readme")
-        (test_dir / "documents" / "report.pdf").write_text("Test report")
-        (test_dir / "documents" / "work" / "project.doc").write_text("Test project")
-        (test_dir / "pictures" / "photo.jpg").write_text("Test photo")
-        (test_dir / ".hidden_file").write_text("Hidden file")
+@pytest_asyncio.fixture(scope="module")
+async def pilot_session(temp_directory_str: str) -> AsyncGenerator[Tuple[FileBrowserApp, Pilot, SimpleNamespace], None]:
+    """Run one app for the read-only tests of this module.
+
+    Yields the app, its pilot and its header, tree, footer and path display widgets,
+    looked up once.
+
+    Tests using this fixture may move the tree cursor but must not change the directory,
+    the sort settings or the screen stack. They belong to the "file_browser" xdist group
+    so that one worker runs them all against a single app.
+    """
+    app = FileBrowserApp(start_path=temp_directory_str)
+    async with app.run_test() as pilot:
+        widgets = SimpleNamespace(
+            header=app.query_one("Header"),
+            tree=app.query_one(CustomDirectoryTree),
+            footer=app.query_one("Footer"),
+            path_display=app.query_one("#path-display"),
+        )
+        yield app, pilot, widgets
+
+
+@pytest.fixture(scope="module")
+def app_factory() -> Callable[[str], FileBrowserApp]:
+    """Return a factory that builds one FileBrowserApp per start path for the module.
+
+    Only tests that never run the app may use it, since a Textual app runs at most once.
+    """
+    cache: Dict[str, FileBrowserApp] = {}
+
+    def make(start_path: str) -> FileBrowserApp:
+        if start_path not in cache:
+            cache[start_path] = FileBrowserApp(start_path=start_path)
+        return cache[start_path]
+
+    return make
+
+
+async def wait_until(pilot: Pilot, condition: Callable[[], bool], timeout: float = 1.0, step: float = 0.01) -> bool:
+    """Pause the pilot in small steps until condition holds or timeout passes.
+
+    Returns the final value of condition, so callers still assert on the state they expect.
+    """
+    elapsed = 0.0
+    while not condition():
+        if elapsed >= timeout:
+            return False
+        await pilot.pause(step)
+        elapsed += step
+    return True
+
+
+@contextmanager
+def replaced_file_browser_app(replacement: Any) -> Iterator[None]:
+    """Swap FileBrowserApp for replacement in its module, restoring it on exit."""
+    original = file_browser_app_module.FileBrowserApp
+    file_browser_app_module.FileBrowserApp = replacement
+    try:
+        yield
+    finally:
+        file_browser_app_module.FileBrowserApp = original
+
+
+def sort_dialog_radios(dialog: SortDialog) -> SimpleNamespace:
+    """Look up the radio sets of a SortDialog and their buttons once.
+
+    Returns a namespace with mode_set, order_set, modes and orders, the last two
+    being lists of RadioButton in display order.
+    """
+    mode_set = dialog.query_one("#sort-modes", RadioSet)
+    order_set = dialog.query_one("#sort-order", RadioSet)
+    return SimpleNamespace(
+        mode_set=mode_set,
+        order_set=order_set,
+        modes=list(mode_set.query(RadioButton)),
+        orders=list(order_set.query(RadioButton)),
+    )
+
+
+def snapshot_fingerprint(app_path: Path, press: List[str], terminal_size: Tuple[int, int], reference: Path) -> str:
+    """Hash everything an app snapshot depends on.
+
+    Covers the snapshot app, the package sources, the Textual version, the key
+    sequence, the terminal size and the reference SVG.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path in (app_path, reference, *sorted(PACKAGE_DIR.glob("*.py"))):
+        digest.update(path.read_bytes() if path.exists() else b"")
+        digest.update(b"\0")
+    digest.update(repr((version("textual"), press, terminal_size)).encode())
+    return digest.hexdigest()
+
+
+def may_skip_unchanged_snapshots(config: pytest.Config, test_env: Dict[str, Any]) -> bool:
+    """Tell whether snapshots whose inputs are unchanged may be skipped.
+
+    Never in CI, when updating snapshots, without the cache plugin or with FULL_SNAPSHOTS set.
+    """
+    if test_env["is_ci"] or os.environ.get("FULL_SNAPSHOTS"):
+        return False
+    if config.getoption("--snapshot-update", default=False):
+        return False
+    return getattr(config, "cache", None) is not None
+
+
+def record_dismiss(dialog: SortDialog) -> List[Any]:
+    """Replace dialog.dismiss with a recorder and return the list it appends results to."""
+    dismissed: List[Any] = []
+    dialog.dismiss = dismissed.append
+    return dismissed
+
+
+class SortDialogHost(App[None]):
+    """Empty app to mount a SortDialog on, for tests that need no directory tree."""
 
-        yield test_dir
+
+@pytest_asyncio.fixture(scope="class")
+async def sort_dialog_host() -> AsyncGenerator[Tuple[SortDialogHost, Pilot], None]:
+    """Run one SortDialogHost for all the dialog-only tests of a class."""
+    app = SortDialogHost()
+    async with app.run_test() as pilot:
+        yield app, pilot
+
+
+@pytest_asyncio.fixture
+async def mounted_sort_dialog(sort_dialog_host: Tuple[SortDialogHost, Pilot]) -> AsyncGenerator[Tuple[SortDialog, Pilot], None]:
+    """Mount a fresh SortDialog(NAME, ASCENDING) on the shared host, removing it afterwards."""
+    app, pilot = sort_dialog_host
+    dialog = SortDialog(SortMode.NAME, SortOrder.ASCENDING)
+    await app.mount(dialog)
+    await pilot.pause()
+    yield dialog, pilot
+    if dialog.is_attached:
+        await dialog.remove()
+
+
+class MockFileBrowserApp:
+    """Stand-in for FileBrowserApp that returns a preset result from run()."""
+
+    result: Optional[FileInfo] = None
+    last_start_path: Optional[str] = None
+
+    def __init__(self, start_path: str, select_files: bool = True, select_dirs: bool = False) -> None:
+        self.start_path = start_path
+        self.select_files = select_files
+        self.select_dirs = select_dirs
+        type(self).last_start_path = start_path
+
+    def run(self) -> Optional[FileInfo]:
+        return type(self).result
 
 
 @pytest.fixture
-def temp_directory_with_varied_files() -> Generator[Path, None, None]:
-    """Create a temporary directory with files having different attributes."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        test_dir = Path(tmpdir)
-
-        # Create files with different extensions, sizes, and timestamps
-        files = [
-            ("document.pdf", "Small PDF", 1024),
-            ("image.jpg", "Large image file" * 1000, 15000),
-            ("script.py", "#!/usr/bin/env python3\nprint('hello')", 50),
-            ("data.csv", "id,name,value\n1,test,100", 30),
-            ("archive.zip", "Binary content" * 100, 1400),
-            ("readme.txt", "Simple text file", 20),
-            ("video.mp4", "Video file content" * 500, 8000),
-            ("config.json", '{"key": "value"}', 18),
-        ]
-
-        # Create files with controlled timestamps
-        base_time = time.time()
-        for i, (filename, content, _) in enumerate(files):
-            file_path = test_dir / filename
-            file_path.write_text(content)
-            # Set different modification times (spaced by 10 seconds)
-            mod_time = base_time + (i * 10)
-            access_time = base_time + (i * 5)  # Different access pattern
-            os.utime(file_path, (access_time, mod_time))
-
-        # Create subdirectories
-        (test_dir / "src").mkdir()
-        (test_dir / "docs").mkdir()
-        (test_dir / "tests").mkdir()
-
-        yield test_dir
+def mock_file_browser_app() -> Iterator[type[MockFileBrowserApp]]:
+    """Make select_file use MockFileBrowserApp, with its preset result and recorded start path reset."""
+    MockFileBrowserApp.result = None
+    MockFileBrowserApp.last_start_path = None
+    try:
+        with replaced_file_browser_app(MockFileBrowserApp):
+            yield MockFileBrowserApp
+    finally:
+        MockFileBrowserApp.result = None
+        MockFileBrowserApp.last_start_path = None
+
+
+class StatErrorPath:
+    """Stand-in for an unreadable file whose stat() fails."""
+
+    name = "test.txt"
+
+    def stat(self, *args: Any, **kwargs: Any) -> os.stat_result:
+        raise OSError("Permission denied")
+
+
+class NonDirectoryPath:
+    """Stand-in for a path that is not a directory."""
+
+    def is_dir(self) -> bool:
+        return False
 
 
 class TestFileBrowserApp:
     """Test the FileBrowserApp functionality."""
 
-    @pytest.mark.asyncio
-    async def test_app_initialization(self, temp_directory: Path) -> None:
+    def test_app_initialization(self, app_factory: Callable[[str], FileBrowserApp], temp_directory: Path) -> None:
         """Test that the app initializes correctly."""
-        app = FileBrowserApp(start_path=str(temp_directory))
+        app = app_factory(str(temp_directory))
 
         assert app.start_path == temp_directory.resolve()
         assert app.selected_item is None
 
-    @pytest.mark.asyncio
-    async def test_app_compose(self, temp_directory):
-        """Test that the app composes the correct widgets."""
-        app = FileBrowserApp(start_path=str(temp_directory))
-        async with app.run_test() as pilot:
-            # Check that Header, DirectoryTree, and Footer are present
-            assert pilot.app.query_one("Header")
-            assert pilot.app.query_one(CustomDirectoryTree)
-            assert pilot.app.query_one("Footer")
-
-    @pytest.mark.asyncio
-    async def test_app_title(self, temp_directory):
-        """Test that the app sets the correct title and subtitle."""
-        app = FileBrowserApp(start_path=str(temp_directory))
-        async with app.run_test() as pilot:
-            assert pilot.app.title == "Select File Browser"
-            # Default is select_files=True, select_dirs=False
-            assert pilot.app.sub_title == "Navigate with arrows, Enter to select files, Q to cancel"
-
-    @pytest.mark.asyncio
-    async def test_app_title_with_folder_selection(self, temp_directory):
+    @pytest.mark.xdist_group("file_browser")
+    async def test_app_layout(self, pilot_session):
+        """Test the widgets, title, subtitle, CSS and footer of the running app."""
+        app, pilot, widgets = pilot_session
+        # Check that Header, DirectoryTree, and Footer are present
+        assert widgets.header
+        assert isinstance(widgets.tree, CustomDirectoryTree)
+        assert widgets.footer
+
+        # Check the title and subtitle
+        assert app.title == "Select File Browser"
+        # Default is select_files=True, select_dirs=False
+        assert app.sub_title == "Navigate with arrows, Enter to select files, Q to cancel"
+
+    async def test_app_title_with_folder_selection(self, temp_directory_str):
         """Test that the app sets the correct subtitle when folder selection is enabled."""
-        app = FileBrowserApp(start_path=str(temp_directory), select_files=True, select_dirs=True)
+        app = FileBrowserApp(start_path=temp_directory_str, select_files=True, select_dirs=True)
         async with app.run_test() as pilot:
             assert pilot.app.title == "Select File Browser"
             assert pilot.app.sub_title == "Navigate with arrows, Enter to select files or folders, D to select dir, Q to cancel"
 
-    @pytest.mark.asyncio
-    async def test_quit_action(self, temp_directory):
-        """Test that pressing 'q' cancels and returns FileInfo with all None values."""
-        app = FileBrowserApp(start_path=str(temp_directory))
-        async with app.run_test() as pilot:
-            await pilot.press("q")
-            result = pilot.app.return_value
-            assert isinstance(result, FileInfo)
-            assert all(value is None for value in result.as_tuple())
-            # Verify all 10 fields are None including error_message
-            assert len(result.as_tuple()) == 10
-
-    @pytest.mark.asyncio
-    async def test_escape_quit(self, temp_directory):
-        """Test that pressing Escape cancels and returns FileInfo with all None values."""
-        app = FileBrowserApp(start_path=str(temp_directory))
+    @pytest.mark.parametrize("key", ["q", "escape"])
+    async def test_quit_via_key(self, temp_directory_str, key):
+        """Test that pressing 'q' or Escape cancels and returns FileInfo with all None values."""
+        app = FileBrowserApp(start_path=temp_directory_str)
         async with app.run_test() as pilot:
-            await pilot.press("escape")
+            await pilot.press(key)
             result = pilot.app.return_value
             assert isinstance(result, FileInfo)
             assert all(value is None for value in result.as_tuple())
             # Verify all 10 fields are None including error_message
             assert len(result.as_tuple()) == 10
 
-    @pytest.mark.asyncio
-    async def test_directory_tree_navigation(self, temp_directory):
+    @pytest.mark.xdist_group("file_browser")
+    async def test_directory_tree_navigation(self, pilot_session, temp_directory_str):
         """Test navigation through the directory tree."""
-        app = FileBrowserApp(start_path=str(temp_directory))
-        async with app.run_test() as pilot:
-            # Get the DirectoryTree widget
-            tree = pilot.app.query_one(CustomDirectoryTree)
+        app, pilot, widgets = pilot_session
+
+        # The tree should show our temp directory
+        assert temp_directory_str in str(widgets.tree.path)
 
-            # The tree should show our temp directory
-            assert str(temp_directory) in str(tree.path)
+        # Move to the first item, the second item and back up
+        await pilot.press("down", "down", "up")
 
-            # Navigate with arrow keys
-            await pilot.press("down")  # Move to first item
-            await pilot.press("down")  # Move to second item
-            await pilot.press("up")  # Move back up
+        # Return the cursor to the top for the next test sharing the session
+        await pilot.press("home")
 
-    @pytest.mark.asyncio
-    async def test_file_selection(self, temp_directory):
+    def test_file_selection(self, temp_directory):
         """Test selecting a file."""
         app = FileBrowserApp(start_path=str(temp_directory))
+        selected_file = temp_directory / "readme.txt"
 
-        # Mock the file selection to avoid complex tree navigation
-        selected_file = str(temp_directory / "readme.txt")
+        # The handler only reads the event path, so it runs without starting the app
+        app.on_file_selected(FileSelectedEvent(str(selected_file)))
 
-        async with app.run_test() as pilot:
-            # Simulate file selection by calling the handler directly
-            from textual.widgets import DirectoryTree
-
-            # Create a mock event
-            class MockFileSelectedEvent:
-                def __init__(self, path: str) -> None:
-                    self.path = path
-
-            # Simulate file selection if app has the method
-            if hasattr(pilot.app, "on_file_selected"):
-                pilot.app.on_file_selected(MockFileSelectedEvent(selected_file))
-
-            # The app should exit with the selected file
-            if hasattr(pilot.app, "selected_item"):
-                pilot.app._create_file_info(Path(selected_file), is_file=True)
-                assert pilot.app.selected_item is not None
-                assert pilot.app.selected_item.file_path == Path(selected_file)
-
-    @pytest.mark.asyncio
-    async def test_invalid_start_path(self):
+        assert app.selected_item is not None
+        assert app.selected_item.file_path == selected_file
+        assert app.return_value is app.selected_item
+
+    def test_invalid_start_path(self):
         """Test that invalid start path raises ValueError."""
         with pytest.raises(ValueError, match="Start path must be a valid directory"):
-            from selectfilecli import select_file
-
             select_file("/nonexistent/path")
 
-    @pytest.mark.asyncio
-    async def test_app_css(self, temp_directory):
-        """Test that the app has proper CSS styling."""
-        app = FileBrowserApp(start_path=str(temp_directory))
-        async with app.run_test() as pilot:
-            # Check that CSS is applied
-            tree = pilot.app.query_one(CustomDirectoryTree)
-            assert tree is not None
-
-    def test_app_visual_snapshot(self, snap_compare):
-        """Test app visual appearance with SVG snapshot testing."""
-        # Use the test app with consistent directory structure
-        snapshot_app_path = Path(__file__).parent / "snapshot_apps" / "test_file_browser.py"
-
-        # Use snap_compare to take and compare SVG snapshot
-        assert snap_compare(snapshot_app_path, terminal_size=(80, 24))
-
-    def test_app_navigation_snapshot(self, snap_compare):
-        """Test app appearance after navigation with SVG snapshot."""
-        # Use the test app with consistent directory structure
-        snapshot_app_path = Path(__file__).parent / "snapshot_apps" / "test_file_browser.py"
-
-        # Navigate down twice and take snapshot
-        assert snap_compare(snapshot_app_path, press=["down", "down"], terminal_size=(80, 24))
-
-    def test_app_file_selection_snapshot(self, snap_compare):
-        """Test app appearance when selecting a file with SVG snapshot."""
-        # Use the test app with consistent directory structure
-        snapshot_app_path = Path(__file__).parent / "snapshot_apps" / "test_file_browser.py"
-
-        # Navigate to readme.txt and select it
-        # Note: The exact key sequence depends on the directory structure
-        assert snap_compare(
-            snapshot_app_path,
-            press=["down", "down", "down", "down", "enter"],  # Navigate to readme.txt and select
-            terminal_size=(80, 24),
-        )
-
-    @pytest.mark.asyncio
-    async def test_path_display_updates(self, temp_directory):
+    @pytest.mark.xdist_group("snapshots")
+    @pytest.mark.parametrize(
+        "app_path, press",
+        [
+            # Initial view
+            (SNAPSHOT_APP, []),
+            # Navigate down twice
+            (SNAPSHOT_APP, ["down", "down"]),
+            # Navigate to readme.txt and select it (the key sequence depends on the directory structure)
+            (SNAPSHOT_APP, ["down", "down", "down", "down", "enter"]),
+            # Default is name sort, just expand the tree
+            (SORTING_SNAPSHOT_APP, ["enter"]),
+            # Open sort dialog
+            (SORTING_SNAPSHOT_APP, ["s"]),
+        ],
+        ids=["visual", "navigation", "file_selection", "sort_by_name", "sort_dialog"],
+    )
+    def test_app_snapshot(self, request, test_env, snap_compare, app_path, press):
+        """Test app appearance after a key sequence with SVG snapshot testing.
+
+        Local runs skip a snapshot whose inputs match its last passing run; set
+        FULL_SNAPSHOTS=1 to render them all.
+        """
+        terminal_size = (80, 24)
+        reference = SNAPSHOTS_DIR / f"{type(self).__name__}.{request.node.name}.svg"
+        fingerprint = snapshot_fingerprint(app_path, press, terminal_size, reference)
+        cache_key = f"selectfilecli/snapshot_fingerprints/{request.node.name}"
+        skippable = may_skip_unchanged_snapshots(request.config, test_env)
+        if skippable and request.config.cache.get(cache_key, None) == fingerprint:
+            pytest.skip("snapshot inputs unchanged since the last passing run")
+
+        assert snap_compare(app_path, press=press, terminal_size=terminal_size)
+        if skippable:
+            request.config.cache.set(cache_key, fingerprint)
+
+    @pytest.mark.xdist_group("file_browser")
+    async def test_path_display_updates(self, pilot_session, temp_directory_str):
         """Test that the path display updates when navigating."""
-        app = FileBrowserApp(start_path=str(temp_directory))
-        async with app.run_test() as pilot:
-            # Check initial path display
-            path_display = pilot.app.query_one("#path-display")
-            assert str(temp_directory) in path_display.renderable
+        app, pilot, widgets = pilot_session
 
-            # Navigate and check path updates
-            await pilot.press("down")
-            await pilot.pause(0.1)
-            # Path should still show something (even if same directory)
-            assert path_display.renderable != ""
+        # Check initial path display
+        assert temp_directory_str in widgets.path_display.renderable
+
+        # Navigate and check path updates
+        await pilot.press("down")
+        await pilot.pause()
+        # Path should still show something (even if same directory)
+        assert widgets.path_display.renderable != ""
 
-    @pytest.mark.asyncio
-    async def test_sort_dialog_opens(self, temp_directory_with_varied_files):
+        # Return the cursor to the top for the next test sharing the session
+        await pilot.press("home")
+
+    async def test_sort_dialog_opens(self, temp_directory_with_varied_files_str):
         """Test that the sort dialog opens when pressing 's'."""
-        app = FileBrowserApp(start_path=str(temp_directory_with_varied_files))
+        app = FileBrowserApp(start_path=temp_directory_with_varied_files_str)
         async with app.run_test() as pilot:
             # Check initial sort mode
             assert app.current_sort_mode == SortMode.NAME
 
             # Press 's' to open dialog
             await pilot.press("s")
-            await pilot.pause(0.1)
+            await pilot.pause()
 
             # Check if dialog is visible
-            from selectfilecli.file_browser_app import SortDialog
-
             dialog = pilot.app.screen_stack[-1]
             assert isinstance(dialog, SortDialog)
 
-    @pytest.mark.asyncio
-    async def test_sort_dialog_selection(self, temp_directory_with_varied_files):
+    async def test_sort_dialog_selection(self, temp_directory_with_varied_files_str):
         """Test selecting sort options in the dialog."""
-        app = FileBrowserApp(start_path=str(temp_directory_with_varied_files))
+        app = FileBrowserApp(start_path=temp_directory_with_varied_files_str)
         async with app.run_test() as pilot:
             # Check initial sort mode
             assert app.current_sort_mode == SortMode.NAME
 
             # Open sort dialog
             await pilot.press("s")
-            await pilot.pause(0.2)
+            await pilot.pause()
 
             # Check dialog is open
-            from selectfilecli.file_browser_app import SortDialog
-
             dialog = pilot.app.screen_stack[-1]
             assert isinstance(dialog, SortDialog)
 
             # Cancel the dialog with escape
             await pilot.press("escape")
-            await pilot.pause(0.1)
+            await pilot.pause()
 
             # Mode should remain unchanged
             assert app.current_sort_mode == SortMode.NAME
 
-    @pytest.mark.asyncio
-    async def test_tree_sorting_applied(self, temp_directory_with_varied_files):
+    async def test_tree_sorting_applied(self, temp_directory_with_varied_files_str):
         """Test that sorting is actually applied to the tree."""
-        app = FileBrowserApp(start_path=str(temp_directory_with_varied_files))
+        app = FileBrowserApp(start_path=temp_directory_with_varied_files_str)
         async with app.run_test() as pilot:
             tree = pilot.app.query_one(CustomDirectoryTree)
 
             # Expand root to load children
             await pilot.press("enter")
-            await pilot.pause(0.1)
+            await pilot.pause()
 
             # Check that tree has sort settings
             assert hasattr(tree, "tree_sort_mode")
@@ -341,23 +492,9 @@ class TestFileBrowserApp:
             assert tree.tree_sort_mode == SortMode.NAME
             assert tree.tree_sort_order == SortOrder.ASCENDING
 
-    # Snapshot tests for different sort modes
-    def test_sort_by_name_snapshot(self, snap_compare):
-        """Test visual snapshot when sorted by name."""
-        snapshot_app_path = Path(__file__).parent / "snapshot_apps" / "test_sorting_browser.py"
-        # Default is name sort, just expand the tree
-        assert snap_compare(snapshot_app_path, press=["enter"], terminal_size=(80, 24))
-
-    def test_sort_dialog_snapshot(self, snap_compare):
-        """Test visual snapshot of the sort dialog."""
-        snapshot_app_path = Path(__file__).parent / "snapshot_apps" / "test_sorting_browser.py"
-        # Open sort dialog
-        assert snap_compare(snapshot_app_path, press=["s"], terminal_size=(80, 24))
-
-    @pytest.mark.asyncio
-    async def test_sort_dialog_cancel(self, temp_directory_with_varied_files):
+    async def test_sort_dialog_cancel(self, temp_directory_with_varied_files_str):
         """Test canceling the sort dialog leaves settings unchanged."""
-        app = FileBrowserApp(start_path=str(temp_directory_with_varied_files))
+        app = FileBrowserApp(start_path=temp_directory_with_varied_files_str)
         async with app.run_test() as pilot:
             # Save initial settings
             initial_mode = app.current_sort_mode
@@ -365,23 +502,14 @@ class TestFileBrowserApp:
 
             # Open and cancel dialog
             await pilot.press("s")
-            await pilot.pause(0.1)
+            await pilot.pause()
             await pilot.press("escape")
-            await pilot.pause(0.1)
+            await pilot.pause()
 
             # Settings should be unchanged
             assert app.current_sort_mode == initial_mode
             assert app.current_sort_order == initial_order
 
-    @pytest.mark.asyncio
-    async def test_footer_shows_sort_binding(self, temp_directory):
-        """Test that footer shows the Sort binding."""
-        app = FileBrowserApp(start_path=str(temp_directory))
-        async with app.run_test() as pilot:
-            footer = pilot.app.query_one("Footer")
-            # The footer should show the sort binding
-            assert footer is not None
-
 
 class TestSortDialog:
     """Test the SortDialog class directly."""
@@ -403,113 +531,73 @@ class TestSortDialog:
 class TestSelectFileFunction:
     """Test the select_file public API function."""
 
-    def test_select_file_with_mock(self, temp_directory, monkeypatch):
+    def test_select_file_with_mock(self, temp_directory, mock_file_browser_app):
         """Test select_file function with mocked Textual app."""
-        from selectfilecli import select_file
-
         selected_path = str(temp_directory / "test.txt")
 
         # Mock the FileBrowserApp to return a specific path
-        class MockApp:
-            def __init__(self, start_path: str, select_files: bool = True, select_dirs: bool = False) -> None:
-                self.start_path = start_path
-                self.select_files = select_files
-                self.select_dirs = select_dirs
-
-            def run(self) -> FileInfo:
-                return FileInfo(file_path=Path(selected_path))
-
-        monkeypatch.setattr("selectfilecli.file_browser_app.FileBrowserApp", MockApp)
-
+        mock_file_browser_app.result = FileInfo(file_path=Path(selected_path))
         result = select_file(str(temp_directory))
         # Default behavior should return string for backward compatibility
         assert result == selected_path
 
-    def test_select_file_default_path(self, monkeypatch):
+    def test_select_file_default_path(self, mock_file_browser_app):
         """Test select_file with default current directory."""
-        from selectfilecli import select_file
-
-        # Mock the app
-        class MockApp:
-            def __init__(self, start_path: str, select_files: bool = True, select_dirs: bool = False) -> None:
-                self.start_path = start_path
-                self.select_files = select_files
-                self.select_dirs = select_dirs
-                assert start_path == os.getcwd()
-
-            def run(self) -> None:
-                return None
-
-        monkeypatch.setattr("selectfilecli.file_browser_app.FileBrowserApp", MockApp)
-
         result = select_file()
+        assert mock_file_browser_app.last_start_path == os.getcwd()
         assert result is None
 
 
 class TestSortDialogAdditional:
     """Additional tests for SortDialog to achieve 100% coverage."""
 
-    @pytest.mark.asyncio
-    async def test_sort_dialog_action_submit(self):
-        """Test SortDialog action_submit method."""
-        dialog = SortDialog(SortMode.NAME, SortOrder.ASCENDING)
-        app = FileBrowserApp()
-
-        async with app.run_test() as pilot:
-            app.mount(dialog)
-            await pilot.pause()
-
-            # Test with selected values
-            mode_set = dialog.query_one("#sort-modes", RadioSet)
-            order_set = dialog.query_one("#sort-order", RadioSet)
-
-            # Select radio buttons
-            radios = mode_set.query(RadioButton)
-            if len(radios) > 1:
-                radios[1].value = True  # Select CREATED
-
-            order_radios = order_set.query(RadioButton)
-            if len(order_radios) > 1:
-                order_radios[1].value = True  # Select DESCENDING
-
-            # Call action_submit
-            dialog.action_submit()
-
-            # Dialog should have been dismissed
-            # Check if the dialog action was called by checking result
-            assert True  # The action_submit was called successfully
-
-    @pytest.mark.asyncio
-    async def test_sort_dialog_on_key_enter(self):
+    @pytest.mark.parametrize(
+        "mode_index, order_index, expected",
+        [
+            (1, 1, (SortMode.CREATED, SortOrder.DESCENDING)),
+            (None, None, (SortMode.NAME, SortOrder.ASCENDING)),
+        ],
+        ids=["selected", "defaults"],
+    )
+    async def test_sort_dialog_action_submit(self, mounted_sort_dialog, mode_index, order_index, expected):
+        """Test SortDialog action_submit with and without a radio selection."""
+        dialog, pilot = mounted_sort_dialog
+        dismissed = record_dismiss(dialog)
+
+        # Select radio buttons
+        radios = sort_dialog_radios(dialog)
+        if mode_index is not None:
+            radios.modes[mode_index].value = True
+        if order_index is not None:
+            radios.orders[order_index].value = True
+        await pilot.pause()
+
+        # Call action_submit; without a selection it should use the current values
+        dialog.action_submit()
+        assert dismissed == [expected]
+
+    async def test_sort_dialog_on_key_enter(self, mounted_sort_dialog):
         """Test SortDialog on_key enter handling."""
-        dialog = SortDialog(SortMode.NAME, SortOrder.ASCENDING)
-        app = FileBrowserApp()
+        dialog, pilot = mounted_sort_dialog
+        dismissed = record_dismiss(dialog)
 
-        async with app.run_test() as pilot:
-            app.mount(dialog)
-            await pilot.pause()
+        # Select radio button
+        radios = sort_dialog_radios(dialog).modes
+        radios[2].value = True  # Select ACCESSED
+        await pilot.pause()
 
-            # Set up radio buttons
-            mode_set = dialog.query_one("#sort-modes", RadioSet)
-            # Select radio button
-            radios = mode_set.query(RadioButton)
-            if len(radios) > 2:
-                radios[2].value = True  # Select ACCESSED
+        # Enter is left to the RadioSet focused on mount
+        dialog.on_key(events.Key("enter", None))
+        assert dismissed == []
 
-            # Press enter
-            await pilot.press("enter")
-            await pilot.pause()
+        # With focus outside the radio sets, enter submits the selection
+        dialog.set_focus(dialog.query_one("#ok-button", Button))
+        dialog.on_key(events.Key("enter", None))
+        assert dismissed == [(SortMode.ACCESSED, SortOrder.ASCENDING)]
 
-            # Dialog should have been dismissed after enter key
-            # The on_key handler was called
-            assert True
-
-    @pytest.mark.asyncio
-    async def test_all_sort_modes(self, temp_directory_with_varied_files):
+    async def test_all_sort_modes(self, temp_directory_with_varied_files_str):
         """Test all sort modes with CustomDirectoryTree."""
-        import time
-
-        app = FileBrowserApp(start_path=str(temp_directory_with_varied_files))
+        app = FileBrowserApp(start_path=temp_directory_with_varied_files_str)
 
         async with app.run_test() as pilot:
             tree = app.query_one(CustomDirectoryTree)
@@ -523,48 +611,26 @@ class TestSortDialogAdditional:
                 SortMode.EXTENSION,
             ]
 
+            # set_sort_mode is synchronous, so no frame needs to pass between modes
             for mode in sort_modes:
                 tree.set_sort_mode(mode)
-                await pilot.pause()
                 assert tree.tree_sort_mode == mode
 
-                # Verify tree is still functional
-                assert tree.root is not None
+            # Verify tree is still functional
+            await pilot.pause()
+            assert tree.root is not None
 
-    @pytest.mark.asyncio
-    async def test_populate_node_error_handling(self, monkeypatch):
+    async def test_populate_node_error_handling(self, temp_directory_str):
         """Test _populate_node OSError handling."""
-        from pathlib import Path
-
-        app = FileBrowserApp()
+        app = FileBrowserApp(temp_directory_str)
 
         async with app.run_test() as pilot:
             tree = app.query_one(CustomDirectoryTree)
 
-            # Create a mock node with children
-            from unittest.mock import Mock
-
-            mock_node = Mock()
-            mock_child = Mock()
-
-            # Create a mock path that raises OSError on stat()
-            mock_path = Mock(spec=Path)
-            mock_path.stat.side_effect = OSError("Permission denied")
-            mock_path.name = "test.txt"
-
-            # Mock child.data with path attribute
-            mock_child.data = Mock()
-            mock_child.data.path = mock_path
-            mock_child.label = "test.txt"
-            mock_node._children = [mock_child]
-
-            # Monkeypatch Path constructor to return our mock
-            def mock_path_constructor(path_str: Any) -> Any:
-                if "test.txt" in str(path_str):
-                    return mock_path
-                return Path(path_str)
-
-            monkeypatch.setattr("selectfilecli.file_browser_app.Path", mock_path_constructor)
+            # Create a stub node with one child whose path raises OSError on stat().
+            # _populate_node uses child.data.path as is, so no Path patching is needed.
+            mock_child = SimpleNamespace(data=SimpleNamespace(path=StatErrorPath()), label="test.txt")
+            mock_node = SimpleNamespace(_children=[mock_child])
 
             # Our CustomDirectoryTree._populate_node doesn't need the content parameter
             # Just verify it doesn't crash with OSError
@@ -577,10 +643,9 @@ class TestSortDialogAdditional:
             # Child should still be in the list
             assert len(mock_node._children) == 1
 
-    @pytest.mark.asyncio
-    async def test_set_sort_methods(self):
+    async def test_set_sort_methods(self, temp_directory_str):
         """Test set_sort_mode and set_sort_order methods."""
-        app = FileBrowserApp()
+        app = FileBrowserApp(temp_directory_str)
 
         async with app.run_test() as pilot:
             tree = app.query_one(CustomDirectoryTree)
@@ -593,78 +658,41 @@ class TestSortDialogAdditional:
             tree.set_sort_order(SortOrder.DESCENDING)
             assert tree.tree_sort_order == SortOrder.DESCENDING
 
-    @pytest.mark.asyncio
-    async def test_sort_dialog_no_selection(self):
-        """Test SortDialog action_submit with no selection."""
-        dialog = SortDialog(current_mode=SortMode.NAME, current_order=SortOrder.ASCENDING)
-        app = FileBrowserApp()
-
-        async with app.run_test() as pilot:
-            app.mount(dialog)
-            await pilot.pause()
-
-            # Don't select anything, just submit
-            dialog.action_submit()
-
-            # Should use current values
-            # The action_submit was called successfully
-            assert True
+    def test_custom_directory_tree_watch_path(self):
+        """Test CustomDirectoryTree keeps the watch_path coroutine of DirectoryTree."""
+        # watch_path is not overridden, so a path change still resets and reloads the tree
+        assert CustomDirectoryTree.watch_path is DirectoryTree.watch_path
+        assert inspect.iscoroutinefunction(CustomDirectoryTree.watch_path)
 
-    @pytest.mark.asyncio
-    async def test_custom_directory_tree_watch_path(self):
-        """Test CustomDirectoryTree watch_path method."""
-        app = FileBrowserApp()
-
-        async with app.run_test() as pilot:
-            tree = app.query_one(CustomDirectoryTree)
-
-            # The watch_path method is a coroutine in the parent class
-            # Our override just returns None
-            # Test that the method exists and is callable
-            assert hasattr(tree, "watch_path")
-            assert callable(tree.watch_path)
-
-    @pytest.mark.asyncio
-    async def test_on_radio_changed(self):
+    async def test_on_radio_changed(self, mounted_sort_dialog):
         """Test SortDialog on_radio_changed method."""
-        from textual.widgets import RadioSet
-
-        dialog = SortDialog(SortMode.NAME, SortOrder.ASCENDING)
-        app = FileBrowserApp()
-
-        async with app.run_test() as pilot:
-            app.mount(dialog)
-            await pilot.pause()
+        dialog, pilot = mounted_sort_dialog
 
-            # Trigger radio change event
-            mode_set = dialog.query_one("#sort-modes", RadioSet)
-            # Select radio button
-            radios = mode_set.query(RadioButton)
-            if len(radios) > 1:
-                radios[1].value = True
+        # Trigger radio change event
+        radios = sort_dialog_radios(dialog)
+        mode_set = radios.mode_set
+        # Select radio button
+        radios.modes[1].value = True
+        await pilot.pause()
 
-            # Create and post the event
-            event = RadioSet.Changed(mode_set, mode_set)
-            dialog.on_radio_changed(event)
+        # Create and post the event
+        event = RadioSet.Changed(mode_set, mode_set)
+        dialog.on_radio_changed(event)
 
-            # Method just passes, so we verify it doesn't crash
-            assert True
+        # The handler only lets the RadioSet track the selection; nothing is submitted
+        assert mode_set.pressed_index == 1
+        assert dialog.current_mode == SortMode.NAME
+        assert dialog.is_attached
 
-    @pytest.mark.asyncio
-    async def test_populate_node_with_non_directory(self):
+    async def test_populate_node_with_non_directory(self, temp_directory_str):
         """Test _populate_node with non-directory node."""
-        app = FileBrowserApp()
+        app = FileBrowserApp(temp_directory_str)
 
         async with app.run_test() as pilot:
             tree = app.query_one(CustomDirectoryTree)
 
-            # Create a mock node for a file (not a directory)
-            from unittest.mock import Mock
-
-            mock_node = Mock()
-            mock_node.data = Mock()
-            mock_node.data.path = Mock()
-            mock_node.data.path.is_dir.return_value = False
+            # Create a stub node for a file (not a directory)
+            mock_node = SimpleNamespace(data=SimpleNamespace(path=NonDirectoryPath()))
 
             # Call _populate_node on non-directory
             # It should return early without processing
@@ -679,10 +707,9 @@ class TestSortDialogAdditional:
             # The function returns early for non-directories
             assert result is None or result is None  # Either None was returned or exception was caught
 
-    @pytest.mark.asyncio
-    async def test_sort_dialog_result_handling(self):
+    async def test_sort_dialog_result_handling(self, temp_directory_str):
         """Test handling of sort dialog result in FileBrowserApp."""
-        app = FileBrowserApp()
+        app = FileBrowserApp(temp_directory_str)
 
         async with app.run_test() as pilot:
             # Open sort dialog and simulate a result
@@ -700,8 +727,7 @@ class TestSortDialogAdditional:
                 return
 
             # Select different sort options
-            mode_set = dialog.query_one("#sort-modes", RadioSet)
-            radios = mode_set.query(RadioButton)
+            radios = sort_dialog_radios(dialog).modes
             if len(radios) > 3:  # Select SIZE mode
                 radios[3].value = True
 
@@ -713,35 +739,9 @@ class TestSortDialogAdditional:
             tree = app.query_one(CustomDirectoryTree)
             assert tree.tree_sort_mode == SortMode.SIZE
 
-    @pytest.mark.asyncio
-    async def test_sort_dialog_action_submit_defaults(self):
-        """Test SortDialog action_submit with no radio selection (defaults)."""
-        app = FileBrowserApp()
-
-        async with app.run_test() as pilot:
-            dialog = SortDialog(SortMode.NAME, SortOrder.ASCENDING)
-            app.mount(dialog)
-            await pilot.pause()
-
-            # Mock the dismiss method to track the result
-            dismissed_result = None
-
-            def mock_dismiss(result: Any) -> None:
-                nonlocal dismissed_result
-                dismissed_result = result
-
-            dialog.dismiss = mock_dismiss
-
-            # Call action_submit without selecting any radio buttons
-            dialog.action_submit()
-
-            # Should use default values
-            assert dismissed_result == (SortMode.NAME, SortOrder.ASCENDING)
-
-    @pytest.mark.asyncio
-    async def test_unknown_sort_mode(self):
+    async def test_unknown_sort_mode(self, temp_directory_str):
         """Test _populate_node with unknown sort mode to hit default case."""
-        app = FileBrowserApp()
+        app = FileBrowserApp(temp_directory_str)
 
         async with app.run_test() as pilot:
             tree = app.query_one(CustomDirectoryTree)
@@ -752,64 +752,14 @@ class TestSortDialogAdditional:
             # Trigger sorting
             tree.refresh_sorting()
 
-            # Should not crash
-            assert True
-
-    @pytest.mark.asyncio
-    async def test_parent_navigation(self):
-        """Test navigating to parent directory."""
-        # Start from a subdirectory
-        test_subdir = Path.cwd() / "tests"
-        app = FileBrowserApp(str(test_subdir))
-
-        async with app.run_test() as pilot:
-            # Initial path should be the subdirectory
-            assert app.current_path == test_subdir.resolve()
-
-            # Navigate to parent
-            await pilot.press("u")
-            await pilot.pause(0.5)  # Give time for async operations
-
-            # Should be in parent directory now
-            assert app.current_path == test_subdir.parent.resolve()
+            # An unknown mode falls back to sorting by name, directories first
+            paths = [tree._get_path_from_node_data(child.data) for child in tree.root.children]
+            assert paths
+            assert paths == sorted(paths, key=lambda path: (not path.is_dir(), path.name.lower()))
 
-    @pytest.mark.asyncio
-    async def test_home_navigation(self):
-        """Test navigating to home directory."""
-        app = FileBrowserApp()
-
-        async with app.run_test() as pilot:
-            # Navigate to home
-            await pilot.press("h")
-            await pilot.pause(0.5)  # Give time for async operations
-
-            # Should be in home directory
-            assert app.current_path == Path.home()
-
-    @pytest.mark.asyncio
-    async def test_navigation_buttons(self):
-        """Test navigation button clicks."""
-        # Skip this test for now as button clicks aren't working properly in tests
-        pytest.skip("Navigation button clicks not working reliably in test environment")
-
-    @pytest.mark.asyncio
-    async def test_backspace_parent_navigation(self):
-        """Test using backspace to navigate to parent."""
-        test_subdir = Path.cwd() / "tests"
-        app = FileBrowserApp(str(test_subdir))
-
-        async with app.run_test() as pilot:
-            # Press backspace
-            await pilot.press("backspace")
-            await pilot.pause(0.5)  # Give time for async operations
-
-            # Should be in parent directory
-            assert app.current_path == test_subdir.parent.resolve()
-
-    @pytest.mark.asyncio
-    async def test_change_directory_invalid_path(self):
+    async def test_change_directory_invalid_path(self, temp_directory_str):
         """Test _change_directory with invalid path."""
-        app = FileBrowserApp()
+        app = FileBrowserApp(temp_directory_str)
 
         async with app.run_test() as pilot:
             # Store original path
@@ -822,39 +772,32 @@ class TestSortDialogAdditional:
             # Should remain in original directory
             assert app.current_path == original_path
 
-    @pytest.mark.asyncio
-    async def test_file_size_formatting(self):
+    @pytest.mark.parametrize(
+        "size, expected",
+        [
+            (0, ["0 B"]),
+            (500, ["500 B"]),
+            # 1023 might have thousand separator depending on locale
+            (1023, ["1023 B", "1,023 B", "1.023 B"]),
+            (1024, ["1.00 KB"]),
+            (1536, ["1.50 KB"]),
+            (1048576, ["1.00 MB"]),
+            (1073741824, ["1.00 GB"]),
+            (1099511627776, ["1.00 TB"]),
+        ],
+    )
+    def test_file_size_formatting(self, size, expected):
         """Test human-readable file size formatting."""
-        app = FileBrowserApp()
+        assert CustomDirectoryTree.format_file_size(size) in expected
 
-        async with app.run_test() as pilot:
-            tree = app.query_one(CustomDirectoryTree)
-
-            # Test various file sizes
-            assert tree.format_file_size(0) == "0 B"
-            assert tree.format_file_size(500) == "500 B"
-            # 1023 might have thousand separator depending on locale
-            size_1023 = tree.format_file_size(1023)
-            assert size_1023 in ["1023 B", "1,023 B", "1.023 B"]  # Different locales use different separators
-            assert tree.format_file_size(1024) == "1.00 KB"
-            assert tree.format_file_size(1536) == "1.50 KB"
-            assert tree.format_file_size(1048576) == "1.00 MB"
-            assert tree.format_file_size(1073741824) == "1.00 GB"
-            assert tree.format_file_size(1099511627776) == "1.00 TB"
-
-    @pytest.mark.asyncio
-    async def test_date_formatting(self):
+    async def test_date_formatting(self, temp_directory_str):
         """Test date formatting for different time ranges."""
-        app = FileBrowserApp()
+        app = FileBrowserApp(temp_directory_str)
 
         async with app.run_test() as pilot:
             tree = app.query_one(CustomDirectoryTree)
 
-            # Test with various timestamps
-            import time
-            from datetime import datetime, timedelta
-
-            # Today's date
+            # Test with various timestamps, starting with today's date
             today = datetime.now()
             today_timestamp = today.timestamp()
             today_str = tree.format_date(today_timestamp)
@@ -884,222 +827,233 @@ class TestSortDialogAdditional:
             parts = last_year_str.split()
             assert len(parts) == 2
 
-    @pytest.mark.asyncio
-    async def test_render_label_with_file_info(self):
+    async def test_render_label_with_file_info(self, tmp_path):
         """Test render_label displays file information correctly."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir)
+        test_dir = tmp_path
 
-            # Create test files
-            regular_file = test_dir / "test.txt"
-            regular_file.write_text("Hello world")
+        # Create test files
+        regular_file = test_dir / "test.txt"
+        regular_file.write_text("Hello world")
 
-            # Create a moderately sized file (100KB instead of 5MB)
-            large_file = test_dir / "large.bin"
-            large_file.write_bytes(b"x" * 102400)  # 100KB - much smaller to avoid memory issues
+        # Create a moderately sized file (100KB instead of 5MB)
+        large_file = test_dir / "large.bin"
+        large_file.write_bytes(b"x" * 102400)  # 100KB - much smaller to avoid memory issues
 
-            app = FileBrowserApp(str(test_dir))
+        app = FileBrowserApp(str(test_dir))
 
-            async with app.run_test() as pilot:
-                # Wait for the app to fully load
-                await pilot.pause(0.1)
-
-                # Expand the root node to load the files
-                tree = app.query_one(CustomDirectoryTree)
-                tree.root.expand()
-                await pilot.pause(0.2)  # Wait for expansion
-
-                # Find the actual nodes in the tree
-                regular_node = None
-                large_node = None
-
-                for child in tree.root.children:
-                    if child.data and hasattr(child.data, "path"):
-                        child_path = Path(child.data.path)
-                        if child_path.name == "test.txt":
-                            regular_node = child
-                        elif child_path.name == "large.bin":
-                            large_node = child
-
-                # Verify nodes were found
-                assert regular_node is not None, "Could not find test.txt node"
-                assert large_node is not None, "Could not find large.bin node"
-
-                # Test the rendered labels using the actual render_label method
-                from rich.style import Style
-
-                base_style = Style()
-                style = Style()
-
-                # Test regular file label
-                regular_label = tree.render_label(regular_node, base_style, style)
-                regular_text = regular_label.plain
-
-                # Should contain filename and size
-                assert "test.txt" in regular_text
-                assert "11 B" in regular_text  # "Hello world" is 11 bytes
-
-                # Test large file label
-                large_label = tree.render_label(large_node, base_style, style)
-                large_text = large_label.plain
-
-                # Should contain filename and size
-                assert "large.bin" in large_text
-                assert "100.00 KB" in large_text  # 100KB file
-
-    @pytest.mark.asyncio
-    async def test_render_label_symlink(self):
+        async with app.run_test() as pilot:
+            # Expand the root node to load the files
+            tree = app.query_one(CustomDirectoryTree)
+            tree.root.expand()
+            await wait_until(pilot, lambda: bool(tree.root.children))  # Wait for expansion
+
+            # Find the actual nodes in the tree
+            regular_node = None
+            large_node = None
+
+            for child in tree.root.children:
+                if child.data and hasattr(child.data, "path"):
+                    child_path = Path(child.data.path)
+                    if child_path.name == "test.txt":
+                        regular_node = child
+                    elif child_path.name == "large.bin":
+                        large_node = child
+
+            # Verify nodes were found
+            assert regular_node is not None, "Could not find test.txt node"
+            assert large_node is not None, "Could not find large.bin node"
+
+            # Test the rendered labels using the actual render_label method
+            base_style = Style()
+            style = Style()
+
+            # Test regular file label
+            regular_label = tree.render_label(regular_node, base_style, style)
+            regular_text = regular_label.plain
+
+            # Should contain filename and size
+            assert "test.txt" in regular_text
+            assert "11 B" in regular_text  # "Hello world" is 11 bytes
+
+            # Test large file label
+            large_label = tree.render_label(large_node, base_style, style)
+            large_text = large_label.plain
+
+            # Should contain filename and size
+            assert "large.bin" in large_text
+            assert "100.00 KB" in large_text  # 100KB file
+
+            # Rendering the same node again reuses the cached lstat and write access results
+            tree._stat_cache.clear()
+            tree._writable_cache.clear()
+            with patch("os.lstat", wraps=os.lstat) as lstat, patch("os.access", wraps=os.access) as access:
+                tree.render_label(regular_node, base_style, style)
+                tree.render_label(regular_node, base_style, style)
+            assert sum(call.args[0] == str(regular_file) for call in lstat.call_args_list) == 1
+            assert sum(call.args[0] == str(regular_file) for call in access.call_args_list) == 1
+
+            # The size of large.bin was formatted by its first render and is reused
+            with patch.object(CustomDirectoryTree, "format_file_size", wraps=CustomDirectoryTree.format_file_size) as format_size:
+                assert "100.00 KB" in tree.render_label(large_node, base_style, style).plain
+            assert format_size.call_count == 0
+
+    async def test_render_label_symlink(self, tmp_path):
         """Test render_label shows symlink emoji."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir)
-
-            # Create target and symlink
-            target = test_dir / "target.txt"
-            target.write_text("Target content")
-            symlink = test_dir / "link.txt"
-            symlink.symlink_to(target)
-
-            app = FileBrowserApp(str(test_dir))
-
-            async with app.run_test() as pilot:
-                await pilot.pause(0.1)
+        test_dir = tmp_path
 
-                # Expand the root node to load the files
-                tree = app.query_one(CustomDirectoryTree)
-                tree.root.expand()
-                await pilot.pause(0.2)  # Wait for expansion
+        # Create target and symlink
+        target = test_dir / "target.txt"
+        target.write_text("Target content")
+        symlink = test_dir / "link.txt"
+        symlink.symlink_to(target)
 
-                # Find the symlink node
-                symlink_node = None
-                for child in tree.root.children:
-                    if child.data and hasattr(child.data, "path"):
-                        child_path = Path(child.data.path)
-                        if child_path.name == "link.txt":
-                            symlink_node = child
-                            break
+        app = FileBrowserApp(str(test_dir))
 
-                assert symlink_node is not None, "Could not find link.txt node"
+        async with app.run_test() as pilot:
+            # Expand the root node to load the files
+            tree = app.query_one(CustomDirectoryTree)
+            tree.root.expand()
+            await wait_until(pilot, lambda: bool(tree.root.children))  # Wait for expansion
+
+            # Find the symlink node
+            symlink_node = None
+            for child in tree.root.children:
+                if child.data and hasattr(child.data, "path"):
+                    child_path = Path(child.data.path)
+                    if child_path.name == "link.txt":
+                        symlink_node = child
+                        break
 
-                # Test the rendered label
-                from rich.style import Style
+            assert symlink_node is not None, "Could not find link.txt node"
 
-                base_style = Style()
-                style = Style()
+            # Test the rendered label
+            base_style = Style()
+            style = Style()
 
-                label = tree.render_label(symlink_node, base_style, style)
-                label_text = label.plain
+            label = tree.render_label(symlink_node, base_style, style)
+            label_text = label.plain
 
-                # Should contain symlink suffix
-                assert "@" in label_text
-                assert "link.txt" in label_text
+            # Should contain symlink suffix
+            assert "@" in label_text
+            assert "link.txt" in label_text
 
-    @pytest.mark.asyncio
-    async def test_render_label_readonly(self):
+    async def test_render_label_readonly(self, tmp_path):
         """Test render_label shows lock emoji for read-only files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir)
+        test_dir = tmp_path
 
-            # Create read-only file
-            readonly_file = test_dir / "readonly.txt"
-            readonly_file.write_text("Read only")
-            readonly_file.chmod(0o444)  # Read-only
+        # Create read-only file
+        readonly_file = test_dir / "readonly.txt"
+        readonly_file.write_text("Read only")
+        readonly_file.chmod(0o444)  # Read-only
 
-            app = FileBrowserApp(str(test_dir))
+        app = FileBrowserApp(str(test_dir))
 
-            async with app.run_test() as pilot:
-                await pilot.pause(0.1)
+        async with app.run_test() as pilot:
+            # Expand the root node to load the files
+            tree = app.query_one(CustomDirectoryTree)
+            tree.root.expand()
+            await wait_until(pilot, lambda: bool(tree.root.children))  # Wait for expansion
+
+            # Find the readonly file node
+            readonly_node = None
+            for child in tree.root.children:
+                if child.data and hasattr(child.data, "path"):
+                    child_path = Path(child.data.path)
+                    if child_path.name == "readonly.txt":
+                        readonly_node = child
+                        break
 
-                # Expand the root node to load the files
-                tree = app.query_one(CustomDirectoryTree)
-                tree.root.expand()
-                await pilot.pause(0.2)  # Wait for expansion
+            assert readonly_node is not None, "Could not find readonly.txt node"
 
-                # Find the readonly file node
-                readonly_node = None
-                for child in tree.root.children:
-                    if child.data and hasattr(child.data, "path"):
-                        child_path = Path(child.data.path)
-                        if child_path.name == "readonly.txt":
-                            readonly_node = child
-                            break
+            # Test the rendered label
+            base_style = Style()
+            style = Style()
 
-                assert readonly_node is not None, "Could not find readonly.txt node"
+            label = tree.render_label(readonly_node, base_style, style)
+            label_text = label.plain
 
-                # Test the rendered label
-                from rich.style import Style
+            # Should contain lock emoji
+            assert "🔒" in label_text
+            assert "readonly.txt" in label_text
 
-                base_style = Style()
-                style = Style()
+            # Restore permissions for cleanup
+            readonly_file.chmod(0o644)
 
-                label = tree.render_label(readonly_node, base_style, style)
-                label_text = label.plain
+    async def test_render_label_directory(self, tmp_path):
+        """Test render_label for directories (no file size shown)."""
+        test_dir = tmp_path
 
-                # Should contain lock emoji
-                assert "🔒" in label_text
-                assert "readonly.txt" in label_text
+        # Create subdirectory
+        subdir = test_dir / "subdir"
+        subdir.mkdir()
 
-                # Restore permissions for cleanup
-                readonly_file.chmod(0o644)
+        app = FileBrowserApp(str(test_dir))
 
-    @pytest.mark.asyncio
-    async def test_render_label_directory(self):
-        """Test render_label for directories (no file size shown)."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir)
+        async with app.run_test() as pilot:
+            # Expand the root node to load the files
+            tree = app.query_one(CustomDirectoryTree)
+            tree.root.expand()
+            await wait_until(pilot, lambda: bool(tree.root.children))  # Wait for expansion
+
+            # Find the subdir node
+            subdir_node = None
+            for child in tree.root.children:
+                if child.data and hasattr(child.data, "path"):
+                    child_path = Path(child.data.path)
+                    if child_path.name == "subdir":
+                        subdir_node = child
+                        break
 
-            # Create subdirectory
-            subdir = test_dir / "subdir"
-            subdir.mkdir()
+            assert subdir_node is not None, "Could not find subdir node"
 
-            app = FileBrowserApp(str(test_dir))
+            # Test the rendered label
+            base_style = Style()
+            style = Style()
 
-            async with app.run_test() as pilot:
-                await pilot.pause(0.1)
+            label = tree.render_label(subdir_node, base_style, style)
+            label_text = label.plain
 
-                # Expand the root node to load the files
-                tree = app.query_one(CustomDirectoryTree)
-                tree.root.expand()
-                await pilot.pause(0.2)  # Wait for expansion
+            # Should contain directory name
+            assert "subdir" in label_text
+            # Should NOT contain file size (directories don't show size)
+            assert " B" not in label_text and " KB" not in label_text
 
-                # Find the subdir node
-                subdir_node = None
-                for child in tree.root.children:
-                    if child.data and hasattr(child.data, "path"):
-                        child_path = Path(child.data.path)
-                        if child_path.name == "subdir":
-                            subdir_node = child
-                            break
+            # One lstat of the directory tells everything, without a following stat
+            tree._stat_cache.clear()
+            with patch("os.lstat", wraps=os.lstat) as lstat, patch("os.stat", wraps=os.stat) as stat_call:
+                tree.render_label(subdir_node, base_style, style)
+            assert sum(call.args[0] == str(subdir) for call in lstat.call_args_list) == 1
+            assert str(subdir) not in [str(call.args[0]) for call in stat_call.call_args_list]
 
-                assert subdir_node is not None, "Could not find subdir node"
+    async def test_render_label_skips_hidden_date(self, tmp_path):
+        """Test render_label formats no date when the date column does not fit."""
+        (tmp_path / "notes.txt").write_text("notes")
 
-                # Test the rendered label
-                from rich.style import Style
+        app = FileBrowserApp(str(tmp_path))
 
-                base_style = Style()
-                style = Style()
+        # 60 columns leave too little room for the date column
+        async with app.run_test(size=(60, 24)) as pilot:
+            tree = app.query_one(CustomDirectoryTree)
+            tree.root.expand()
+            await wait_until(pilot, lambda: any(child.data for child in tree.root.children))
+            notes_node = next(child for child in tree.root.children if child.data)
 
-                label = tree.render_label(subdir_node, base_style, style)
-                label_text = label.plain
+            with patch.object(CustomDirectoryTree, "format_date", wraps=tree.format_date) as format_date:
+                label_text = tree.render_label(notes_node, Style(), Style()).plain
 
-                # Should contain directory name
-                assert "subdir" in label_text
-                # Should NOT contain file size (directories don't show size)
-                assert " B" not in label_text and " KB" not in label_text
+            assert "notes.txt" in label_text
+            assert "📆" not in label_text
+            assert format_date.call_count == 0
 
-    @pytest.mark.asyncio
-    async def test_render_label_permission_error(self):
+    async def test_render_label_permission_error(self, temp_directory_str):
         """Test render_label handles permission errors gracefully."""
-        app = FileBrowserApp()
+        app = FileBrowserApp(temp_directory_str)
 
         async with app.run_test() as pilot:
             tree = app.query_one(CustomDirectoryTree)
 
-            # Create mock node with path that will cause permission error
-            from unittest.mock import Mock
-
-            node = Mock()
-            node.data = Mock(path="/root/inaccessible")  # Path we can't access
-            node.parent = Mock()
+            # Create a stub node with a path that will cause a permission error
+            node = SimpleNamespace(data=SimpleNamespace(path="/root/inaccessible"), parent=SimpleNamespace())  # Path we can't access
 
             # Mock the super().render_label to return a simple label
             with patch.object(DirectoryTree, "render_label", return_value=Text("inaccessible")):
@@ -1111,20 +1065,22 @@ class TestSortDialogAdditional:
                 # Check that it has error styling (dim red)
                 assert label.style == "dim red"
 
-    @pytest.mark.asyncio
-    async def test_render_label_no_data(self):
+                # A second render does not retry the lstat that failed
+                with patch("os.lstat", wraps=os.lstat) as lstat:
+                    label = tree.render_label(node, None, None)
+                assert lstat.call_count == 0
+                assert label.plain == "inaccessible"
+                assert label.style == "dim red"
+
+    async def test_render_label_no_data(self, temp_directory_str):
         """Test render_label handles nodes without data."""
-        app = FileBrowserApp()
+        app = FileBrowserApp(temp_directory_str)
 
         async with app.run_test() as pilot:
             tree = app.query_one(CustomDirectoryTree)
 
-            # Create mock node without data
-            from unittest.mock import Mock
-
-            node = Mock()
-            node.data = None
-            node.parent = Mock()
+            # Create a stub node without data
+            node = SimpleNamespace(data=None, parent=SimpleNamespace())
 
             # When node has no data, should return "Unknown"
             label = tree.render_label(node, None, None)
@@ -1133,20 +1089,15 @@ class TestSortDialogAdditional:
             assert isinstance(label, Text)
             assert label.plain == "Unknown"
 
-    @pytest.mark.asyncio
-    async def test_render_label_root_node(self):
+    async def test_render_label_root_node(self, temp_directory_str):
         """Test render_label handles root nodes."""
-        app = FileBrowserApp()
+        app = FileBrowserApp(temp_directory_str)
 
         async with app.run_test() as pilot:
             tree = app.query_one(CustomDirectoryTree)
 
-            # Create mock root node (no parent)
-            from unittest.mock import Mock
-
-            node = Mock()
-            node.data = Mock(path="/some/path")
-            node.parent = None  # Root node
+            # Create a stub root node (no parent)
+            node = SimpleNamespace(data=SimpleNamespace(path="/some/path"), parent=None)  # Root node
 
             # Root node should call _render_root_label
             label = tree.render_label(node, None, None)
@@ -1156,22 +1107,16 @@ class TestSortDialogAdditional:
             # Root label should contain some directory information
             assert len(label.plain) > 0
 
-    @pytest.mark.asyncio
-    async def test_populate_node_attribute_error(self):
+    async def test_populate_node_attribute_error(self, temp_directory_str):
         """Test _populate_node AttributeError handling."""
-        app = FileBrowserApp()
+        app = FileBrowserApp(temp_directory_str)
 
         async with app.run_test() as pilot:
             tree = app.query_one(CustomDirectoryTree)
 
-            # Create a mock node with children that raise AttributeError
-            from unittest.mock import Mock
-
-            mock_node = Mock()
-            mock_child = Mock()
-            mock_child.data = None  # This will cause AttributeError when accessing .path
-            mock_child.label = "test"
-            mock_node._children = [mock_child]
+            # Create a stub node whose child has no data, so accessing .path raises AttributeError
+            mock_child = SimpleNamespace(data=None, label="test")
+            mock_node = SimpleNamespace(_children=[mock_child])
 
             # Should handle AttributeError gracefully
             try:
@@ -1183,214 +1128,251 @@ class TestSortDialogAdditional:
             # Child should still be in the list
             assert len(mock_node._children) == 1
 
+    async def test_populate_node_uses_scanned_stats(self, tmp_path):
+        """Test _populate_node takes the entry stats from the scandir pass."""
+        (tmp_path / "notes.txt").write_text("notes")
+        (tmp_path / "subdir").mkdir()
+
+        app = FileBrowserApp(str(tmp_path))
+
+        async with app.run_test() as pilot:
+            tree = app.query_one(CustomDirectoryTree)
+            tree.root.expand()
+            await wait_until(pilot, lambda: any(child.data for child in tree.root.children))
+
+            # Loading neither lstats nor stats the entries on top of the scandir pass
+            with patch("os.stat", wraps=os.stat) as stat_call, patch("os.lstat", wraps=os.lstat) as lstat:
+                content = await tree._load_directory(tree.root).wait()
+            entry_paths = {str(path) for path in content}
+            assert not any(str(call.args[0]) in entry_paths for call in stat_call.call_args_list + lstat.call_args_list)
+            assert [path.name for path in content] == ["subdir", "notes.txt"]
+            tree._stat_cache.clear()
+
+            # Populating from the loaded content needs no lstat call
+            with patch("os.lstat", wraps=os.lstat) as lstat:
+                tree._populate_node(tree.root, content)
+            assert lstat.call_count == 0
+
+            assert {child.data.path.name: child.allow_expand for child in tree.root.children} == {"notes.txt": False, "subdir": True}
+            assert set(tree._stat_cache) == entry_paths
+
+    async def test_reload_clears_path_caches(self, tmp_path):
+        """Test reloading the tree forgets the stats and write access cached for paths."""
+        (tmp_path / "notes.txt").write_text("notes")
+        gone = str(tmp_path / "gone.txt")
+
+        app = FileBrowserApp(str(tmp_path))
+
+        async with app.run_test() as pilot:
+            tree = app.query_one(CustomDirectoryTree)
+            tree.root.expand()
+            await wait_until(pilot, lambda: any(child.data for child in tree.root.children))
+
+            tree._stat_cache[gone] = None
+            tree._writable_cache[gone] = True
+
+            await tree.reload()
+
+            assert gone not in tree._stat_cache
+            assert gone not in tree._writable_cache
+
 
 # New comprehensive tests for all features
 class TestNewFeatures:
     """Test all new features added to the file browser."""
 
-    @pytest.mark.asyncio
-    async def test_folder_selection_mode(self) -> None:
+    async def test_folder_selection_mode(self, tmp_path: Path) -> None:
         """Test folder selection functionality."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir)
-            subdir = test_dir / "test_folder"
-            subdir.mkdir()
+        test_dir = tmp_path
+        subdir = test_dir / "test_folder"
+        subdir.mkdir()
 
-            app = FileBrowserApp(str(test_dir), select_files=False, select_dirs=True)
-            async with app.run_test() as pilot:
-                # Check subtitle shows folder selection info
-                assert "D to select dir" in pilot.app.sub_title
+        app = FileBrowserApp(str(test_dir), select_files=False, select_dirs=True)
+        async with app.run_test() as pilot:
+            # Check subtitle shows folder selection info
+            assert "D to select dir" in pilot.app.sub_title
 
-                # Navigate to subdirectory
-                await pilot.press("enter")  # Expand root
-                await pilot.pause()
-                await pilot.press("down")  # Navigate to test_folder
-                await pilot.pause()
+            # Navigate to subdirectory
+            await pilot.press("enter")  # Expand root
+            await pilot.pause()
+            await pilot.press("down")  # Navigate to test_folder
+            await pilot.pause()
 
-                # Select folder with 'd' key
-                await pilot.press("d")
-                await pilot.pause()
+            # Select folder with 'd' key
+            await pilot.press("d")
+            await pilot.pause()
 
-                # Check FileInfo was created correctly
-                assert pilot.app.selected_item is not None
-                assert isinstance(pilot.app.selected_item, FileInfo)
-                assert pilot.app.selected_item.folder_path is not None
-                assert pilot.app.selected_item.file_path is None
-                assert "test_folder" in str(pilot.app.selected_item.folder_path)
+            # Check FileInfo was created correctly
+            assert pilot.app.selected_item is not None
+            assert isinstance(pilot.app.selected_item, FileInfo)
+            assert pilot.app.selected_item.folder_path is not None
+            assert pilot.app.selected_item.file_path is None
+            assert "test_folder" in str(pilot.app.selected_item.folder_path)
 
-    @pytest.mark.asyncio
-    async def test_file_and_folder_selection(self) -> None:
+    async def test_file_and_folder_selection(self, tmp_path: Path) -> None:
         """Test when both files and folders can be selected."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir)
-            test_file = test_dir / "test.txt"
-            test_file.write_text("content")
+        test_dir = tmp_path
+        test_file = test_dir / "test.txt"
+        test_file.write_text("content")
 
-            app = FileBrowserApp(str(test_dir), select_files=True, select_dirs=True)
-            async with app.run_test() as pilot:
-                # Should show both options in subtitle
-                assert "files or folders" in pilot.app.sub_title
-                assert "D to select dir" in pilot.app.sub_title
+        app = FileBrowserApp(str(test_dir), select_files=True, select_dirs=True)
+        async with app.run_test() as pilot:
+            # Should show both options in subtitle
+            assert "files or folders" in pilot.app.sub_title
+            assert "D to select dir" in pilot.app.sub_title
 
-                # Can select current directory
-                await pilot.press("d")
-                await pilot.pause()
+            # Can select current directory
+            await pilot.press("d")
+            await pilot.pause()
 
-                assert pilot.app.selected_item is not None
-                assert pilot.app.selected_item.folder_path == test_dir
+            assert pilot.app.selected_item is not None
+            assert pilot.app.selected_item.folder_path == test_dir
 
-    @pytest.mark.asyncio
-    async def test_comprehensive_file_info(self) -> None:
+    async def test_comprehensive_file_info(self, tmp_path: Path) -> None:
         """Test FileInfo contains all expected information."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir)
+        test_dir = tmp_path
 
-            # Create various file types
-            regular_file = test_dir / "regular.txt"
-            regular_file.write_text("Hello World")
+        # Create various file types
+        regular_file = test_dir / "regular.txt"
+        regular_file.write_text("Hello World")
 
-            # Create symlink
-            link_target = test_dir / "target.txt"
-            link_target.write_text("Target")
-            symlink = test_dir / "link.txt"
-            symlink.symlink_to(link_target)
+        # Create symlink
+        link_target = test_dir / "target.txt"
+        link_target.write_text("Target")
+        symlink = test_dir / "link.txt"
+        symlink.symlink_to(link_target)
 
-            # Create broken symlink
-            broken_link = test_dir / "broken.txt"
-            broken_link.symlink_to(test_dir / "nonexistent.txt")
+        # Create broken symlink
+        broken_link = test_dir / "broken.txt"
+        broken_link.symlink_to(test_dir / "nonexistent.txt")
 
-            app = FileBrowserApp(str(test_dir), select_files=True)
-            async with app.run_test() as pilot:
-                # Test regular file
-                pilot.app._create_file_info(regular_file, is_file=True)
-                info = pilot.app.selected_item
-
-                assert info is not None
-                assert info.file_path == regular_file
-                assert info.folder_path is None
-                assert info.last_modified_datetime is not None
-                assert info.creation_datetime is not None
-                assert info.size_in_bytes == 11  # "Hello World"
-                assert info.readonly is not None
-                assert info.is_symlink is False
-                assert info.symlink_broken is False
-
-                # Test symlink
-                pilot.app._create_file_info(symlink, is_file=True)
-                info = pilot.app.selected_item
-                assert info.is_symlink is True
-                assert info.symlink_broken is False
-
-                # Test broken symlink
-                pilot.app._create_file_info(broken_link, is_file=True)
-                info = pilot.app.selected_item
-                assert info.is_symlink is True
-                assert info.symlink_broken is True
-
-    @pytest.mark.asyncio
-    async def test_venv_detection_and_caching(self) -> None:
+        app = FileBrowserApp(str(test_dir), select_files=True)
+        async with app.run_test() as pilot:
+            # Test regular file
+            pilot.app._create_file_info(regular_file, is_file=True)
+            info = pilot.app.selected_item
+
+            assert info is not None
+            assert info.file_path == regular_file
+            assert info.folder_path is None
+            assert info.last_modified_datetime is not None
+            assert info.creation_datetime is not None
+            assert info.size_in_bytes == 11  # "Hello World"
+            assert info.readonly is not None
+            assert info.is_symlink is False
+            assert info.symlink_broken is False
+
+            # Test symlink
+            pilot.app._create_file_info(symlink, is_file=True)
+            info = pilot.app.selected_item
+            assert info.is_symlink is True
+            assert info.symlink_broken is False
+
+            # Test broken symlink
+            pilot.app._create_file_info(broken_link, is_file=True)
+            info = pilot.app.selected_item
+            assert info.is_symlink is True
+            assert info.symlink_broken is True
+
+    async def test_venv_detection_and_caching(self, tmp_path: Path) -> None:
         """Test virtual environment detection with caching."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir)
-
-            # Create venv structure
-            venv_dir = test_dir / "my_venv"
-            venv_dir.mkdir()
-            (venv_dir / "pyvenv.cfg").write_text("home = /usr/local/bin")
-            (venv_dir / "bin").mkdir()
-            (venv_dir / "bin" / "activate").write_text("# activate")
-
-            # Create Windows venv structure
-            win_venv = test_dir / "win_venv"
-            win_venv.mkdir()
-            (win_venv / "Scripts").mkdir()
-            (win_venv / "Scripts" / "activate.bat").write_text("REM activate")
-
-            app = FileBrowserApp(str(test_dir))
-            async with app.run_test() as pilot:
-                tree = pilot.app.query_one(CustomDirectoryTree)
+        test_dir = tmp_path
+
+        # Create venv structure
+        venv_dir = test_dir / "my_venv"
+        venv_dir.mkdir()
+        (venv_dir / "pyvenv.cfg").write_text("home = /usr/local/bin")
+        (venv_dir / "bin").mkdir()
+        (venv_dir / "bin" / "activate").write_text("# activate")
+
+        # Create Windows venv structure
+        win_venv = test_dir / "win_venv"
+        win_venv.mkdir()
+        (win_venv / "Scripts").mkdir()
+        (win_venv / "Scripts" / "activate.bat").write_text("REM activate")
+
+        app = FileBrowserApp(str(test_dir))
+        async with app.run_test() as pilot:
+            tree = pilot.app.query_one(CustomDirectoryTree)
 
-                # Test Unix venv
-                assert tree.has_venv(venv_dir) is True
-                # Check it's cached
-                assert str(venv_dir) in tree._venv_cache
-                assert tree._venv_cache[str(venv_dir)] is True
+            # Test Unix venv
+            assert tree.has_venv(venv_dir) is True
+            # Check it's cached
+            assert str(venv_dir) in tree._venv_cache
+            assert tree._venv_cache[str(venv_dir)] is True
 
-                # Test Windows venv
-                assert tree.has_venv(win_venv) is True
-                assert str(win_venv) in tree._venv_cache
+            # Test Windows venv
+            assert tree.has_venv(win_venv) is True
+            assert str(win_venv) in tree._venv_cache
 
-                # Test non-venv
-                assert tree.has_venv(test_dir) is False
-                assert str(test_dir) in tree._venv_cache
-                assert tree._venv_cache[str(test_dir)] is False
+            # Test non-venv
+            assert tree.has_venv(test_dir) is False
+            assert str(test_dir) in tree._venv_cache
+            assert tree._venv_cache[str(test_dir)] is False
 
-                # Test FileInfo includes venv info for folders
-                pilot.app._create_file_info(venv_dir, is_file=False)
-                info = pilot.app.selected_item
-                assert info.folder_has_venv is True
+            # Test FileInfo includes venv info for folders
+            pilot.app._create_file_info(venv_dir, is_file=False)
+            info = pilot.app.selected_item
+            assert info.folder_has_venv is True
 
-    @pytest.mark.asyncio
-    async def test_ls_style_visual_cues(self) -> None:
+    async def test_ls_style_visual_cues(self, tmp_path: Path) -> None:
         """Test ls-style colors and suffixes."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir)
+        test_dir = tmp_path
 
-            # Create different file types
-            exec_file = test_dir / "script.sh"
-            exec_file.write_text("#!/bin/bash\necho test")
-            exec_file.chmod(0o755)
+        # Create different file types
+        exec_file = test_dir / "script.sh"
+        exec_file.write_text("#!/bin/bash\necho test")
+        exec_file.chmod(0o755)
 
-            directory = test_dir / "folder"
-            directory.mkdir()
+        directory = test_dir / "folder"
+        directory.mkdir()
 
-            archive = test_dir / "archive.tar.gz"
-            archive.write_text("compressed")
+        archive = test_dir / "archive.tar.gz"
+        archive.write_text("compressed")
 
-            image = test_dir / "photo.jpg"
-            image.write_text("image data")
+        image = test_dir / "photo.jpg"
+        image.write_text("image data")
 
-            video = test_dir / "movie.mp4"
-            video.write_text("video data")
+        video = test_dir / "movie.mp4"
+        video.write_text("video data")
 
-            app = FileBrowserApp(str(test_dir))
-            async with app.run_test() as pilot:
-                tree = pilot.app.query_one(CustomDirectoryTree)
+        app = FileBrowserApp(str(test_dir))
+        async with app.run_test() as pilot:
+            tree = pilot.app.query_one(CustomDirectoryTree)
 
-                # Test executable
-                stat = exec_file.lstat()
-                color, suffix = tree.get_file_color_and_suffix(exec_file, stat)
-                assert color == "bright_green"
-                assert suffix == "*"
-
-                # Test directory
-                stat = directory.lstat()
-                color, suffix = tree.get_file_color_and_suffix(directory, stat)
-                assert color == "bright_blue"
-                assert suffix == "/"
-
-                # Test archive
-                stat = archive.lstat()
-                color, suffix = tree.get_file_color_and_suffix(archive, stat)
-                assert color == "bright_red"
-                assert suffix == ""
-
-                # Test image
-                stat = image.lstat()
-                color, suffix = tree.get_file_color_and_suffix(image, stat)
-                assert color == "magenta"
-                assert suffix == ""
-
-                # Test video
-                stat = video.lstat()
-                color, suffix = tree.get_file_color_and_suffix(video, stat)
-                assert color == "bright_magenta"
-                assert suffix == ""
-
-    @pytest.mark.asyncio
-    async def test_filename_quoting(self) -> None:
+            # Test executable
+            stat = exec_file.lstat()
+            color, suffix = tree.get_file_color_and_suffix(exec_file, stat)
+            assert color == "bright_green"
+            assert suffix == "*"
+
+            # Test directory
+            stat = directory.lstat()
+            color, suffix = tree.get_file_color_and_suffix(directory, stat)
+            assert color == "bright_blue"
+            assert suffix == "/"
+
+            # Test archive
+            stat = archive.lstat()
+            color, suffix = tree.get_file_color_and_suffix(archive, stat)
+            assert color == "bright_red"
+            assert suffix == ""
+
+            # Test image
+            stat = image.lstat()
+            color, suffix = tree.get_file_color_and_suffix(image, stat)
+            assert color == "magenta"
+            assert suffix == ""
+
+            # Test video
+            stat = video.lstat()
+            color, suffix = tree.get_file_color_and_suffix(video, stat)
+            assert color == "bright_magenta"
+            assert suffix == ""
+
+    async def test_filename_quoting(self, temp_directory_str: str) -> None:
         """Test filename quoting for special characters."""
-        app = FileBrowserApp()
+        app = FileBrowserApp(temp_directory_str)
         async with app.run_test() as pilot:
             tree = pilot.app.query_one(CustomDirectoryTree)
 
@@ -1413,10 +1395,9 @@ class TestNewFeatures:
                 quoted = tree.format_filename_with_quotes(filename)
                 assert quoted.startswith('"') and quoted.endswith('"')
 
-    @pytest.mark.asyncio
-    async def test_file_size_formatting_locale(self) -> None:
+    async def test_file_size_formatting_locale(self, temp_directory_str: str) -> None:
         """Test locale-aware file size formatting."""
-        app = FileBrowserApp()
+        app = FileBrowserApp(temp_directory_str)
         async with app.run_test() as pilot:
             tree = pilot.app.query_one(CustomDirectoryTree)
 
@@ -1443,15 +1424,12 @@ class TestNewFeatures:
             assert "TB" in tree.format_file_size(3 * 1024 * 1024 * 1024 * 1024)
             assert "PB" in tree.format_file_size(4 * 1024 * 1024 * 1024 * 1024 * 1024)
 
-    @pytest.mark.asyncio
-    async def test_date_formatting_with_emojis(self) -> None:
+    async def test_date_formatting_with_emojis(self, temp_directory_str: str) -> None:
         """Test fixed date format with emojis."""
-        app = FileBrowserApp()
+        app = FileBrowserApp(temp_directory_str)
         async with app.run_test() as pilot:
             tree = pilot.app.query_one(CustomDirectoryTree)
 
-            from datetime import datetime
-
             now = datetime.now()
             timestamp = now.timestamp()
 
@@ -1488,142 +1466,132 @@ class TestNewFeatures:
             assert len(second) == 2
 
     @pytest.mark.skip(reason="Navigation button clicks not working reliably in test environment")
-    @pytest.mark.asyncio
-    async def test_navigation_buttons_complete(self) -> None:
+    async def test_navigation_buttons_complete(self, tmp_path: Path) -> None:
         """Test all navigation buttons work correctly."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir)
-            subdir = test_dir / "subdir"
-            subdir.mkdir()
+        test_dir = tmp_path
+        subdir = test_dir / "subdir"
+        subdir.mkdir()
 
-            app = FileBrowserApp(str(subdir))
-            async with app.run_test() as pilot:
-                # Check button labels have emojis and underlines
-                parent_btn = pilot.app.query_one("#parent-button", Button)
-                home_btn = pilot.app.query_one("#home-button", Button)
-                root_btn = pilot.app.query_one("#root-button", Button)
-
-                # Check button labels contain the emoji and text
-                # The label is rendered content, not raw markup
-                assert "🔼" in str(parent_btn.label)  # Up arrow emoji
-                assert "Parent" in str(parent_btn.label)  # Contains "Parent" text
-
-                assert "🏠" in str(home_btn.label)  # House emoji
-                assert "Home" in str(home_btn.label)  # Contains "Home" text
-
-                assert "⏫" in str(root_btn.label)  # Up double arrow emoji
-                assert "Root" in str(root_btn.label)  # Contains "Root" text
-
-                # Test parent button click
-                initial_path = pilot.app.current_path
-                await pilot.click(parent_btn)
-                await pilot.pause(0.5)  # Give more time for navigation
-                # Should navigate to parent directory
-                assert pilot.app.current_path == initial_path.parent
-
-                # Test home button click
-                await pilot.click(home_btn)
-                await pilot.pause()
-                assert pilot.app.current_path == Path.home()
+        app = FileBrowserApp(str(subdir))
+        async with app.run_test() as pilot:
+            # Check button labels have emojis and underlines
+            parent_btn = pilot.app.query_one("#parent-button", Button)
+            home_btn = pilot.app.query_one("#home-button", Button)
+            root_btn = pilot.app.query_one("#root-button", Button)
+
+            # Check button labels contain the emoji and text
+            # The label is rendered content, not raw markup
+            assert "🔼" in str(parent_btn.label)  # Up arrow emoji
+            assert "Parent" in str(parent_btn.label)  # Contains "Parent" text
+
+            assert "🏠" in str(home_btn.label)  # House emoji
+            assert "Home" in str(home_btn.label)  # Contains "Home" text
+
+            assert "⏫" in str(root_btn.label)  # Up double arrow emoji
+            assert "Root" in str(root_btn.label)  # Contains "Root" text
+
+            # Test parent button click
+            initial_path = pilot.app.current_path
+            await pilot.click(parent_btn)
+            await wait_until(pilot, lambda: pilot.app.current_path == initial_path.parent and not pilot.app._is_navigating)
+            # Should navigate to parent directory
+            assert pilot.app.current_path == initial_path.parent
+
+            # Test home button click
+            await pilot.click(home_btn)
+            await pilot.pause()
+            assert pilot.app.current_path == Path.home()
 
-                # Test root button click
-                await pilot.click(root_btn)
-                await pilot.pause()
-                if os.name == "nt":
-                    assert str(pilot.app.current_path).endswith(":\\")
-                else:
-                    assert pilot.app.current_path == Path("/")
+            # Test root button click
+            await pilot.click(root_btn)
+            await pilot.pause()
+            if os.name == "nt":
+                assert str(pilot.app.current_path).endswith(":\\")
+            else:
+                assert pilot.app.current_path == Path("/")
 
-    @pytest.mark.asyncio
-    async def test_sort_dialog_buttons_complete(self) -> None:
+    async def test_sort_dialog_buttons_complete(self, tmp_path: Path) -> None:
         """Test sort dialog button interactions."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir)
+        test_dir = tmp_path
 
-            # Create files to sort
-            for i, name in enumerate(["aaa.txt", "zzz.txt", "mmm.txt"]):
-                f = test_dir / name
-                f.write_text("x" * (i + 1) * 100)
+        # Create files to sort
+        for i, name in enumerate(["aaa.txt", "zzz.txt", "mmm.txt"]):
+            f = test_dir / name
+            f.write_text("x" * (i + 1) * 100)
 
-            app = FileBrowserApp(str(test_dir))
-            async with app.run_test() as pilot:
-                # Record initial sort mode
-                initial_mode = pilot.app.current_sort_mode
-                assert initial_mode == SortMode.NAME  # Default
+        app = FileBrowserApp(str(test_dir))
+        async with app.run_test() as pilot:
+            # Record initial sort mode
+            initial_mode = pilot.app.current_sort_mode
+            assert initial_mode == SortMode.NAME  # Default
 
-                # Open sort dialog
-                await pilot.press("s")
-                await pilot.pause(0.2)
+            # Open sort dialog
+            await pilot.press("s")
+            await wait_until(pilot, lambda: isinstance(pilot.app.screen, SortDialog))
 
-                dialog = pilot.app.screen_stack[-1]
-                assert isinstance(dialog, SortDialog)
+            dialog = pilot.app.screen_stack[-1]
+            assert isinstance(dialog, SortDialog)
 
-                # Get radio sets
-                mode_set = dialog.query_one("#sort-modes", RadioSet)
-                order_set = dialog.query_one("#sort-order", RadioSet)
+            # Get radio sets
+            radios = sort_dialog_radios(dialog)
 
-                # Check that radio sets exist
-                assert mode_set is not None
-                assert order_set is not None
+            # Check that radio sets exist
+            assert radios.mode_set is not None
+            assert radios.order_set is not None
 
-                # Check radio buttons count
-                mode_radios = mode_set.query(RadioButton)
-                order_radios = order_set.query(RadioButton)
-                assert len(mode_radios) == 6  # All sort modes
-                assert len(order_radios) == 2  # Ascending and Descending
+            # Check radio buttons count
+            assert len(radios.modes) == 6  # All sort modes
+            assert len(radios.orders) == 2  # Ascending and Descending
 
-                # Cancel dialog first
-                await pilot.press("escape")
-                await pilot.pause(0.2)
+            # Cancel dialog first
+            await pilot.press("escape")
+            await wait_until(pilot, lambda: not isinstance(pilot.app.screen, SortDialog))
 
-                # Sort mode should remain unchanged
-                assert pilot.app.current_sort_mode == initial_mode
+            # Sort mode should remain unchanged
+            assert pilot.app.current_sort_mode == initial_mode
 
-    @pytest.mark.asyncio
-    async def test_root_node_display(self) -> None:
+    async def test_root_node_display(self, tmp_path: Path) -> None:
         """Test root node shows directory info."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir)
+        test_dir = tmp_path
 
-            # Create a venv in the directory
-            (test_dir / "pyvenv.cfg").write_text("home = /usr/local/bin")
+        # Create a venv in the directory
+        (test_dir / "pyvenv.cfg").write_text("home = /usr/local/bin")
 
-            # Make directory read-only (on Unix)
-            if os.name != "nt":
-                test_dir.chmod(0o555)
+        # Make directory read-only (on Unix)
+        if os.name != "nt":
+            test_dir.chmod(0o555)
 
-            try:
-                app = FileBrowserApp(str(test_dir))
-                async with app.run_test() as pilot:
-                    tree = pilot.app.query_one(CustomDirectoryTree)
+        try:
+            app = FileBrowserApp(str(test_dir))
+            async with app.run_test() as pilot:
+                tree = pilot.app.query_one(CustomDirectoryTree)
 
-                    # Get root node label
-                    root_label = tree._render_root_label()
-                    label_text = root_label.plain
+                # Get root node label
+                root_label = tree._render_root_label()
+                label_text = root_label.plain
 
-                    # Should contain directory name with slash
-                    assert test_dir.name in label_text
-                    assert "/" in label_text
+                # Should contain directory name with slash
+                assert test_dir.name in label_text
+                assert "/" in label_text
 
-                    # Should show venv indicator
-                    assert "✨" in label_text
+                # Should show venv indicator
+                assert "✨" in label_text
 
-                    # Should show read-only indicator on Unix
-                    if os.name != "nt":
-                        assert "🔒" in label_text
+                # Should show read-only indicator on Unix
+                if os.name != "nt":
+                    assert "🔒" in label_text
 
-                    # Should show directory size (not <DIR> for root node)
-                    assert " B" in label_text or " KB" in label_text  # Has size with unit
+                # Should show directory size (not <DIR> for root node)
+                assert " B" in label_text or " KB" in label_text  # Has size with unit
 
-                    # Should show date with emojis
-                    assert "📆" in label_text
-                    assert "🕚" in label_text
-            finally:
-                # Restore permissions
-                if os.name != "nt":
-                    test_dir.chmod(0o755)
+                # Should show date with emojis
+                assert "📆" in label_text
+                assert "🕚" in label_text
+        finally:
+            # Restore permissions
+            if os.name != "nt":
+                test_dir.chmod(0o755)
 
-    @pytest.mark.asyncio
     async def test_windows_drive_fallback(self) -> None:
         """Test Windows drive navigation fallback."""
         if os.name != "nt":
@@ -1647,53 +1615,45 @@ class TestNewFeatures:
                     # but the code path is exercised
                     assert True  # Code executed without error
 
-    @pytest.mark.asyncio
-    async def test_backward_compatibility(self) -> None:
+    def test_backward_compatibility(self, tmp_path: Path) -> None:
         """Test backward compatibility with string return."""
-        from selectfilecli import select_file
-        import warnings
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir)
-            test_file = test_dir / "test.txt"
-            test_file.write_text("content")
-
-            # Mock the app to return FileInfo
-            class MockApp:
-                def __init__(self, start_path: str, select_files: bool, select_dirs: bool):
-                    self.start_path = start_path
-                    self.select_files = select_files
-                    self.select_dirs = select_dirs
-
-                def run(self) -> FileInfo:
-                    return FileInfo(file_path=test_file, size_in_bytes=7, readonly=False)
-
-            with patch("selectfilecli.file_browser_app.FileBrowserApp", MockApp):
-                # Test backward compatible mode (returns string with warning)
-                with warnings.catch_warnings(record=True) as w:
-                    warnings.simplefilter("always")
-
-                    result = select_file(str(test_dir), select_files=True, select_dirs=False)
-
-                    # Should return string path
-                    assert isinstance(result, str)
-                    assert result == str(test_file)
-
-                    # Should issue deprecation warning
-                    assert len(w) == 1
-                    assert issubclass(w[0].category, DeprecationWarning)
-                    assert "string paths is deprecated" in str(w[0].message)
-
-                # Test new mode (returns FileInfo)
-                result = select_file(str(test_dir), select_files=True, select_dirs=True)
-                assert isinstance(result, FileInfo)
-                assert result.file_path == test_file
-
-    @pytest.mark.asyncio
-    async def test_file_info_tuple_unpacking(self) -> None:
-        """Test FileInfo can be unpacked as tuple."""
-        from datetime import datetime
+        test_dir = tmp_path
+        test_file = test_dir / "test.txt"
+        test_file.write_text("content")
 
+        # Mock the app to return FileInfo
+        class MockApp:
+            def __init__(self, start_path: str, select_files: bool, select_dirs: bool):
+                self.start_path = start_path
+                self.select_files = select_files
+                self.select_dirs = select_dirs
+
+            def run(self) -> FileInfo:
+                return FileInfo(file_path=test_file, size_in_bytes=7, readonly=False)
+
+        with patch("selectfilecli.file_browser_app.FileBrowserApp", MockApp):
+            # Test backward compatible mode (returns string with warning)
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter("always")
+
+                result = select_file(str(test_dir), select_files=True, select_dirs=False)
+
+                # Should return string path
+                assert isinstance(result, str)
+                assert result == str(test_file)
+
+                # Should issue deprecation warning
+                assert len(w) == 1
+                assert issubclass(w[0].category, DeprecationWarning)
+                assert "string paths is deprecated" in str(w[0].message)
+
+            # Test new mode (returns FileInfo)
+            result = select_file(str(test_dir), select_files=True, select_dirs=True)
+            assert isinstance(result, FileInfo)
+            assert result.file_path == test_file
+
+    def test_file_info_tuple_unpacking(self) -> None:
+        """Test FileInfo can be unpacked as tuple."""
         info = FileInfo(file_path=Path("/test/file.txt"), folder_path=None, last_modified_datetime=datetime.now(), creation_datetime=datetime.now(), size_in_bytes=1024, readonly=False, folder_has_venv=None, is_symlink=False, symlink_broken=False, error_message=None)
 
         # Test unpacking
@@ -1716,183 +1676,175 @@ class TestNewFeatures:
         assert len(t) == 10
         assert t[0] == Path("/test/file.txt")
 
-    @pytest.mark.asyncio
-    async def test_file_info_error_handling(self) -> None:
+    async def test_file_info_error_handling(self, tmp_path: Path) -> None:
         """Test FileInfo error_message population on file access errors."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir)
+        test_dir = tmp_path
 
-            # Create a file with no read permissions
-            protected_file = test_dir / "protected.txt"
-            protected_file.write_text("secret")
-            os.chmod(protected_file, 0o000)
+        # Create a file with no read permissions
+        protected_file = test_dir / "protected.txt"
+        protected_file.write_text("secret")
+        os.chmod(protected_file, 0o000)
 
+        try:
+            app = FileBrowserApp(str(tmp_path))
+            async with app.run_test() as pilot:
+                # Mock the _create_file_info to trigger an error
+                with patch.object(Path, "lstat", side_effect=PermissionError("Permission denied")):
+                    pilot.app._create_file_info(protected_file, is_file=True)
+
+                    # Check that FileInfo has error_message populated
+                    result = pilot.app.selected_item
+                    assert isinstance(result, FileInfo)
+                    assert result.error_message == "Permission denied"
+                    assert result.file_path == protected_file
+                    assert result.folder_path is None
+                    # Other fields should be None when error occurs
+                    assert result.last_modified_datetime is None
+                    assert result.size_in_bytes is None
+                    assert result.readonly is None
+        finally:
+            # Restore permissions for cleanup
             try:
-                app = FileBrowserApp()
-                async with app.run_test() as pilot:
-                    # Mock the _create_file_info to trigger an error
-                    with patch.object(Path, "lstat", side_effect=PermissionError("Permission denied")):
-                        pilot.app._create_file_info(protected_file, is_file=True)
-
-                        # Check that FileInfo has error_message populated
-                        result = pilot.app.selected_item
-                        assert isinstance(result, FileInfo)
-                        assert result.error_message == "Permission denied"
-                        assert result.file_path == protected_file
-                        assert result.folder_path is None
-                        # Other fields should be None when error occurs
-                        assert result.last_modified_datetime is None
-                        assert result.size_in_bytes is None
-                        assert result.readonly is None
-            finally:
-                # Restore permissions for cleanup
-                try:
-                    os.chmod(protected_file, 0o644)
-                except (OSError, PermissionError):
-                    pass
-
-    @pytest.mark.asyncio
-    async def test_recursive_directory_size(self) -> None:
+                os.chmod(protected_file, 0o644)
+            except (OSError, PermissionError):
+                pass
+
+    async def test_recursive_directory_size(self, tmp_path: Path) -> None:
         """Test recursive directory size calculation."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir)
+        test_dir = tmp_path
 
-            # Create nested directory structure with files
-            subdir1 = test_dir / "subdir1"
-            subdir1.mkdir()
-            (subdir1 / "file1.txt").write_text("x" * 100)  # 100 bytes
+        # Create nested directory structure with files
+        subdir1 = test_dir / "subdir1"
+        subdir1.mkdir()
+        (subdir1 / "file1.txt").write_text("x" * 100)  # 100 bytes
 
-            subdir2 = subdir1 / "subdir2"
-            subdir2.mkdir()
-            (subdir2 / "file2.txt").write_text("y" * 200)  # 200 bytes
-            (subdir2 / "file3.txt").write_text("z" * 300)  # 300 bytes
+        subdir2 = subdir1 / "subdir2"
+        subdir2.mkdir()
+        (subdir2 / "file2.txt").write_text("y" * 200)  # 200 bytes
+        (subdir2 / "file3.txt").write_text("z" * 300)  # 300 bytes
 
-            # Root level file
-            (test_dir / "root.txt").write_text("a" * 50)  # 50 bytes
+        # Root level file
+        (test_dir / "root.txt").write_text("a" * 50)  # 50 bytes
 
-            app = FileBrowserApp(str(test_dir))
-            async with app.run_test() as pilot:
-                tree = pilot.app.query_one(CustomDirectoryTree)
+        app = FileBrowserApp(str(test_dir))
+        async with app.run_test() as pilot:
+            tree = pilot.app.query_one(CustomDirectoryTree)
 
-                # Test recursive size calculation
-                total_size = tree.calculate_directory_size(test_dir)
-                assert total_size == 650  # 100 + 200 + 300 + 50
+            # Test recursive size calculation
+            total_size = tree.calculate_directory_size(test_dir)
+            assert total_size == 650  # 100 + 200 + 300 + 50
 
-                # Test caching
-                assert str(test_dir) in tree._dir_size_cache
-                assert tree._dir_size_cache[str(test_dir)] == 650
+            # Test caching
+            assert str(test_dir) in tree._dir_size_cache
+            assert tree._dir_size_cache[str(test_dir)] == 650
 
-                # Test subdirectory size
-                subdir1_size = tree.calculate_directory_size(subdir1)
-                assert subdir1_size == 600  # 100 + 200 + 300
+            # Test subdirectory size
+            subdir1_size = tree.calculate_directory_size(subdir1)
+            assert subdir1_size == 600  # 100 + 200 + 300
 
-                # Test root node display shows size
-                root_label = tree._render_root_label()
-                label_text = root_label.plain
+            # Test root node display shows size
+            root_label = tree._render_root_label()
+            label_text = root_label.plain
 
-                # Should contain size (650 B)
-                assert "650 B" in label_text
+            # Should contain size (650 B)
+            assert "650 B" in label_text
 
-    @pytest.mark.asyncio
-    async def test_directory_size_with_permissions(self) -> None:
+    async def test_directory_size_with_permissions(self, tmp_path: Path) -> None:
         """Test directory size calculation handles permission errors."""
         if os.name == "nt":
             pytest.skip("Unix-specific permission test")
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir)
+        test_dir = tmp_path
 
-            # Create accessible directory
-            accessible = test_dir / "accessible"
-            accessible.mkdir()
-            (accessible / "file.txt").write_text("test" * 25)  # 100 bytes
+        # Create accessible directory
+        accessible = test_dir / "accessible"
+        accessible.mkdir()
+        (accessible / "file.txt").write_text("test" * 25)  # 100 bytes
 
-            # Create inaccessible directory
-            restricted = test_dir / "restricted"
-            restricted.mkdir()
-            (restricted / "secret.txt").write_text("secret" * 10)  # 60 bytes
+        # Create inaccessible directory
+        restricted = test_dir / "restricted"
+        restricted.mkdir()
+        (restricted / "secret.txt").write_text("secret" * 10)  # 60 bytes
 
-            # Remove read permission
-            restricted.chmod(0o000)
+        # Remove read permission
+        restricted.chmod(0o000)
 
-            try:
-                app = FileBrowserApp(str(test_dir))
-                async with app.run_test() as pilot:
-                    tree = pilot.app.query_one(CustomDirectoryTree)
-
-                    # Should calculate size of accessible files only
-                    total_size = tree.calculate_directory_size(test_dir)
-                    assert total_size == 100  # Only accessible/file.txt
-
-                    # Restricted directory should return 0
-                    restricted_size = tree.calculate_directory_size(restricted)
-                    assert restricted_size == 0
-            finally:
-                # Restore permissions for cleanup
-                restricted.chmod(0o755)
-
-    @pytest.mark.asyncio
-    async def test_empty_directory_display(self) -> None:
+        try:
+            app = FileBrowserApp(str(test_dir))
+            async with app.run_test() as pilot:
+                tree = pilot.app.query_one(CustomDirectoryTree)
+
+                # Should calculate size of accessible files only
+                total_size = tree.calculate_directory_size(test_dir)
+                assert total_size == 100  # Only accessible/file.txt
+
+                # Restricted directory should return 0
+                restricted_size = tree.calculate_directory_size(restricted)
+                assert restricted_size == 0
+        finally:
+            # Restore permissions for cleanup
+            restricted.chmod(0o755)
+
+    async def test_empty_directory_display(self, tmp_path: Path) -> None:
         """Test that empty directories display '<empty>' placeholder."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir)
+        test_dir = tmp_path
 
-            # Create an empty directory
-            empty_dir = test_dir / "empty_folder"
-            empty_dir.mkdir()
+        # Create an empty directory
+        empty_dir = test_dir / "empty_folder"
+        empty_dir.mkdir()
 
-            # Create a non-empty directory for comparison
-            non_empty_dir = test_dir / "non_empty_folder"
-            non_empty_dir.mkdir()
-            (non_empty_dir / "file.txt").write_text("test content")
+        # Create a non-empty directory for comparison
+        non_empty_dir = test_dir / "non_empty_folder"
+        non_empty_dir.mkdir()
+        (non_empty_dir / "file.txt").write_text("test content")
 
-            app = FileBrowserApp(str(test_dir))
-            async with app.run_test() as pilot:
-                tree = pilot.app.query_one(CustomDirectoryTree)
+        app = FileBrowserApp(str(test_dir))
+        async with app.run_test() as pilot:
+            tree = pilot.app.query_one(CustomDirectoryTree)
 
-                # Expand the root to see the directories
-                root_node = tree.root
-                root_node.expand()
-                await pilot.pause()
+            # Expand the root to see the directories
+            root_node = tree.root
+            root_node.expand()
+            await pilot.pause()
 
-                # Find and expand the empty directory
-                empty_node = None
-                for child in root_node.children:
-                    # The label might include formatting, so check if it contains the folder name
-                    if "empty_folder" in child.label.plain:
-                        empty_node = child
-                        break
+            # Find and expand the empty directory
+            empty_node = None
+            for child in root_node.children:
+                # The label might include formatting, so check if it contains the folder name
+                if "empty_folder" in child.label.plain:
+                    empty_node = child
+                    break
 
-                assert empty_node is not None, "Empty folder node not found"
+            assert empty_node is not None, "Empty folder node not found"
 
-                # Expand the empty directory
-                empty_node.expand()
-                await pilot.pause()
+            # Expand the empty directory
+            empty_node.expand()
+            await pilot.pause()
 
-                # Check that it shows the <empty> placeholder
-                assert len(empty_node.children) == 1
-                placeholder_node = empty_node.children[0]
-                assert placeholder_node.label.plain == "<empty>"
-                assert placeholder_node.data is None
-                assert not placeholder_node.allow_expand
-
-                # Check that the non-empty directory shows actual content
-                non_empty_node = None
-                for child in root_node.children:
-                    if "non_empty_folder" in child.label.plain:
-                        non_empty_node = child
-                        break
+            # Check that it shows the <empty> placeholder
+            assert len(empty_node.children) == 1
+            placeholder_node = empty_node.children[0]
+            assert placeholder_node.label.plain == "<empty>"
+            assert placeholder_node.data is None
+            assert not placeholder_node.allow_expand
 
-                assert non_empty_node is not None, "Non-empty folder node not found"
+            # Check that the non-empty directory shows actual content
+            non_empty_node = None
+            for child in root_node.children:
+                if "non_empty_folder" in child.label.plain:
+                    non_empty_node = child
+                    break
 
-                non_empty_node.expand()
-                await pilot.pause()
+            assert non_empty_node is not None, "Non-empty folder node not found"
 
-                # Should show the file, not the placeholder
-                assert len(non_empty_node.children) == 1
-                file_node = non_empty_node.children[0]
-                assert "file.txt" in file_node.label.plain
-                assert file_node.data is not None
+            non_empty_node.expand()
+            await pilot.pause()
+
+            # Should show the file, not the placeholder
+            assert len(non_empty_node.children) == 1
+            file_node = non_empty_node.children[0]
+            assert "file.txt" in file_node.label.plain
+            assert file_node.data is not None
 
 
 class TestNavigationFeatures:
@@ -1903,219 +1855,200 @@ class TestNavigationFeatures:
     click handlers internally call the same action methods as the keyboard shortcuts.
     """
 
-    @pytest.mark.asyncio
-    async def test_parent_button_navigation(self) -> None:
+    async def test_parent_button_navigation(self, tmp_path: Path) -> None:
         """Test parent button navigates to parent directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir).resolve()
-            subdir = test_dir / "subdir1" / "subdir2"
-            subdir.mkdir(parents=True)
+        test_dir = tmp_path.resolve()
+        subdir = test_dir / "subdir1" / "subdir2"
+        subdir.mkdir(parents=True)
 
-            app = FileBrowserApp(str(subdir))
-            async with app.run_test() as pilot:
-                # Verify we start in subdir2
-                assert app.current_path == subdir
-                assert "subdir2" in str(app.current_path)
+        app = FileBrowserApp(str(subdir))
+        async with app.run_test() as pilot:
+            # Verify we start in subdir2
+            assert app.current_path == subdir
+            assert "subdir2" in str(app.current_path)
 
-                # Use keyboard shortcut instead of button click (more reliable in tests)
-                await pilot.press("u")  # Navigate to parent
-                await pilot.pause(0.5)
+            # Use keyboard shortcut instead of button click (more reliable in tests)
+            await pilot.press("u")  # Navigate to parent
+            await wait_until(pilot, lambda: app.current_path == subdir.parent and not app._is_navigating)
 
-                # Should be in subdir1 now
-                assert app.current_path == subdir.parent
-                assert "subdir1" in str(app.current_path)
+            # Should be in subdir1 now
+            assert app.current_path == subdir.parent
+            assert "subdir1" in str(app.current_path)
 
-                # Navigate again to go to root tmpdir
-                await pilot.press("u")
-                await pilot.pause(0.5)
+            # Navigate again to go to root tmp_path
+            await pilot.press("u")
+            await wait_until(pilot, lambda: app.current_path == test_dir and not app._is_navigating)
 
-                # Should be in test_dir now
-                assert app.current_path == test_dir
+            # Should be in test_dir now
+            assert app.current_path == test_dir
 
-    @pytest.mark.asyncio
-    async def test_home_button_navigation(self) -> None:
+    async def test_home_button_navigation(self, tmp_path: Path) -> None:
         """Test home button navigates to home directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir).resolve()
+        test_dir = tmp_path.resolve()
 
-            app = FileBrowserApp(str(test_dir))
-            async with app.run_test() as pilot:
-                # Start in tmpdir
-                assert app.current_path == test_dir
+        app = FileBrowserApp(str(test_dir))
+        async with app.run_test() as pilot:
+            # Start in tmp_path
+            assert app.current_path == test_dir
 
-                # Use keyboard shortcut instead of button click
-                await pilot.press("h")  # Navigate to home
-                await pilot.pause(0.5)
+            # Use keyboard shortcut instead of button click
+            await pilot.press("h")  # Navigate to home
+            await wait_until(pilot, lambda: app.current_path == Path.home() and not app._is_navigating)
 
-                # Should be in home directory
-                assert app.current_path == Path.home()
+            # Should be in home directory
+            assert app.current_path == Path.home()
 
-                # Path display should show home directory
-                path_display = pilot.app.query_one("#path-display")
-                assert str(Path.home()) in str(path_display.renderable)
+            # Path display should show home directory
+            path_display = pilot.app.query_one("#path-display")
+            assert str(Path.home()) in str(path_display.renderable)
 
-    @pytest.mark.asyncio
-    async def test_root_button_navigation(self) -> None:
+    async def test_root_button_navigation(self, tmp_path: Path) -> None:
         """Test root button navigates to system root."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir).resolve()
+        test_dir = tmp_path.resolve()
 
-            app = FileBrowserApp(str(test_dir))
-            async with app.run_test() as pilot:
-                # Use keyboard shortcut instead of button click
-                await pilot.press("r")  # Navigate to root
-                await pilot.pause(0.5)
-
-                # Should be at system root
-                if os.name == "nt":
-                    # Windows: should be at drive root
-                    assert str(app.current_path).endswith(":\\")
-                else:
-                    # Unix: should be at /
-                    assert app.current_path == Path("/")
-
-    @pytest.mark.asyncio
-    async def test_keyboard_navigation_u_key(self) -> None:
+        app = FileBrowserApp(str(test_dir))
+        async with app.run_test() as pilot:
+            # Use keyboard shortcut instead of button click
+            await pilot.press("r")  # Navigate to root
+            await wait_until(pilot, lambda: app.current_path == Path(app.current_path.anchor) and not app._is_navigating)
+
+            # Should be at system root
+            if os.name == "nt":
+                # Windows: should be at drive root
+                assert str(app.current_path).endswith(":\\")
+            else:
+                # Unix: should be at /
+                assert app.current_path == Path("/")
+
+    async def test_keyboard_navigation_u_key(self, tmp_path: Path) -> None:
         """Test 'u' key navigates to parent directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir)
-            subdir = test_dir / "level1" / "level2"
-            subdir.mkdir(parents=True)
+        test_dir = tmp_path
+        subdir = test_dir / "level1" / "level2"
+        subdir.mkdir(parents=True)
 
-            app = FileBrowserApp(str(subdir))
-            async with app.run_test() as pilot:
-                # Start in level2
-                assert "level2" in str(app.current_path)
+        app = FileBrowserApp(str(subdir))
+        async with app.run_test() as pilot:
+            # Start in level2
+            assert "level2" in str(app.current_path)
 
-                # Press 'u' to go up
-                await pilot.press("u")
-                await pilot.pause(0.5)
+            # Press 'u' to go up
+            await pilot.press("u")
+            await wait_until(pilot, lambda: app.current_path.name == "level1" and not app._is_navigating)
 
-                # Should be in level1
-                assert "level1" in str(app.current_path)
-                assert "level2" not in str(app.current_path)
+            # Should be in level1
+            assert "level1" in str(app.current_path)
+            assert "level2" not in str(app.current_path)
 
-    @pytest.mark.asyncio
-    async def test_keyboard_navigation_h_key(self) -> None:
+    async def test_keyboard_navigation_h_key(self, tmp_path: Path) -> None:
         """Test 'h' key navigates to home directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir)
+        test_dir = tmp_path
 
-            app = FileBrowserApp(str(test_dir))
-            async with app.run_test() as pilot:
-                # Press 'h' to go home
-                await pilot.press("h")
-                await pilot.pause(0.5)
+        app = FileBrowserApp(str(test_dir))
+        async with app.run_test() as pilot:
+            # Press 'h' to go home
+            await pilot.press("h")
+            await wait_until(pilot, lambda: app.current_path == Path.home() and not app._is_navigating)
 
-                # Should be in home directory
-                assert app.current_path == Path.home()
+            # Should be in home directory
+            assert app.current_path == Path.home()
 
-    @pytest.mark.asyncio
-    async def test_keyboard_navigation_r_key(self) -> None:
+    async def test_keyboard_navigation_r_key(self, tmp_path: Path) -> None:
         """Test 'r' key navigates to root directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir)
+        test_dir = tmp_path
 
-            app = FileBrowserApp(str(test_dir))
-            async with app.run_test() as pilot:
-                # Press 'r' to go to root
-                await pilot.press("r")
-                await pilot.pause(0.5)
-
-                # Should be at system root
-                if os.name == "nt":
-                    assert str(app.current_path).endswith(":\\")
-                else:
-                    assert app.current_path == Path("/")
-
-    @pytest.mark.asyncio
-    async def test_backspace_parent_navigation(self) -> None:
+        app = FileBrowserApp(str(test_dir))
+        async with app.run_test() as pilot:
+            # Press 'r' to go to root
+            await pilot.press("r")
+            await wait_until(pilot, lambda: app.current_path == Path(app.current_path.anchor) and not app._is_navigating)
+
+            # Should be at system root
+            if os.name == "nt":
+                assert str(app.current_path).endswith(":\\")
+            else:
+                assert app.current_path == Path("/")
+
+    async def test_backspace_parent_navigation(self, tmp_path: Path) -> None:
         """Test backspace key navigates to parent directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir).resolve()
-            subdir = test_dir / "child"
-            subdir.mkdir()
+        test_dir = tmp_path.resolve()
+        subdir = test_dir / "child"
+        subdir.mkdir()
 
-            app = FileBrowserApp(str(subdir))
-            async with app.run_test() as pilot:
-                # Start in child
-                assert "child" in str(app.current_path)
+        app = FileBrowserApp(str(subdir))
+        async with app.run_test() as pilot:
+            # Start in child
+            assert "child" in str(app.current_path)
 
-                # Press backspace
-                await pilot.press("backspace")
-                await pilot.pause(0.5)
+            # Press backspace
+            await pilot.press("backspace")
+            await wait_until(pilot, lambda: app.current_path == test_dir and not app._is_navigating)
 
-                # Should be in parent
-                assert app.current_path == test_dir
+            # Should be in parent
+            assert app.current_path == test_dir
 
-    @pytest.mark.asyncio
-    async def test_enter_key_directory_navigation(self) -> None:
+    async def test_enter_key_directory_navigation(self, tmp_path: Path) -> None:
         """Test Enter key navigates into directories."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir).resolve()
-            subdir = test_dir / "enter_test"
-            subdir.mkdir()
-            (test_dir / "file.txt").write_text("test")
+        test_dir = tmp_path.resolve()
+        subdir = test_dir / "enter_test"
+        subdir.mkdir()
+        (test_dir / "file.txt").write_text("test")
 
-            app = FileBrowserApp(str(test_dir))
-            async with app.run_test() as pilot:
-                tree = pilot.app.query_one(CustomDirectoryTree)
+        app = FileBrowserApp(str(test_dir))
+        async with app.run_test() as pilot:
+            tree = pilot.app.query_one(CustomDirectoryTree)
 
-                # Expand root first
-                await pilot.press("enter")
-                await pilot.pause(0.2)
+            # Expand root first
+            await pilot.press("enter")
+            await pilot.pause()
 
-                # Navigate to subdir
-                await pilot.press("down")
-                await pilot.pause(0.2)
+            # Navigate to subdir
+            await pilot.press("down")
+            await pilot.pause()
 
-                # Should highlight the directory
-                if tree.cursor_node:
-                    path = tree._get_path_from_node_data(tree.cursor_node.data)
-                    if path and path.name == "enter_test":
-                        # Press Enter to navigate into it
-                        await pilot.press("enter")
-                        await pilot.pause(0.5)
+            # Should highlight the directory
+            if tree.cursor_node:
+                path = tree._get_path_from_node_data(tree.cursor_node.data)
+                if path and path.name == "enter_test":
+                    # Press Enter to navigate into it
+                    await pilot.press("enter")
+                    await wait_until(pilot, lambda: app.current_path == subdir and not app._is_navigating)
 
-                        # Should have changed directory
-                        assert app.current_path == subdir
+                    # Should have changed directory
+                    assert app.current_path == subdir
 
-    @pytest.mark.asyncio
-    async def test_path_display_updates_on_navigation(self) -> None:
+    async def test_path_display_updates_on_navigation(self, tmp_path: Path) -> None:
         """Test path display updates correctly during navigation."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir).resolve()
-            subdir = test_dir / "display_test"
-            subdir.mkdir()
+        test_dir = tmp_path.resolve()
+        subdir = test_dir / "display_test"
+        subdir.mkdir()
 
-            app = FileBrowserApp(str(test_dir))
-            async with app.run_test() as pilot:
-                path_display = pilot.app.query_one("#path-display", Label)
+        app = FileBrowserApp(str(test_dir))
+        async with app.run_test() as pilot:
+            path_display = pilot.app.query_one("#path-display", Label)
 
-                # Initial path
-                assert str(test_dir) in str(path_display.renderable)
+            # Initial path
+            assert str(test_dir) in str(path_display.renderable)
 
-                # Navigate to subdir
-                tree = pilot.app.query_one(CustomDirectoryTree)
-                await pilot.press("enter")  # Expand
-                await pilot.pause(0.2)
-                await pilot.press("down")  # Select subdir
-                await pilot.pause(0.2)
+            # Navigate to subdir
+            tree = pilot.app.query_one(CustomDirectoryTree)
+            await pilot.press("enter")  # Expand
+            await pilot.pause()
+            await pilot.press("down")  # Select subdir
+            await pilot.pause()
 
-                # Path display should update when highlighting
-                if tree.cursor_node:
-                    path = tree._get_path_from_node_data(tree.cursor_node.data)
-                    if path:
-                        assert str(path) in str(path_display.renderable)
+            # Path display should update when highlighting
+            if tree.cursor_node:
+                path = tree._get_path_from_node_data(tree.cursor_node.data)
+                if path:
+                    assert str(path) in str(path_display.renderable)
 
-                # Navigate into subdir
-                await pilot.press("enter")
-                await pilot.pause(0.5)
+            # Navigate into subdir
+            await pilot.press("enter")
+            await wait_until(pilot, lambda: app.current_path == subdir and not app._is_navigating)
 
-                # Path should show new directory
-                assert str(subdir) in str(path_display.renderable)
+            # Path should show new directory
+            assert str(subdir) in str(path_display.renderable)
 
-    @pytest.mark.asyncio
     async def test_navigation_boundary_conditions(self) -> None:
         """Test navigation at boundaries (root, non-existent paths)."""
         app = FileBrowserApp("/")  # Start at root
@@ -2124,163 +2057,154 @@ class TestNavigationFeatures:
             # At root, parent navigation should do nothing
             initial_path = app.current_path
             await pilot.press("u")
-            await pilot.pause(0.5)
+            await wait_until(pilot, lambda: not app._is_navigating)
 
             # Should still be at root
             assert app.current_path == initial_path
 
             # Test invalid path navigation
             await app._change_directory(Path("/this/does/not/exist"))
-            await pilot.pause(0.2)
+            await wait_until(pilot, lambda: not app._is_navigating)
 
             # Should remain at current path
             assert app.current_path == initial_path
 
-    @pytest.mark.asyncio
-    async def test_navigation_preserves_sort_settings(self) -> None:
+    async def test_navigation_preserves_sort_settings(self, tmp_path: Path) -> None:
         """Test that navigation preserves sort settings."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir).resolve()
-            subdir = test_dir / "sorted_dir"
-            subdir.mkdir()
+        test_dir = tmp_path.resolve()
+        subdir = test_dir / "sorted_dir"
+        subdir.mkdir()
 
-            # Create files to sort
-            for name in ["aaa.txt", "zzz.txt", "bbb.txt"]:
-                (subdir / name).write_text("test")
+        # Create files to sort
+        for name in ["aaa.txt", "zzz.txt", "bbb.txt"]:
+            (subdir / name).write_text("test")
 
-            app = FileBrowserApp(str(test_dir))
-            async with app.run_test() as pilot:
-                # Set sort by name descending
-                await pilot.press("s")
-                await pilot.pause(0.2)
-
-                # Select descending order
-                dialog = pilot.app.screen_stack[-1]
-                if isinstance(dialog, SortDialog):
-                    order_set = dialog.query_one("#sort-order", RadioSet)
-                    radios = order_set.query(RadioButton)
-                    if len(radios) > 1:
-                        radios[1].value = True  # Descending
-
-                    # Submit dialog
-                    dialog.action_submit()
-                    await pilot.pause(0.2)
-
-                # Navigate to subdir
-                await pilot.press("enter")  # Expand
-                await pilot.pause(0.2)
-                await pilot.press("down")
-                await pilot.pause(0.2)
-                await pilot.press("enter")  # Navigate into
-                await pilot.pause(0.5)
+        app = FileBrowserApp(str(test_dir))
+        async with app.run_test() as pilot:
+            # Set sort by name descending
+            await pilot.press("s")
+            await wait_until(pilot, lambda: isinstance(pilot.app.screen, SortDialog))
 
-                # Check sort settings are preserved
-                tree = pilot.app.query_one(CustomDirectoryTree)
-                assert tree.tree_sort_mode == SortMode.NAME
-                assert tree.tree_sort_order == SortOrder.DESCENDING
+            # Select descending order
+            dialog = pilot.app.screen_stack[-1]
+            if isinstance(dialog, SortDialog):
+                radios = sort_dialog_radios(dialog).orders
+                if len(radios) > 1:
+                    radios[1].value = True  # Descending
+
+                # Submit dialog
+                dialog.action_submit()
+                await wait_until(pilot, lambda: not isinstance(pilot.app.screen, SortDialog))
+
+            # Navigate to subdir
+            await pilot.press("enter")  # Expand
+            await pilot.pause()
+            await pilot.press("down")
+            await pilot.pause()
+            await pilot.press("enter")  # Navigate into
+            await wait_until(pilot, lambda: app.current_path == subdir and not app._is_navigating)
 
-    @pytest.mark.asyncio
-    async def test_navigation_with_symlinks(self) -> None:
+            # Check sort settings are preserved
+            tree = pilot.app.query_one(CustomDirectoryTree)
+            assert tree.tree_sort_mode == SortMode.NAME
+            assert tree.tree_sort_order == SortOrder.DESCENDING
+
+    async def test_navigation_with_symlinks(self, tmp_path: Path) -> None:
         """Test navigation with symbolic links."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir).resolve()
-            real_dir = test_dir / "real_directory"
-            real_dir.mkdir()
-            (real_dir / "file.txt").write_text("content")
+        test_dir = tmp_path.resolve()
+        real_dir = test_dir / "real_directory"
+        real_dir.mkdir()
+        (real_dir / "file.txt").write_text("content")
 
-            # Create symlink to directory
-            link_dir = test_dir / "link_to_dir"
-            link_dir.symlink_to(real_dir)
+        # Create symlink to directory
+        link_dir = test_dir / "link_to_dir"
+        link_dir.symlink_to(real_dir)
 
-            app = FileBrowserApp(str(test_dir))
-            async with app.run_test() as pilot:
-                # Expand root
-                await pilot.press("enter")
-                await pilot.pause(0.2)
+        app = FileBrowserApp(str(test_dir))
+        async with app.run_test() as pilot:
+            # Expand root
+            await pilot.press("enter")
+            await pilot.pause()
 
-                # Navigate to symlink
-                tree = pilot.app.query_one(CustomDirectoryTree)
+            # Navigate to symlink
+            tree = pilot.app.query_one(CustomDirectoryTree)
 
-                # Find and navigate to symlink
-                for _ in range(3):  # Try a few times to find it
-                    await pilot.press("down")
-                    await pilot.pause(0.1)
+            # Find and navigate to symlink
+            for _ in range(3):  # Try a few times to find it
+                await pilot.press("down")
+                await pilot.pause()
 
-                    if tree.cursor_node:
-                        path = tree._get_path_from_node_data(tree.cursor_node.data)
-                        if path and path.name == "link_to_dir":
-                            # Navigate into symlink
-                            await pilot.press("enter")
-                            await pilot.pause(0.5)
+                if tree.cursor_node:
+                    path = tree._get_path_from_node_data(tree.cursor_node.data)
+                    if path and path.name == "link_to_dir":
+                        # Navigate into symlink
+                        await pilot.press("enter")
+                        await wait_until(pilot, lambda: app.current_path == link_dir and not app._is_navigating)
 
-                            # Should follow symlink
-                            assert app.current_path == link_dir
-                            break
+                        # Should follow symlink
+                        assert app.current_path == link_dir
+                        break
 
-    @pytest.mark.asyncio
-    async def test_rapid_navigation_stability(self) -> None:
+    async def test_rapid_navigation_stability(self, tmp_path: Path) -> None:
         """Test rapid navigation doesn't cause issues."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir).resolve()
-            # Create nested structure
-            deep_path = test_dir
-            for i in range(5):
-                deep_path = deep_path / f"level{i}"
-                deep_path.mkdir()
-
-            app = FileBrowserApp(str(deep_path))
-            async with app.run_test() as pilot:
-                # Rapid parent navigation
-                for _ in range(5):
-                    await pilot.press("u")
-                    await pilot.pause(0.1)
-
-                # Should be at root tmpdir
-                assert app.current_path == test_dir
-
-                # Rapid button clicks
-                parent_btn = pilot.app.query_one("#parent-button", Button)
-                home_btn = pilot.app.query_one("#home-button", Button)
-
-                # Multiple rapid clicks shouldn't crash
-                await pilot.click(home_btn)
-                await pilot.pause(0.1)
-                await pilot.click(parent_btn)
-                await pilot.pause(0.1)
-                await pilot.click(home_btn)
-                await pilot.pause(0.5)
-
-                # Should end at home
-                assert app.current_path == Path.home()
-
-    @pytest.mark.asyncio
-    async def test_navigation_focus_preservation(self) -> None:
+        test_dir = tmp_path.resolve()
+        # Create nested structure
+        deep_path = test_dir
+        for i in range(5):
+            deep_path = deep_path / f"level{i}"
+            deep_path.mkdir()
+
+        app = FileBrowserApp(str(deep_path))
+        async with app.run_test() as pilot:
+            # Rapid parent navigation
+            for _ in range(5):
+                await pilot.press("u")
+                await wait_until(pilot, lambda: not app._is_navigating)
+
+            # Should be at root tmp_path
+            assert app.current_path == test_dir
+
+            # Rapid button clicks
+            parent_btn = pilot.app.query_one("#parent-button", Button)
+            home_btn = pilot.app.query_one("#home-button", Button)
+
+            # Multiple rapid clicks shouldn't crash
+            await pilot.click(home_btn)
+            await wait_until(pilot, lambda: not app._is_navigating)
+            await pilot.click(parent_btn)
+            await wait_until(pilot, lambda: not app._is_navigating)
+            await pilot.click(home_btn)
+            await wait_until(pilot, lambda: app.current_path == Path.home() and not app._is_navigating)
+
+            # Should end at home
+            assert app.current_path == Path.home()
+
+    async def test_navigation_focus_preservation(self, tmp_path: Path) -> None:
         """Test that tree keeps focus after navigation."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir).resolve()
-            subdir = test_dir / "focus_test"
-            subdir.mkdir()
+        test_dir = tmp_path.resolve()
+        subdir = test_dir / "focus_test"
+        subdir.mkdir()
 
-            app = FileBrowserApp(str(test_dir))
-            async with app.run_test() as pilot:
-                tree = pilot.app.query_one(CustomDirectoryTree)
+        app = FileBrowserApp(str(test_dir))
+        async with app.run_test() as pilot:
+            tree = pilot.app.query_one(CustomDirectoryTree)
 
-                # Tree should have focus initially
-                assert tree.has_focus
+            # Tree should have focus initially
+            assert tree.has_focus
 
-                # Navigate with button
-                home_btn = pilot.app.query_one("#home-button", Button)
-                await pilot.click(home_btn)
-                await pilot.pause(0.5)
+            # Navigate with button
+            home_btn = pilot.app.query_one("#home-button", Button)
+            await pilot.click(home_btn)
+            await wait_until(pilot, lambda: app.current_path == Path.home() and not app._is_navigating)
 
-                # New tree should have focus
-                new_tree = pilot.app.query_one(CustomDirectoryTree)
-                assert new_tree.has_focus
+            # New tree should have focus
+            new_tree = pilot.app.query_one(CustomDirectoryTree)
+            assert new_tree.has_focus
 
-                # Navigate with keyboard
-                await pilot.press("u")
-                await pilot.pause(0.5)
+            # Navigate with keyboard
+            await pilot.press("u")
+            await wait_until(pilot, lambda: app.current_path == Path.home().parent and not app._is_navigating)
 
-                # Tree should still have focus
-                final_tree = pilot.app.query_one(CustomDirectoryTree)
-                assert final_tree.has_focus
+            # Tree should still have focus
+            final_tree = pilot.app.query_one(CustomDirectoryTree)
+            assert final_tree.has_focus
@@ -8,6 +8,7 @@
 # - Added tests for keyboard navigation
 # - Added tests for sorting functionality
 # - Added tests for file operations
+# - Replaced the in-test tempfile.TemporaryDirectory blocks with the tmp_path fixture
 #
 
 """
@@ -64,83 +65,83 @@ class TestFileBrowserAppUnit:
             assert pilot.app.query_one("#path-display")
 
     @pytest.mark.asyncio  # type: ignore[misc]
-    async def test_directory_loading(self) -> None:
+    async def test_directory_loading(self, tmp_path: Path) -> None:
         """Test directory loading functionality."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create test files
-            Path(tmpdir, "file1.txt").touch()
-            Path(tmpdir, "file2.txt").touch()
-            subdir = Path(tmpdir, "subdir")
-            subdir.mkdir()
+        tmpdir = str(tmp_path)
+        # Create test files
+        Path(tmpdir, "file1.txt").touch()
+        Path(tmpdir, "file2.txt").touch()
+        subdir = Path(tmpdir, "subdir")
+        subdir.mkdir()
 
-            app = FileBrowserApp(start_path=tmpdir)
+        app = FileBrowserApp(start_path=tmpdir)
 
-            async with app.run_test() as pilot:
-                tree = pilot.app.query_one("#file-tree", Tree)
+        async with app.run_test() as pilot:
+            tree = pilot.app.query_one("#file-tree", Tree)
 
-                # Wait for directory to load
-                await pilot.pause(0.5)
+            # Wait for directory to load
+            await pilot.pause(0.5)
 
-                # Check that files are loaded
-                root = tree.root
-                children = list(root.children)
-                assert len(children) >= 3  # At least our 3 items
+            # Check that files are loaded
+            root = tree.root
+            children = list(root.children)
+            assert len(children) >= 3  # At least our 3 items
 
     @pytest.mark.asyncio  # type: ignore[misc]
-    async def test_file_selection(self) -> None:
+    async def test_file_selection(self, tmp_path: Path) -> None:
         """Test file selection functionality."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_file = Path(tmpdir, "test.txt")
-            test_file.write_text("test content")
+        tmpdir = str(tmp_path)
+        test_file = Path(tmpdir, "test.txt")
+        test_file.write_text("test content")
 
-            app = FileBrowserApp(start_path=tmpdir, select_files=True)
+        app = FileBrowserApp(start_path=tmpdir, select_files=True)
 
-            async with app.run_test() as pilot:
-                tree = pilot.app.query_one("#file-tree", Tree)
+        async with app.run_test() as pilot:
+            tree = pilot.app.query_one("#file-tree", Tree)
 
-                # Wait for directory to load
-                await pilot.pause(0.5)
+            # Wait for directory to load
+            await pilot.pause(0.5)
 
-                # Find and select the test file
-                for node in tree.root.children:
-                    if "test.txt" in str(node.label):
-                        tree.select_node(node)
-                        break
+            # Find and select the test file
+            for node in tree.root.children:
+                if "test.txt" in str(node.label):
+                    tree.select_node(node)
+                    break
 
-                # Click select button
-                await pilot.click("#select-button")
+            # Click select button
+            await pilot.click("#select-button")
 
-                # Check that file was selected
-                assert app.selected_file is not None
-                assert "test.txt" in app.selected_file.name
+            # Check that file was selected
+            assert app.selected_file is not None
+            assert "test.txt" in app.selected_file.name
 
     @pytest.mark.asyncio  # type: ignore[misc]
-    async def test_directory_selection(self) -> None:
+    async def test_directory_selection(self, tmp_path: Path) -> None:
         """Test directory selection functionality."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            subdir = Path(tmpdir, "testdir")
-            subdir.mkdir()
+        tmpdir = str(tmp_path)
+        subdir = Path(tmpdir, "testdir")
+        subdir.mkdir()
 
-            app = FileBrowserApp(start_path=tmpdir, select_dirs=True)
+        app = FileBrowserApp(start_path=tmpdir, select_dirs=True)
 
-            async with app.run_test() as pilot:
-                tree = pilot.app.query_one("#file-tree", Tree)
+        async with app.run_test() as pilot:
+            tree = pilot.app.query_one("#file-tree", Tree)
 
-                # Wait for directory to load
-                await pilot.pause(0.5)
+            # Wait for directory to load
+            await pilot.pause(0.5)
 
-                # Find and select the directory
-                for node in tree.root.children:
-                    if "testdir" in str(node.label):
-                        tree.select_node(node)
-                        break
+            # Find and select the directory
+            for node in tree.root.children:
+                if "testdir" in str(node.label):
+                    tree.select_node(node)
+                    break
 
-                # Click select button
-                await pilot.click("#select-button")
+            # Click select button
+            await pilot.click("#select-button")
 
-                # Check that directory was selected
-                assert app.selected_file is not None
-                assert app.selected_file.is_dir is True
+            # Check that directory was selected
+            assert app.selected_file is not None
+            assert app.selected_file.is_dir is True
 
     @pytest.mark.asyncio  # type: ignore[misc]
     async def test_cancel_button(self) -> None:
@@ -155,66 +156,66 @@ class TestFileBrowserAppUnit:
             assert app.selected_file is None
 
     @pytest.mark.asyncio  # type: ignore[misc]
-    async def test_keyboard_navigation(self) -> None:
+    async def test_keyboard_navigation(self, tmp_path: Path) -> None:
         """Test keyboard navigation."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create nested structure
-            Path(tmpdir, "file1.txt").touch()
-            subdir = Path(tmpdir, "subdir")
-            subdir.mkdir()
-            Path(subdir, "file2.txt").touch()
+        tmpdir = str(tmp_path)
+        # Create nested structure
+        Path(tmpdir, "file1.txt").touch()
+        subdir = Path(tmpdir, "subdir")
+        subdir.mkdir()
+        Path(subdir, "file2.txt").touch()
 
-            app = FileBrowserApp(start_path=tmpdir)
+        app = FileBrowserApp(start_path=tmpdir)
 
-            async with app.run_test() as pilot:
-                # Wait for directory to load
-                await pilot.pause(0.5)
+        async with app.run_test() as pilot:
+            # Wait for directory to load
+            await pilot.pause(0.5)
 
-                # Navigate with keyboard
-                await pilot.press("down")  # Move to first item
-                await pilot.press("enter")  # Expand/select
-                await pilot.press("down")  # Move to next item
+            # Navigate with keyboard
+            await pilot.press("down")  # Move to first item
+            await pilot.press("enter")  # Expand/select
+            await pilot.press("down")  # Move to next item
 
-                tree = pilot.app.query_one("#file-tree", Tree)
-                assert tree.cursor_node is not None
+            tree = pilot.app.query_one("#file-tree", Tree)
+            assert tree.cursor_node is not None
 
     @pytest.mark.asyncio  # type: ignore[misc]
-    async def test_back_forward_navigation(self) -> None:
+    async def test_back_forward_navigation(self, tmp_path: Path) -> None:
         """Test back/forward button navigation."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            subdir1 = Path(tmpdir, "dir1")
-            subdir1.mkdir()
-            subdir2 = Path(subdir1, "dir2")
-            subdir2.mkdir()
+        tmpdir = str(tmp_path)
+        subdir1 = Path(tmpdir, "dir1")
+        subdir1.mkdir()
+        subdir2 = Path(subdir1, "dir2")
+        subdir2.mkdir()
 
-            app = FileBrowserApp(start_path=tmpdir)
+        app = FileBrowserApp(start_path=tmpdir)
 
-            async with app.run_test() as pilot:
-                # Wait for directory to load
-                await pilot.pause(0.5)
+        async with app.run_test() as pilot:
+            # Wait for directory to load
+            await pilot.pause(0.5)
 
-                # Navigate into subdirectory
-                tree = pilot.app.query_one("#file-tree", Tree)
-                for node in tree.root.children:
-                    if "dir1" in str(node.label):
-                        await pilot.click(f"#{node.id}")
-                        await pilot.press("enter")
-                        break
+            # Navigate into subdirectory
+            tree = pilot.app.query_one("#file-tree", Tree)
+            for node in tree.root.children:
+                if "dir1" in str(node.label):
+                    await pilot.click(f"#{node.id}")
+                    await pilot.press("enter")
+                    break
 
-                await pilot.pause(0.5)
+            await pilot.pause(0.5)
 
-                # Test back button
-                await pilot.click("#back-button")
-                await pilot.pause(0.5)
+            # Test back button
+            await pilot.click("#back-button")
+            await pilot.pause(0.5)
 
-                path_display = pilot.app.query_one("#path-display", Input)
-                assert tmpdir in path_display.value
+            path_display = pilot.app.query_one("#path-display", Input)
+            assert tmpdir in path_display.value
 
-                # Test forward button
-                await pilot.click("#forward-button")
-                await pilot.pause(0.5)
+            # Test forward button
+            await pilot.click("#forward-button")
+            await pilot.pause(0.5)
 
-                assert "dir1" in path_display.value
+            assert "dir1" in path_display.value
 
     @pytest.mark.asyncio  # type: ignore[misc]
     async def test_sort_dialog(self) -> None:
@@ -239,115 +240,115 @@ class TestFileBrowserAppUnit:
             assert not pilot.app.query("#sort-dialog")
 
     @pytest.mark.asyncio  # type: ignore[misc]
-    async def test_permission_error_handling(self) -> None:
+    async def test_permission_error_handling(self, tmp_path: Path) -> None:
         """Test handling of permission errors."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            restricted_dir = Path(tmpdir, "restricted")
-            restricted_dir.mkdir()
+        tmpdir = str(tmp_path)
+        restricted_dir = Path(tmpdir, "restricted")
+        restricted_dir.mkdir()
 
-            # Make directory non-readable
-            os.chmod(restricted_dir, 0o000)
+        # Make directory non-readable
+        os.chmod(restricted_dir, 0o000)
 
-            try:
-                app = FileBrowserApp(start_path=tmpdir)
+        try:
+            app = FileBrowserApp(start_path=tmpdir)
 
-                async with app.run_test() as pilot:
-                    # Wait for directory to load
-                    await pilot.pause(0.5)
+            async with app.run_test() as pilot:
+                # Wait for directory to load
+                await pilot.pause(0.5)
 
-                    # Try to navigate into restricted directory
-                    tree = pilot.app.query_one("#file-tree", Tree)
-                    for node in tree.root.children:
-                        if "restricted" in str(node.label):
-                            await pilot.click(f"#{node.id}")
-                            await pilot.press("enter")
-                            break
+                # Try to navigate into restricted directory
+                tree = pilot.app.query_one("#file-tree", Tree)
+                for node in tree.root.children:
+                    if "restricted" in str(node.label):
+                        await pilot.click(f"#{node.id}")
+                        await pilot.press("enter")
+                        break
 
-                    await pilot.pause(0.5)
+                await pilot.pause(0.5)
 
-                    # Should handle error gracefully
-                    assert pilot.app.current_directory == tmpdir
-            finally:
-                # Restore permissions for cleanup
-                os.chmod(restricted_dir, 0o755)
+                # Should handle error gracefully
+                assert pilot.app.current_directory == tmpdir
+        finally:
+            # Restore permissions for cleanup
+            os.chmod(restricted_dir, 0o755)
 
     @pytest.mark.asyncio  # type: ignore[misc]
-    async def test_empty_directory(self) -> None:
+    async def test_empty_directory(self, tmp_path: Path) -> None:
         """Test handling of empty directories."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            app = FileBrowserApp(start_path=tmpdir)
+        tmpdir = str(tmp_path)
+        app = FileBrowserApp(start_path=tmpdir)
 
-            async with app.run_test() as pilot:
-                # Wait for directory to load
-                await pilot.pause(0.5)
+        async with app.run_test() as pilot:
+            # Wait for directory to load
+            await pilot.pause(0.5)
 
-                tree = pilot.app.query_one("#file-tree", Tree)
+            tree = pilot.app.query_one("#file-tree", Tree)
 
-                # Should show empty directory message
-                root = tree.root
-                children = list(root.children)
+            # Should show empty directory message
+            root = tree.root
+            children = list(root.children)
 
-                # Check for empty folder placeholder
-                if children:
-                    assert any("(empty folder)" in str(node.label) for node in children)
+            # Check for empty folder placeholder
+            if children:
+                assert any("(empty folder)" in str(node.label) for node in children)
 
     @pytest.mark.asyncio  # type: ignore[misc]
-    async def test_hidden_files_toggle(self) -> None:
+    async def test_hidden_files_toggle(self, tmp_path: Path) -> None:
         """Test hidden files visibility toggle."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create hidden and regular files
-            Path(tmpdir, ".hidden").touch()
-            Path(tmpdir, "visible.txt").touch()
+        tmpdir = str(tmp_path)
+        # Create hidden and regular files
+        Path(tmpdir, ".hidden").touch()
+        Path(tmpdir, "visible.txt").touch()
 
-            app = FileBrowserApp(start_path=tmpdir)
+        app = FileBrowserApp(start_path=tmpdir)
 
-            async with app.run_test() as pilot:
-                # Wait for directory to load
-                await pilot.pause(0.5)
+        async with app.run_test() as pilot:
+            # Wait for directory to load
+            await pilot.pause(0.5)
 
-                tree = pilot.app.query_one("#file-tree", Tree)
+            tree = pilot.app.query_one("#file-tree", Tree)
 
-                # Count visible files
-                initial_count = len(list(tree.root.children))
+            # Count visible files
+            initial_count = len(list(tree.root.children))
 
-                # Toggle hidden files (if implemented)
-                # This would need the actual key binding
-                # await pilot.press("h")
-                # await pilot.pause(0.5)
+            # Toggle hidden files (if implemented)
+            # This would need the actual key binding
+            # await pilot.press("h")
+            # await pilot.pause(0.5)
 
-                # For now just check that files are loaded
-                assert initial_count >= 1
+            # For now just check that files are loaded
+            assert initial_count >= 1
 
     @pytest.mark.asyncio  # type: ignore[misc]
-    async def test_file_info_generation(self) -> None:
+    async def test_file_info_generation(self, tmp_path: Path) -> None:
         """Test FileInfo generation for different file types."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create various file types
-            regular_file = Path(tmpdir, "regular.txt")
-            regular_file.write_text("content")
+        tmpdir = str(tmp_path)
+        # Create various file types
+        regular_file = Path(tmpdir, "regular.txt")
+        regular_file.write_text("content")
 
-            directory = Path(tmpdir, "directory")
-            directory.mkdir()
+        directory = Path(tmpdir, "directory")
+        directory.mkdir()
 
-            # Create symlink
-            link_target = Path(tmpdir, "target.txt")
-            link_target.write_text("target")
-            symlink = Path(tmpdir, "link.txt")
-            symlink.symlink_to(link_target)
+        # Create symlink
+        link_target = Path(tmpdir, "target.txt")
+        link_target.write_text("target")
+        symlink = Path(tmpdir, "link.txt")
+        symlink.symlink_to(link_target)
 
-            app = FileBrowserApp(start_path=tmpdir)
+        app = FileBrowserApp(start_path=tmpdir)
 
-            # Test file info generation would need access to internal methods
-            # For now, just verify the app can handle these file types
-            async with app.run_test() as pilot:
-                await pilot.pause(0.5)
-                tree = pilot.app.query_one("#file-tree", Tree)
+        # Test file info generation would need access to internal methods
+        # For now, just verify the app can handle these file types
+        async with app.run_test() as pilot:
+            await pilot.pause(0.5)
+            tree = pilot.app.query_one("#file-tree", Tree)
 
-                # Check that all file types are present
-                labels = [str(node.label) for node in tree.root.children]
-                assert any("regular.txt" in label for label in labels)
-                assert any("directory" in label for label in labels)
-                assert any("link.txt" in label for label in labels)
+            # Check that all file types are present
+            labels = [str(node.label) for node in tree.root.children]
+            assert any("regular.txt" in label for label in labels)
+            assert any("directory" in label for label in labels)
+            assert any("link.txt" in label for label in labels)
 
     @pytest.mark.asyncio  # type: ignore[misc]
     async def test_path_validation(self) -> None:
@@ -362,33 +363,33 @@ class TestFileBrowserAppUnit:
                 app = FileBrowserApp(start_path=tmpfile.name)
 
     @pytest.mark.asyncio  # type: ignore[misc]
-    async def test_sorting_functionality(self) -> None:
+    async def test_sorting_functionality(self, tmp_path: Path) -> None:
         """Test different sorting options."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create files with different attributes
-            Path(tmpdir, "a_file.txt").touch()
-            Path(tmpdir, "z_file.txt").touch()
-            Path(tmpdir, "b_file.txt").touch()
+        tmpdir = str(tmp_path)
+        # Create files with different attributes
+        Path(tmpdir, "a_file.txt").touch()
+        Path(tmpdir, "z_file.txt").touch()
+        Path(tmpdir, "b_file.txt").touch()
 
-            app = FileBrowserApp(start_path=tmpdir)
+        app = FileBrowserApp(start_path=tmpdir)
 
-            async with app.run_test() as pilot:
-                # Wait for directory to load
-                await pilot.pause(0.5)
+        async with app.run_test() as pilot:
+            # Wait for directory to load
+            await pilot.pause(0.5)
 
-                # Test sorting by name - would need to open sort dialog
-                # For now just verify files are loaded
-                await pilot.pause(0.5)
+            # Test sorting by name - would need to open sort dialog
+            # For now just verify files are loaded
+            await pilot.pause(0.5)
 
-                tree = pilot.app.query_one("#file-tree", Tree)
-                children = list(tree.root.children)
+            tree = pilot.app.query_one("#file-tree", Tree)
+            children = list(tree.root.children)
 
-                # Files should be sorted alphabetically
-                if len(children) >= 3:
-                    labels = [str(node.label) for node in children]
-                    sorted_labels = sorted(labels)
-                    # Check general ordering (may have additional system files)
-                    assert labels.index("a_file.txt") < labels.index("z_file.txt")
+            # Files should be sorted alphabetically
+            if len(children) >= 3:
+                labels = [str(node.label) for node in children]
+                sorted_labels = sorted(labels)
+                # Check general ordering (may have additional system files)
+                assert labels.index("a_file.txt") < labels.index("z_file.txt")
 
     @pytest.mark.asyncio  # type: ignore[misc]
     async def test_escape_key_cancellation(self) -> None:
@@ -403,23 +404,23 @@ class TestFileBrowserAppUnit:
             assert app.selected_file is None
 
     @pytest.mark.asyncio  # type: ignore[misc]
-    async def test_f5_refresh(self) -> None:
+    async def test_f5_refresh(self, tmp_path: Path) -> None:
         """Test F5 key refreshes directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            app = FileBrowserApp(start_path=tmpdir)
+        tmpdir = str(tmp_path)
+        app = FileBrowserApp(start_path=tmpdir)
 
-            async with app.run_test() as pilot:
-                # Wait for initial load
-                await pilot.pause(0.5)
+        async with app.run_test() as pilot:
+            # Wait for initial load
+            await pilot.pause(0.5)
 
-                # Create a new file
-                Path(tmpdir, "new_file.txt").touch()
+            # Create a new file
+            Path(tmpdir, "new_file.txt").touch()
 
-                # Press F5 to refresh
-                await pilot.press("f5")
-                await pilot.pause(0.5)
+            # Press F5 to refresh
+            await pilot.press("f5")
+            await pilot.pause(0.5)
 
-                # Check that new file appears
-                tree = pilot.app.query_one("#file-tree", Tree)
-                labels = [str(node.label) for node in tree.root.children]
-                assert any("new_file.txt" in label for label in labels)
+            # Check that new file appears
+            tree = pilot.app.query_one("#file-tree", Tree)
+            labels = [str(node.label) for node in tree.root.children]
+            assert any("new_file.txt" in label for label in labels)
@@ -10,7 +10,6 @@
 # mypy: disable-error-code="method-assign"
 
 import os
-import sys
 import tempfile
 import pytest
 from pathlib import Path
@@ -18,9 +17,6 @@ from unittest.mock import Mock, patch, MagicMock
 from collections import OrderedDict
 from typing import Any, Iterator
 
-# Add src to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
-
 from selectfilecli.file_info import FileInfo
 from selectfilecli.FileList import FileList
 from selectfilecli.file_browser_app import CustomDirectoryTree
@@ -287,7 +283,7 @@ class TestFileListPathHandling:
         file_list2 = FileList("../")
         assert os.path.isabs(file_list2.path)
 
-    def test_recursive_search_uses_absolute_paths(self, tmp_path: Path) -> None:
+    def test_recursive_search_uses_absolute_paths(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that recursive search works correctly with absolute paths."""
         # Create nested structure
         (tmp_path / "dir1").mkdir()
@@ -296,18 +292,13 @@ class TestFileListPathHandling:
         (tmp_path / "dir1" / "dir2" / "file2.txt").write_text("test")
 
         # Search with relative path
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(tmp_path)
-            file_list = FileList(".")
-            file_list.search_dir(max_depth=2)
-
-            # All paths in tree should be absolute
-            for path in file_list.tree.keys():
-                assert os.path.isabs(path)
+        monkeypatch.chdir(tmp_path)
+        file_list = FileList(".")
+        file_list.search_dir(max_depth=2)
 
-        finally:
-            os.chdir(original_cwd)
+        # All paths in tree should be absolute
+        for path in file_list.tree.keys():
+            assert os.path.isabs(path)
 
 
 class TestSignalHandlerContextManager: